@@ -0,0 +1,98 @@
+"""
+Compare the per-test cost of the failure capture modes: off, video and trace.
+
+Each simulated test opens a fresh context, runs a short Herokuapp flow against the
+bundled stand-in server and closes the context, so video encoding is fully paid for.
+CPU time and bytes written are measured for the Playwright driver and the browser it
+launched (Linux only), and the report shows what trace mode saves over video.
+
+Usage:
+    python -m benchmarks.bench_capture [--tests 20] [--fail-every 0] [--window 50] [--browser chromium]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+from typing import Dict, List
+from playwright.sync_api import Browser, sync_playwright
+from pages.herokuapp_page import HerokuappPage
+from tests.utils.failure_capture import CAPTURE_MODES, CaptureMeter, FailureCapture
+from tests.utils.herokuapp_server import HerokuappServer
+
+LOADING_DELAY_MS = 50
+
+
+def run_test(browser: Browser, base_url: str, mode: str, output_dir: str, window: int, failed: bool) -> None:
+    """One simulated test: a fresh context, a short flow and the mode's capture work."""
+    context = browser.new_context(record_video_dir=output_dir if mode == "video" else None)
+    capture = FailureCapture(context, output_dir, window) if mode == "trace" else None
+    if capture:
+        capture.start("bench")
+    herokuapp = HerokuappPage(context.new_page(), base_url)
+    herokuapp.navigate_to_home()
+    herokuapp.toggle_checkbox(0)
+    herokuapp.wait_for_dynamic_text()
+    if capture:
+        capture.finish(failed, "bench")
+    context.close()
+
+
+def measure(browser: Browser, driver_pid: int, base_url: str, mode: str, tests: int, fail_every: int,
+            window: int) -> Dict:
+    cpu: List[float] = []
+    disk: List[int] = []
+    wall: List[float] = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for index in range(tests):
+            meter = CaptureMeter(driver_pid)
+            meter.start()
+            failed = bool(fail_every) and (index + 1) % fail_every == 0
+            run_test(browser, base_url, mode, output_dir, window, failed)
+            cpu_seconds, disk_bytes, wall_seconds = meter.stop()
+            cpu.append(cpu_seconds)
+            disk.append(disk_bytes)
+            wall.append(wall_seconds)
+    return {
+        "cpu_seconds": statistics.mean(cpu),
+        "disk_bytes": statistics.mean(disk),
+        "wall_seconds": statistics.mean(wall),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=20, help="Simulated tests per mode")
+    parser.add_argument("--fail-every", type=int, default=0, help="Mark every Nth test as failed (0 = all pass)")
+    parser.add_argument("--window", type=int, default=50, help="Console events kept in trace mode")
+    parser.add_argument("--browser", default="chromium")
+    args = parser.parse_args(argv)
+
+    server = HerokuappServer(loading_delay_ms=LOADING_DELAY_MS).start()
+    results: Dict[str, Dict] = {}
+    try:
+        with sync_playwright() as playwright:
+            driver_pid = playwright._impl_obj._connection._transport._proc.pid
+            browser = getattr(playwright, args.browser).launch()
+            try:
+                run_test(browser, server.url, "off", tempfile.gettempdir(), args.window, False)  # warm up
+                for mode in CAPTURE_MODES:
+                    results[mode] = measure(
+                        browser, driver_pid, server.url, mode, args.tests, args.fail_every, args.window
+                    )
+            finally:
+                browser.close()
+    finally:
+        server.stop()
+
+    print(f"{'mode':8} {'cpu/test':>10} {'disk/test':>12} {'wall/test':>10}")
+    for mode, result in results.items():
+        print(f"{mode:8} {result['cpu_seconds']:9.3f}s {result['disk_bytes'] / 1024:9.0f} KiB "
+              f"{result['wall_seconds']:9.3f}s")
+    video, trace = results["video"], results["trace"]
+    print(f"trace saves {video['cpu_seconds'] - trace['cpu_seconds']:.3f}s CPU and "
+          f"{(video['disk_bytes'] - trace['disk_bytes']) / 1024:.0f} KiB written per test compared with video")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
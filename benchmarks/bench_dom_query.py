@@ -0,0 +1,79 @@
+"""
+Compare per-element reads with BasePage.query_elements.
+
+Usage:
+    python -m benchmarks.bench_dom_query [--iterations 200]
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+from playwright.sync_api import sync_playwright
+from pages.example_page import ExamplePage
+from benchmarks.harness import RoundTripCounter
+
+EXAMPLE_HTML = """<!doctype html>
+<html><head><title>Example Domain</title></head>
+<body><div>
+  <h1>Example Domain</h1>
+  <p>This domain is for use in illustrative examples in documents.</p>
+  <p><a href="https://www.iana.org/domains/example">More information...</a></p>
+</div></body></html>"""
+
+
+def legacy_read(example_page: ExamplePage) -> Dict:
+    """Read the main elements one call at a time, as the page objects used to."""
+    return {
+        'heading_visible': example_page.is_element_visible(example_page.HEADING),
+        'paragraph_visible': example_page.is_element_visible(example_page.PARAGRAPH),
+        'link_visible': example_page.is_element_visible(example_page.MORE_INFO_LINK),
+        'heading': example_page.get_text(example_page.HEADING),
+        'paragraph': example_page.get_text(example_page.PARAGRAPH),
+        'link': example_page.get_text(example_page.MORE_INFO_LINK),
+    }
+
+
+def batched_read(example_page: ExamplePage) -> Dict:
+    """Read the same state with a single query_elements call."""
+    return example_page.query_elements(
+        {'heading': example_page.HEADING, 'paragraph': example_page.PARAGRAPH, 'link': example_page.MORE_INFO_LINK},
+        wait=True,
+    )
+
+
+def measure(example_page: ExamplePage, counter: RoundTripCounter, read: Callable, iterations: int) -> Dict:
+    samples: List[float] = []
+    counter.count = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        read(example_page)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "round_trips": counter.count / iterations,
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.mean(samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.set_content(EXAMPLE_HTML)
+        example_page = ExamplePage(page)
+        counter = RoundTripCounter(page)
+
+        for name, read in (("per-element", legacy_read), ("query_elements", batched_read)):
+            read(example_page)  # warmup
+            result = measure(example_page, counter, read, args.iterations)
+            print(f"{name:>15}: {result['round_trips']:.1f} round trips, "
+                  f"median {result['median_ms']:.2f}ms, mean {result['mean_ms']:.2f}ms")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
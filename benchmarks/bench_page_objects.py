@@ -0,0 +1,151 @@
+"""
+Time every ExamplePage and HerokuappPage operation against locally served pages.
+
+Herokuapp operations run against the bundled stand-in server; example.com is fulfilled
+from memory, so no benchmark touches the network. Each benchmark is warmed up, then
+sampled, and the results can be saved as a baseline and compared with a later run.
+
+Usage:
+    python -m benchmarks.bench_page_objects [--iterations 20] [--warmup 3] [--filter table]
+    python -m benchmarks.bench_page_objects --save baseline.json
+    python -m benchmarks.bench_page_objects --compare baseline.json [--alpha 0.01] [--min-slowdown 0.05]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from importlib.metadata import version
+from typing import List
+from playwright.sync_api import Page, Route, sync_playwright
+from pages.example_page import ExamplePage
+from pages.herokuapp_page import HerokuappPage
+from benchmarks.bench_dom_query import EXAMPLE_HTML
+from benchmarks.harness import Benchmark, RoundTripCounter, compare, sample, write_baseline
+from tests.utils.herokuapp_server import VALID_PASSWORD, VALID_USERNAME, HerokuappServer
+
+# Keep Dynamic Loading short so its benchmark measures the page object, not the server delay
+LOADING_DELAY_MS = 50
+
+
+def fulfill_example(route: Route) -> None:
+    """Serve example.com from memory and stub every other external page."""
+    if "example.com" in route.request.url:
+        route.fulfill(content_type="text/html", body=EXAMPLE_HTML)
+    else:
+        route.fulfill(content_type="text/html", body="<!doctype html><title>IANA</title><h1>IANA</h1>")
+
+
+def example_benchmarks(page: Page) -> List[Benchmark]:
+    example = ExamplePage(page)
+    home = example.navigate_to_home
+    return [
+        Benchmark("example.navigate_to_home", home),
+        Benchmark("example.get_main_heading", example.get_main_heading, setup=home),
+        Benchmark("example.get_main_paragraph", example.get_main_paragraph, setup=home),
+        Benchmark("example.get_main_elements", example.get_main_elements, setup=home),
+        Benchmark("example.verify_page_loaded", example.verify_page_loaded, setup=home),
+        Benchmark("example.verify_responsive_elements", example.verify_responsive_elements, setup=home),
+        Benchmark("example.click_more_info", example.click_more_info, setup=home),
+    ]
+
+
+def herokuapp_benchmarks(page: Page, base_url: str, upload_path: str) -> List[Benchmark]:
+    herokuapp = HerokuappPage(page, base_url)
+    home = herokuapp.navigate_to_home
+
+    def login() -> None:
+        herokuapp.login(VALID_USERNAME, VALID_PASSWORD)
+
+    def open_example(name: str):
+        return lambda: herokuapp.navigate_to_example(name)
+
+    return [
+        Benchmark("herokuapp.navigate_to_home", home),
+        Benchmark("herokuapp.get_available_examples", herokuapp.get_available_examples, setup=home),
+        Benchmark("herokuapp.resolve_example", lambda: herokuapp.resolve_example("tables")),
+        Benchmark("herokuapp.navigate_to_example", open_example("Sortable Data Tables"), setup=home),
+        Benchmark("herokuapp.verify_page_loaded", herokuapp.verify_page_loaded, setup=home),
+        Benchmark("herokuapp.login", login, setup=home),
+        Benchmark("herokuapp.get_flash_message", herokuapp.get_flash_message, setup=login),
+        Benchmark("herokuapp.verify_secure_page", herokuapp.verify_secure_page, setup=login),
+        Benchmark("herokuapp.open_secure_area", herokuapp.open_secure_area, setup=login),
+        Benchmark("herokuapp.wait_for_dynamic_text", herokuapp.wait_for_dynamic_text, setup=home),
+        Benchmark("herokuapp.toggle_checkbox", lambda: herokuapp.toggle_checkbox(0), setup=home),
+        Benchmark("herokuapp.is_checkbox_checked", lambda: herokuapp.is_checkbox_checked(1), setup=open_example("Checkboxes")),
+        Benchmark("herokuapp.perform_drag_and_drop", herokuapp.perform_drag_and_drop, setup=home),
+        Benchmark("herokuapp.upload_file", lambda: herokuapp.upload_file(upload_path), setup=home),
+        Benchmark("herokuapp.switch_to_frame_and_type", lambda: herokuapp.switch_to_frame_and_type("benchmark"), setup=home),
+        Benchmark("herokuapp.handle_javascript_alert[alert]", lambda: herokuapp.handle_javascript_alert("alert"), setup=home),
+        Benchmark("herokuapp.handle_javascript_alert[confirm]", lambda: herokuapp.handle_javascript_alert("confirm"), setup=home),
+        Benchmark("herokuapp.handle_javascript_alert[prompt]", lambda: herokuapp.handle_javascript_alert("prompt", "benchmark"), setup=home),
+        Benchmark("herokuapp.press_key", lambda: herokuapp.press_key("Enter"), setup=home),
+        Benchmark("herokuapp.set_slider_value", lambda: herokuapp.set_slider_value(2.5), setup=home),
+        Benchmark("herokuapp.get_slider_value", herokuapp.get_slider_value, setup=open_example("Horizontal Slider")),
+        Benchmark("herokuapp.get_table_data", herokuapp.get_table_data, setup=home),
+        Benchmark("herokuapp.get_table_columns", herokuapp.get_table_columns, setup=home),
+        Benchmark("herokuapp.sort_table_by_column", lambda: herokuapp.sort_table_by_column("Last Name"), setup=home),
+        Benchmark("herokuapp.check_status_code", lambda: herokuapp.check_status_code(404), setup=home),
+        Benchmark("herokuapp.check_status_codes", lambda: herokuapp.check_status_codes([200, 301, 404, 500]), setup=home),
+        Benchmark("herokuapp.verify_status_code_message", lambda: herokuapp.verify_status_code_message(500), setup=home),
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20, help="Timed samples per benchmark")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed rounds before sampling")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--save", metavar="PATH", help="Write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare with a JSON baseline and flag slowdowns")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the Welch t-test")
+    parser.add_argument("--min-slowdown", type=float, default=0.05, help="Smallest relative slowdown to flag")
+    args = parser.parse_args()
+
+    results = {}
+    with HerokuappServer(loading_delay_ms=LOADING_DELAY_MS) as server, \
+            tempfile.TemporaryDirectory() as tmp, sync_playwright() as playwright:
+        upload_path = os.path.join(tmp, "upload.txt")
+        with open(upload_path, "w") as f:
+            f.write("benchmark upload")
+
+        browser = getattr(playwright, args.browser).launch()
+        context = browser.new_context()
+        context.route(lambda url: not url.startswith(server.url), fulfill_example)
+        page = context.new_page()
+        counter = RoundTripCounter(page)
+
+        benchmarks = example_benchmarks(page) + herokuapp_benchmarks(page, server.url, upload_path)
+        for benchmark in benchmarks:
+            if args.filter not in benchmark.name:
+                continue
+            result = sample(benchmark, counter, args.warmup, args.iterations)
+            results[benchmark.name] = result
+            print(f"{benchmark.name:<48} median {result['median_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+                  f"stdev {result['stdev_ms']:6.2f}ms  {result['round_trips']:5.1f} round trips")
+        browser.close()
+
+    if args.save:
+        write_baseline(args.save, results, {
+            "browser": args.browser,
+            "playwright": version("playwright"),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+        })
+        print(f"baseline written to {args.save}")
+
+    if not args.compare:
+        return 0
+    rows = compare(args.compare, results, args.alpha, args.min_slowdown)
+    print()
+    for row in rows:
+        flag = "SLOWER" if row["slower"] else ""
+        print(f"{row['name']:<48} {row['baseline_ms']:8.2f}ms -> {row['current_ms']:8.2f}ms "
+              f"({row['change']:+.1%}, p={row['p_value']:.4f}) {flag}")
+    slower = [row["name"] for row in rows if row["slower"]]
+    print(f"{len(slower)} significant slowdown(s) at alpha={args.alpha}")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Compare checking status-code endpoints by navigating with checking them through the request API.
+
+Each endpoint of the bundled Herokuapp server is checked once with page.goto, the way
+check_status_code used to work, and once with BasePage.check_responses, which sends
+the requests concurrently from the context's API request context.
+
+Usage:
+    python -m benchmarks.bench_status_checks [--endpoints 100] [--concurrency 16]
+"""
+import argparse
+import time
+from playwright.sync_api import sync_playwright
+from pages.base_page import BasePage
+from tests.utils.herokuapp_server import HerokuappServer
+
+CODES = [200, 301, 302, 404, 500, 503]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    with HerokuappServer() as server, sync_playwright() as playwright:
+        urls = [f"{server.url}/status_codes/{CODES[index % len(CODES)]}?n={index}" for index in range(args.endpoints)]
+        browser = playwright.chromium.launch()
+        context = browser.new_context()
+        base_page = BasePage(context.new_page())
+
+        started = time.perf_counter()
+        statuses = [base_page.page.goto(url).status for url in urls]
+        navigate_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        checks = base_page.check_responses(urls, concurrency=args.concurrency)
+        request_seconds = time.perf_counter() - started
+        browser.close()
+
+    assert statuses == [check.status for check in checks], "Both ways should see the same statuses"
+    print(f"{'page.goto':>16}: {navigate_seconds:.2f}s for {len(urls)} endpoints")
+    print(f"{'check_responses':>16}: {request_seconds:.2f}s for {len(urls)} endpoints "
+          f"({navigate_seconds / request_seconds:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
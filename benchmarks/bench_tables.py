@@ -0,0 +1,77 @@
+"""
+Compare per-cell table reads with BasePage.get_table on a generated table.
+
+The per-cell read is what HerokuappPage.get_table_data used to do: one round trip per
+row to find its cells and one per cell for its text. Pass --per-cell-rows to bound it
+on large tables, where it takes minutes.
+
+Usage:
+    python -m benchmarks.bench_tables [--rows 20000] [--columns 8] [--chunk-size 5000] [--per-cell-rows 500]
+"""
+import argparse
+import time
+from typing import Dict, List
+from playwright.sync_api import Page, sync_playwright
+from pages.base_page import BasePage
+from benchmarks.harness import RoundTripCounter
+
+TABLE_SELECTOR = "#grid"
+
+
+def table_html(rows: int, columns: int) -> str:
+    headers = "".join(f"<th>Column {column}</th>" for column in range(columns))
+    body = "".join(
+        "<tr>" + "".join(f"<td>{row * columns + column}</td>" for column in range(columns)) + "</tr>"
+        for row in range(rows)
+    )
+    return f'<table id="grid"><thead><tr>{headers}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def per_cell_read(page: Page, rows: int) -> List[Dict[str, str]]:
+    headers = [header.text_content().strip() for header in page.query_selector_all(f"{TABLE_SELECTOR} th")]
+    data = []
+    for row in page.query_selector_all(f"{TABLE_SELECTOR} tbody tr")[:rows]:
+        data.append({header: cell.text_content().strip() for header, cell in zip(headers, row.query_selector_all("td"))})
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--per-cell-rows", type=int, default=500, help="Rows read by the per-cell reader")
+    args = parser.parse_args()
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.set_content(table_html(args.rows, args.columns))
+        base_page = BasePage(page)
+        counter = RoundTripCounter(page)
+
+        readers = (
+            (f"per-cell ({args.per_cell_rows} rows)", lambda: len(per_cell_read(page, args.per_cell_rows))),
+            ("get_table", lambda: len(base_page.get_table(TABLE_SELECTOR))),
+            (f"get_table chunked by {args.chunk_size}",
+             lambda: len(base_page.get_table(TABLE_SELECTOR, chunk_size=args.chunk_size))),
+        )
+        for name, read in readers:
+            counter.count = 0
+            started = time.perf_counter()
+            rows = read()
+            elapsed = time.perf_counter() - started
+            print(f"{name:>32}: {rows} rows, {counter.count} round trips, {elapsed * 1000:.1f}ms "
+                  f"({elapsed * 1e6 / max(rows, 1):.1f}us/row)")
+
+        started = time.perf_counter()
+        table = base_page.get_table(TABLE_SELECTOR)
+        column = table.headers[0]
+        checks = (table.is_sorted(column, numeric=True), table.is_unique(column), table.has_type(column, "number"))
+        print(f"{'column checks':>32}: sorted/unique/number {checks} in "
+              f"{(time.perf_counter() - started) * 1000:.1f}ms including the read")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
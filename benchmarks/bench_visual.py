@@ -0,0 +1,65 @@
+"""
+Time visual comparisons of 1920x1080 frames without a browser.
+
+A synthetic page is rendered with Pillow, stored as the baseline, then compared with
+an identical frame, a small change, a one-pixel text shift (anti-aliasing) and a large
+change. Reported times include decoding the screenshot PNG.
+
+Usage:
+    python -m benchmarks.bench_visual [--iterations 20]
+"""
+import argparse
+import io
+import statistics
+import sys
+import tempfile
+from typing import Dict, Optional, Tuple
+from PIL import Image, ImageDraw
+from tests.utils.visual import VisualComparator
+
+SIZE = (1920, 1080)
+
+
+def render(shift: int = 0, box: Optional[Tuple[int, int, int, int]] = None) -> bytes:
+    """A page-like frame: text lines, a header bar and an optional red box."""
+    image = Image.new("RGB", SIZE, (250, 250, 252))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, SIZE[0], 60), fill=(36, 41, 46))
+    for line in range(32):
+        draw.text((120 + shift, 100 + line * 28), f"Example Domain line {line}: for use in illustrative examples",
+                  fill=(30, 30, 30))
+    if box:
+        draw.rectangle(box, fill=(220, 30, 30))
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    cases: Dict[str, bytes] = {
+        "identical": render(),
+        "small change": render(box=(1500, 900, 1512, 912)),
+        "1px text shift": render(shift=1),
+        "large change": render(box=(0, 0, 800, 800)),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        comparator = VisualComparator(f"{directory}/baselines", f"{directory}/output", max_diff_ratio=1.0,
+                                      cache_dir=f"{directory}/cache")
+        comparator.save_baseline("frame", render())
+        print(f"{'case':16} {'median':>9} {'p95':>9} {'tiles':>9} {'diff px':>9} {'aa px':>9}")
+        for name, png in cases.items():
+            results = [comparator.compare("frame", png) for _ in range(args.iterations)]
+            timings = sorted(result.milliseconds for result in results)
+            last = results[-1]
+            print(f"{name:16} {statistics.median(timings):7.1f}ms "
+                  f"{timings[min(len(timings) - 1, int(0.95 * len(timings)))]:7.1f}ms "
+                  f"{last.changed_tiles:4d}/{last.total_tiles:<4d} {last.diff_pixels:9d} {last.antialiased_pixels:9d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Shared measurement helpers for the benchmarks: round-trip counting, sampling and statistics."""
+import json
+import math
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from playwright.sync_api import Page
+
+
+class RoundTripCounter:
+    """Counts the protocol messages a page's driver connection sends."""
+
+    def __init__(self, page: Page):
+        self.count = 0
+        self._connection = page._impl_obj._connection
+        self._send = self._connection._send_message_to_server
+
+        def send(*args, **kwargs):
+            self.count += 1
+            return self._send(*args, **kwargs)
+
+        self._connection._send_message_to_server = send
+
+
+@dataclass
+class Benchmark:
+    """One operation to time; `setup` runs untimed before every sample."""
+
+    name: str
+    run: Callable[[], object]
+    setup: Optional[Callable[[], object]] = None
+
+
+def sample(benchmark: Benchmark, counter: RoundTripCounter, warmup: int, iterations: int) -> Dict:
+    """Run a benchmark's warmup rounds, then time `iterations` samples in milliseconds."""
+    for _ in range(warmup):
+        if benchmark.setup:
+            benchmark.setup()
+        benchmark.run()
+
+    samples: List[float] = []
+    round_trips = 0
+    for _ in range(iterations):
+        if benchmark.setup:
+            benchmark.setup()
+        counter.count = 0
+        started = time.perf_counter()
+        benchmark.run()
+        samples.append((time.perf_counter() - started) * 1000)
+        round_trips += counter.count
+    return summarize(samples, round_trips / iterations)
+
+
+def summarize(samples: List[float], round_trips: float) -> Dict:
+    ordered = sorted(samples)
+    return {
+        "samples": samples,
+        "round_trips": round_trips,
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.mean(samples),
+        "stdev_ms": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "p95_ms": ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)],
+    }
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta function (modified Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return result
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1 - x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1 - x) / b
+
+
+def welch_t_test(baseline: List[float], current: List[float]) -> Dict:
+    """
+    One-sided Welch's t-test for `current` being slower than `baseline`.
+
+    Returns:
+        dict: t statistic, Welch-Satterthwaite degrees of freedom and the p-value
+    """
+    n1, n2 = len(baseline), len(current)
+    m1, m2 = statistics.mean(baseline), statistics.mean(current)
+    v1 = statistics.variance(baseline) / n1 if n1 > 1 else 0.0
+    v2 = statistics.variance(current) / n2 if n2 > 1 else 0.0
+    if v1 + v2 == 0:
+        return {"t": 0.0, "df": float(n1 + n2 - 2), "p_value": 0.0 if m2 > m1 else 1.0}
+    t = (m2 - m1) / math.sqrt(v1 + v2)
+    df = (v1 + v2) ** 2 / ((v1 ** 2 / (n1 - 1) if n1 > 1 else 0) + (v2 ** 2 / (n2 - 1) if n2 > 1 else 0))
+    tail = 0.5 * _betainc(df / 2, 0.5, df / (df + t * t))
+    return {"t": t, "df": df, "p_value": tail if t > 0 else 1.0 - tail}
+
+
+def write_baseline(path: str, results: Dict[str, Dict], meta: Dict) -> None:
+    """Write benchmark results, including raw samples, as a JSON baseline."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {"created": datetime.now().isoformat(), "python": platform.python_version(), **meta},
+            "results": results,
+        }, f, indent=2)
+
+
+def compare(baseline_path: str, results: Dict[str, Dict], alpha: float, min_slowdown: float) -> List[Dict]:
+    """
+    Compare results with a baseline file.
+
+    A benchmark is flagged when its mean is slower by more than `min_slowdown`
+    (a fraction) and Welch's test puts the slowdown below significance level `alpha`.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    rows = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]
+        test = welch_t_test(before["samples"], result["samples"])
+        change = (result["mean_ms"] - before["mean_ms"]) / before["mean_ms"] if before["mean_ms"] else 0.0
+        rows.append({
+            "name": name,
+            "baseline_ms": before["mean_ms"],
+            "current_ms": result["mean_ms"],
+            "change": change,
+            "p_value": test["p_value"],
+            "slower": test["p_value"] < alpha and change > min_slowdown,
+        })
+    return rows
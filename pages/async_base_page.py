@@ -0,0 +1,228 @@
+import time
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Pattern, Sequence, Union
+from .instrumentation import InstrumentedPage
+from .response_checks import DEFAULT_CHECK_CONCURRENCY, ResponseCheck, check_responses
+from .table_data import TABLE_CHUNK_SCRIPT, TableData
+from .base_page import (
+    LISTEN_FOR_SIGNAL_SCRIPT,
+    PERFORMANCE_METRICS_SCRIPT,
+    QUERY_ELEMENTS_SCRIPT,
+    SIGNAL_RAISED_SCRIPT,
+    WAIT_FOR_ATTRIBUTE_SCRIPT,
+    WAIT_FOR_TEXT_SCRIPT,
+    ElementState,
+    PageMetrics,
+)
+
+class AsyncBasePage(InstrumentedPage):
+    """Async counterpart of BasePage, built on playwright.async_api."""
+
+    render_response_checks = False
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def navigate(self, url: str) -> None:
+        """Navigate to the specified URL."""
+        await self.page.goto(url)
+
+    async def get_title(self) -> str:
+        """Get the page title."""
+        return await self.page.title()
+
+    def get_url(self) -> str:
+        """Get the current URL."""
+        return self.page.url
+
+    async def is_element_visible(self, selector: str, timeout: Optional[float] = None) -> bool:
+        """Check if an element is visible."""
+        try:
+            await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def click(self, selector: str) -> None:
+        """Click an element."""
+        await self.page.click(selector)
+
+    async def fill(self, selector: str, value: str) -> None:
+        """Fill a form field."""
+        await self.page.fill(selector, value)
+
+    async def get_text(self, selector: str) -> str:
+        """Get text content of an element."""
+        return await self.page.text_content(selector)
+
+    async def get_elements(self, selector: str) -> List:
+        """Get all elements matching the selector."""
+        return await self.page.query_selector_all(selector)
+
+    async def wait_for_navigation(self) -> None:
+        """Wait for navigation to complete, i.e. the load event; use the explicit waits for later content."""
+        await self.page.wait_for_load_state("load")
+
+    async def wait_until(self, predicate: str, arg: Any = None, timeout: Optional[float] = None) -> None:
+        """Wait until a JavaScript predicate returns a truthy value."""
+        await self.page.wait_for_function(predicate, arg=arg, timeout=timeout)
+
+    async def wait_for_text(self, selector: str, text: str, exact: bool = True, timeout: Optional[float] = None) -> None:
+        """Wait until an element's trimmed text equals (or, with exact=False, contains) the given text."""
+        await self.wait_until(WAIT_FOR_TEXT_SCRIPT, [selector, text, exact], timeout=timeout)
+
+    async def wait_for_attribute(
+        self, selector: str, name: str, value: Optional[str] = None, timeout: Optional[float] = None
+    ) -> None:
+        """Wait until an element has an attribute, or the attribute has a specific value."""
+        await self.wait_until(WAIT_FOR_ATTRIBUTE_SCRIPT, [selector, name, value], timeout=timeout)
+
+    async def wait_for_response(
+        self,
+        url_or_predicate: Union[str, Pattern[str], Callable[[Response], bool]],
+        action: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Response:
+        """Run an action and wait for the response it triggers."""
+        async with self.page.expect_response(url_or_predicate, timeout=timeout) as response_info:
+            await action()
+        return await response_info.value
+
+    async def wait_for_signal(
+        self, name: str, action: Optional[Callable[[], Awaitable[Any]]] = None, timeout: Optional[float] = None
+    ) -> Any:
+        """Wait for a custom signal raised by the page, see BasePage.wait_for_signal."""
+        await self.page.evaluate(LISTEN_FOR_SIGNAL_SCRIPT, name)
+        if action is not None:
+            await action()
+        handle = await self.page.wait_for_function(SIGNAL_RAISED_SCRIPT, arg=name, timeout=timeout)
+        return (await handle.json_value())["value"]
+
+    async def get_performance_metrics(self) -> PageMetrics:
+        """Read the current document's load, paint, layout-shift and resource timings from the browser."""
+        return PageMetrics(**await self.page.evaluate(PERFORMANCE_METRICS_SCRIPT))
+
+    async def screenshot(self, path: Optional[str] = None, full_page: bool = False) -> bytes:
+        """Take a screenshot, saving it to `path` if given, and return the PNG bytes."""
+        return await self.page.screenshot(path=path, full_page=full_page)
+
+    def get_viewport_size(self) -> dict:
+        """Get the current viewport size."""
+        return self.page.viewport_size
+
+    async def check_response(self, url: str, max_redirects: int = 0, read_body: bool = False,
+                             timeout: Optional[float] = None) -> ResponseCheck:
+        """Request a URL without rendering it; see BasePage.check_responses."""
+        return (await self.check_responses([url], max_redirects, read_body, timeout))[0]
+
+    async def check_responses(
+        self,
+        urls: Sequence[str],
+        max_redirects: int = 0,
+        read_body: bool = False,
+        timeout: Optional[float] = None,
+        concurrency: int = DEFAULT_CHECK_CONCURRENCY,
+    ) -> List[ResponseCheck]:
+        """Request URLs concurrently without rendering them; see BasePage.check_responses."""
+        if self.render_response_checks:
+            return [await self._render_response_check(url, read_body, timeout) for url in urls]
+        return await check_responses(self.page.context.request, urls, max_redirects, read_body, timeout, concurrency)
+
+    async def _render_response_check(self, url: str, read_body: bool, timeout: Optional[float]) -> ResponseCheck:
+        started = time.perf_counter()
+        try:
+            response = await self.page.goto(url, timeout=timeout)
+            if response is None:
+                raise RuntimeError(f"No response for {url}")
+            return ResponseCheck(
+                url,
+                status=response.status,
+                status_text=response.status_text,
+                headers=response.headers,
+                body=await response.text() if read_body else None,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
+        except Exception as e:
+            return ResponseCheck(url, error=str(e), elapsed_ms=(time.perf_counter() - started) * 1000)
+
+    async def get_table(self, selector: str, chunk_size: Optional[int] = None) -> TableData:
+        """Read a table's header and body cells as columns; see BasePage.get_table."""
+        if chunk_size is not None:
+            return TableData.concat([chunk async for chunk in self.iter_table_chunks(selector, chunk_size)])
+        return await self._read_table_chunk(selector, 0, None)
+
+    async def iter_table_chunks(self, selector: str, chunk_size: int = 5000) -> AsyncIterator[TableData]:
+        """Read a table `chunk_size` rows at a time, one evaluation per chunk."""
+        start = 0
+        while True:
+            chunk = await self._read_table_chunk(selector, start, chunk_size)
+            if len(chunk) or not start:
+                yield chunk
+            start += len(chunk)
+            if not len(chunk) or start >= chunk.total_rows:
+                return
+
+    async def _read_table_chunk(self, selector: str, start: int, limit: Optional[int]) -> TableData:
+        chunk = await self.page.evaluate(TABLE_CHUNK_SCRIPT, {"selector": selector, "start": start, "limit": limit})
+        if chunk is None:
+            raise ValueError(f"No table matches '{selector}'")
+        return TableData.from_chunk(chunk)
+
+    async def query_elements(
+        self,
+        selectors: Dict[str, str],
+        properties: Sequence[str] = ("text",),
+        attributes: Sequence[str] = (),
+        wait: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, ElementState]:
+        """Read the state of several elements in one driver round trip, see BasePage.query_elements."""
+        arg = {
+            "selectors": selectors,
+            "properties": list(properties),
+            "attributes": list(attributes),
+            "waitVisible": wait,
+        }
+        snapshot = await self.page.evaluate(QUERY_ELEMENTS_SCRIPT, arg)
+        if wait and not snapshot["ready"]:
+            try:
+                handle = await self.page.wait_for_function(
+                    f"arg => {{ const snapshot = ({QUERY_ELEMENTS_SCRIPT})(arg); return snapshot.ready && snapshot; }}",
+                    arg=arg,
+                    timeout=timeout,
+                )
+                snapshot = await handle.json_value()
+            except PlaywrightTimeoutError:
+                snapshot = await self.page.evaluate(QUERY_ELEMENTS_SCRIPT, arg)
+
+        states = {}
+        for name, state in snapshot["result"].items():
+            if state.get("unsupported"):
+                states[name] = await self._query_element_fallback(
+                    selectors[name], properties, attributes, wait, timeout
+                )
+            else:
+                states[name] = ElementState(**state)
+        return states
+
+    async def _query_element_fallback(
+        self,
+        selector: str,
+        properties: Sequence[str],
+        attributes: Sequence[str],
+        wait: bool,
+        timeout: Optional[float],
+    ) -> ElementState:
+        """Read one element through the locator API, for selectors that aren't plain CSS."""
+        if wait:
+            await self.is_element_visible(selector, timeout=timeout)
+        locator = self.page.locator(selector).first
+        if await locator.count() == 0:
+            return ElementState(found=False)
+        return ElementState(
+            found=True,
+            visible=await locator.is_visible(),
+            text=await locator.text_content() if "text" in properties else None,
+            bounding_box=await locator.bounding_box() if "bounding_box" in properties else None,
+            attributes={attr: await locator.get_attribute(attr) for attr in attributes},
+        )
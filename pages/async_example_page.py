@@ -0,0 +1,50 @@
+from .async_base_page import AsyncBasePage
+from .base_page import ElementState
+from .example_page import ExampleSelectors
+from playwright.async_api import Page
+from typing import Dict
+
+class AsyncExamplePage(ExampleSelectors, AsyncBasePage):
+    """Async counterpart of ExamplePage."""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = self.URL
+
+    async def navigate_to_home(self) -> None:
+        """Navigate to the example.com homepage."""
+        await self.navigate(self.url)
+
+    async def get_main_heading(self) -> str:
+        """Get the main heading text."""
+        return await self.get_text(self.HEADING)
+
+    async def get_main_paragraph(self) -> str:
+        """Get the main paragraph text."""
+        return await self.get_text(self.PARAGRAPH)
+
+    async def click_more_info(self) -> None:
+        """Click the 'More information' link."""
+        await self.click(self.MORE_INFO_LINK)
+
+    async def get_main_elements(self) -> Dict[str, ElementState]:
+        """Wait for the heading, paragraph and link and read them in one round trip."""
+        return await self.query_elements(
+            {'heading': self.HEADING, 'paragraph': self.PARAGRAPH, 'link': self.MORE_INFO_LINK},
+            wait=True,
+        )
+
+    async def verify_page_loaded(self) -> bool:
+        """Verify that the page has loaded successfully."""
+        return all(state.visible for state in (await self.get_main_elements()).values())
+
+    async def verify_responsive_elements(self) -> dict:
+        """Verify responsive elements are displayed correctly."""
+        viewport = self.get_viewport_size()
+        elements = await self.get_main_elements()
+        return {
+            'viewport': viewport,
+            'heading_visible': elements['heading'].visible,
+            'paragraph_visible': elements['paragraph'].visible,
+            'link_visible': elements['link'].visible
+        }
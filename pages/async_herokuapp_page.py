@@ -0,0 +1,213 @@
+from .async_base_page import AsyncBasePage
+from .herokuapp_page import HerokuappSelectors
+from .retry import retryable
+from .table_data import TableData
+from playwright.async_api import Dialog, Page
+from typing import List, Dict, Optional
+
+class AsyncHerokuappPage(HerokuappSelectors, AsyncBasePage):
+    """Async counterpart of HerokuappPage, sharing its selectors and route index."""
+
+    def __init__(self, page: Page, url: Optional[str] = None):
+        super().__init__(page)
+        self.url = (url or self.DEFAULT_URL).rstrip("/")
+
+    async def navigate_to_home(self) -> None:
+        """Navigate to the homepage."""
+        await self.navigate(self.url)
+
+    async def get_available_examples(self) -> List[str]:
+        """Get list of available example pages."""
+        links = await self.page.eval_on_selector_all(self.available_examples, self.ROUTE_INDEX_SCRIPT)
+        return [name for name, _ in links]
+
+    async def get_route_index(self) -> Dict[str, str]:
+        """Get the homepage link table (name -> href), extracted once per session."""
+        index = self._route_index.get(self.url)
+        if index is None:
+            if self.page.url.rstrip("/") != self.url:
+                await self.navigate_to_home()
+            index = dict(await self.page.eval_on_selector_all(self.available_examples, self.ROUTE_INDEX_SCRIPT))
+            self._route_index[self.url] = index
+        return index
+
+    async def resolve_example(self, example_name: str) -> str:
+        """Resolve an example name, alias or partial name to its URL."""
+        return self._match_example(await self.get_route_index(), example_name)
+
+    @retryable()
+    async def navigate_to_example(self, example_name: str) -> None:
+        """Navigate to a specific example page, staying put if it is already open; retried on transient errors."""
+        url = await self.resolve_example(example_name)
+        if self.page.url != url:
+            await self.page.goto(url)
+
+    async def login(self, username: str, password: str) -> None:
+        """Perform login with given credentials."""
+        await self.navigate_to_example("Form Authentication")
+        await self.fill(self.username_input, username)
+        await self.fill(self.password_input, password)
+        await self.click(self.login_button)
+
+    async def open_secure_area(self) -> bool:
+        """Open the secure area directly; returns False if the session is not logged in."""
+        await self.navigate(f"{self.url}/secure")
+        return await self.verify_secure_page()
+
+    async def get_flash_message(self) -> str:
+        """Get the flash message text."""
+        return await self.get_text(self.flash_message)
+
+    async def wait_for_dynamic_text(self) -> str:
+        """Wait for dynamically loaded text."""
+        await self.navigate_to_example("Dynamic Loading")
+        await self.click("text=Example 1")
+        await self.click(self.start_button)
+        await self.page.wait_for_selector(self.loading_indicator, state="hidden")
+        return (await self.get_text(self.finish_text)).strip()
+
+    async def toggle_checkbox(self, index: int) -> None:
+        """Toggle checkbox at given index."""
+        await self.navigate_to_example("Checkboxes")
+        await self.page.locator(self.checkboxes).nth(index).click()
+
+    async def is_checkbox_checked(self, index: int) -> bool:
+        """Check if checkbox at given index is checked."""
+        return await self.page.locator(self.checkboxes).nth(index).is_checked()
+
+    async def perform_drag_and_drop(self) -> None:
+        """Perform drag and drop operation."""
+        await self.navigate_to_example("Drag and Drop")
+        await self.page.locator(self.draggable).drag_to(self.page.locator(self.droppable))
+
+    async def upload_file(self, file_path: str) -> None:
+        """Upload a file."""
+        await self.navigate_to_example("File Upload")
+        await self.page.set_input_files(self.file_upload_input, file_path)
+        await self.click(self.upload_button)
+
+    async def switch_to_frame_and_type(self, text: str) -> None:
+        """Switch to iframe and type text."""
+        await self.navigate_to_example("Frames")
+        await self.click(self.iframe_link)
+
+        # Wait for iframe and editor to be ready
+        await self.page.wait_for_selector(self.iframe)
+        editor = self.page.frame_locator(self.iframe).locator(self.frame_content)
+        await editor.wait_for(state="visible")
+
+        await editor.press("Control+A")
+        await editor.press("Delete")
+        await editor.type(text)
+
+    async def handle_javascript_alert(self, alert_type: str, input_text: str = None) -> str:
+        """Handle different types of JavaScript alerts."""
+        await self.navigate_to_example("JavaScript Alerts")
+
+        # Set up alert handling before triggering the alert
+        async def dialog_handler(dialog: Dialog) -> None:
+            if alert_type == "prompt":
+                await dialog.accept(input_text)
+            else:
+                await dialog.accept()
+        self.page.once("dialog", dialog_handler)
+
+        if alert_type == "confirm":
+            await self.click(self.js_confirm_button)
+        elif alert_type == "prompt":
+            await self.click(self.js_prompt_button)
+        else:  # simple alert
+            await self.click(self.js_alert_button)
+
+        # Wait for the result text to appear
+        await self.page.wait_for_selector(self.result)
+        return await self.get_text(self.result)
+
+    async def verify_secure_page(self) -> bool:
+        """Verify that we're on the secure page."""
+        if "secure" not in self.page.url:
+            return False
+        subheading = (await self.query_elements({"subheading": self.subheading}, wait=True))["subheading"]
+        return "Secure Area" in (subheading.text or "")
+
+    async def verify_page_loaded(self) -> bool:
+        """Verify that the page has loaded successfully."""
+        heading = (await self.query_elements({"heading": self.heading}, wait=True))["heading"]
+        return heading.visible and "Welcome to the-internet" in (heading.text or "")
+
+    async def press_key(self, key: str) -> str:
+        """Press a key and get the result."""
+        await self.navigate_to_example("Key Presses")
+        await self.page.locator(self.key_press_input).press(key)
+        return await self.get_text(self.key_press_result)
+
+    async def set_slider_value(self, value: float) -> None:
+        """Set horizontal slider to a specific value."""
+        await self.navigate_to_example("Horizontal Slider")
+        slider = self.page.locator(self.slider)
+
+        # Calculate the position based on the slider's range
+        min_value = float(await slider.get_attribute("min") or "0")
+        max_value = float(await slider.get_attribute("max") or "5")
+        steps = float(await slider.get_attribute("step") or "0.5")
+
+        # Ensure value is within bounds and matches step increments
+        value = max(min_value, min(max_value, value))
+        value = round(value / steps) * steps
+
+        # Set the value using JavaScript and trigger input event
+        await slider.evaluate(f"""(node) => {{
+            node.value = {value};
+            node.dispatchEvent(new Event('input', {{ bubbles: true }}));
+            node.dispatchEvent(new Event('change', {{ bubbles: true }}));
+        }}""")
+        await self.wait_for_text(self.slider_value, f"{value:g}")
+
+    async def get_slider_value(self) -> float:
+        """Get the current slider value."""
+        return float(await self.page.locator(self.slider_value).text_content() or "0")
+
+    async def get_table_data(self) -> List[Dict[str, str]]:
+        """Get table data as a list of dictionaries."""
+        return (await self.get_table_columns()).rows()
+
+    async def get_table_columns(self, chunk_size: Optional[int] = None) -> TableData:
+        """Get table data column by column, read in one evaluation (or one per `chunk_size` rows)."""
+        await self.navigate_to_example("Data Tables")
+        await self.page.wait_for_selector(self.table)
+        return await self.get_table(self.table, chunk_size)
+
+    async def sort_table_by_column(self, column_name: str) -> None:
+        """Sort table by clicking on a column header."""
+        await self.navigate_to_example("Data Tables")
+        await self.page.wait_for_selector(self.table)
+
+        for header in await self.page.query_selector_all(self.table_headers):
+            if (await header.text_content()).strip() == column_name:
+                await header.click()
+                break
+
+    async def check_status_code(self, code: int) -> bool:
+        """Check that a status code page responds with its code, without rendering it."""
+        return (await self.check_status_codes([code]))[code]
+
+    async def check_status_codes(self, codes: List[int]) -> Dict[int, bool]:
+        """
+        Check several status code pages concurrently through the context's request API.
+
+        A page counts as responding when it returns its own code; use check_responses
+        for the error of a request that failed outright.
+        """
+        checks = await self.check_responses([self.status_code_url(code) for code in codes])
+        return {code: check.status == code for code, check in zip(codes, checks)}
+
+    async def verify_status_code_message(self, code: int) -> str:
+        """Get the message from a status code page, rendering it since the message is read from the DOM."""
+        try:
+            url = self.status_code_url(code)
+            if self.page.url != url:
+                await self.page.goto(url)
+            message = await self.page.locator("p").text_content()
+            return message.strip()
+        except Exception:
+            return ""
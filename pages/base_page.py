@@ -1,7 +1,135 @@
-from playwright.sync_api import Page
-from typing import Optional, List
+import time
+from dataclasses import dataclass, field
+from playwright.sync_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+from .instrumentation import InstrumentedPage
+from .response_checks import DEFAULT_CHECK_CONCURRENCY, ResponseCheck, check_responses_sync
+from .table_data import TABLE_CHUNK_SCRIPT, TableData
+from typing import Any, Callable, Dict, Iterator, Optional, List, Pattern, Sequence, Union
+
+# Resolves a batch of CSS selectors in a single in-page evaluation. Selectors that are
+# not valid CSS (Playwright engines such as "text=") are reported as unsupported.
+QUERY_ELEMENTS_SCRIPT = """({ selectors, properties, attributes, waitVisible }) => {
+    const result = {};
+    let ready = true;
+    for (const [name, selector] of Object.entries(selectors)) {
+        let element;
+        try {
+            element = document.querySelector(selector);
+        } catch (e) {
+            result[name] = { unsupported: true };
+            continue;
+        }
+        if (!element) {
+            result[name] = { found: false };
+            ready = false;
+            continue;
+        }
+        const rect = element.getBoundingClientRect();
+        const style = getComputedStyle(element);
+        const state = {
+            found: true,
+            visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden",
+        };
+        if (properties.includes("text")) state.text = element.textContent;
+        if (properties.includes("bounding_box")) {
+            state.bounding_box = { x: rect.x, y: rect.y, width: rect.width, height: rect.height };
+        }
+        state.attributes = Object.fromEntries(attributes.map(attr => [attr, element.getAttribute(attr)]));
+        ready = ready && (!waitVisible || state.visible);
+        result[name] = state;
+    }
+    return { ready, result };
+}"""
+
+# Readiness conditions for the wait_for_* methods, evaluated in the page until they hold
+WAIT_FOR_TEXT_SCRIPT = """([selector, text, exact]) => {
+    const element = document.querySelector(selector);
+    if (!element) return false;
+    const content = element.textContent.trim();
+    return exact ? content === text : content.includes(text);
+}"""
+
+WAIT_FOR_ATTRIBUTE_SCRIPT = """([selector, name, value]) => {
+    const element = document.querySelector(selector);
+    if (!element) return false;
+    return value === null ? element.hasAttribute(name) : element.getAttribute(name) === value;
+}"""
+
+# Pages raise a signal either by dispatching a `name` event on window or by setting
+# window.__signals[name] themselves.
+LISTEN_FOR_SIGNAL_SCRIPT = """name => {
+    window.__signals = window.__signals || {};
+    window.addEventListener(name, event => { window.__signals[name] = event.detail ?? true; }, { once: true });
+}"""
+
+SIGNAL_RAISED_SCRIPT = "name => !!window.__signals && name in window.__signals && { value: window.__signals[name] }"
+
+# Reads Navigation Timing, Resource Timing, paint and layout-shift entries for the current
+# document once its load event has finished. Layout shifts are only exposed to a buffered
+# PerformanceObserver, and only in Chromium; other engines report null.
+PERFORMANCE_METRICS_SCRIPT = """async () => {
+    if (document.readyState !== "complete") {
+        await new Promise(resolve => window.addEventListener("load", resolve, { once: true }));
+    }
+    await new Promise(resolve => setTimeout(resolve, 0));
+    const [navigation] = performance.getEntriesByType("navigation");
+    const paints = Object.fromEntries(performance.getEntriesByType("paint").map(entry => [entry.name, entry.startTime]));
+    const resources = performance.getEntriesByType("resource");
+    let layoutShift = null;
+    if ((PerformanceObserver.supportedEntryTypes || []).includes("layout-shift")) {
+        layoutShift = await new Promise(resolve => {
+            let total = 0;
+            const observer = new PerformanceObserver(list => {
+                for (const entry of list.getEntries()) if (!entry.hadRecentInput) total += entry.value;
+            });
+            observer.observe({ type: "layout-shift", buffered: true });
+            setTimeout(() => { observer.disconnect(); resolve(total); }, 0);
+        });
+    }
+    return {
+        ttfb_ms: navigation ? navigation.responseStart - navigation.startTime : null,
+        dom_interactive_ms: navigation ? navigation.domInteractive - navigation.startTime : null,
+        dom_content_loaded_ms: navigation ? navigation.domContentLoadedEventEnd - navigation.startTime : null,
+        load_ms: navigation ? navigation.loadEventEnd - navigation.startTime : null,
+        first_paint_ms: paints["first-paint"] ?? null,
+        first_contentful_paint_ms: paints["first-contentful-paint"] ?? null,
+        cumulative_layout_shift: layoutShift,
+        document_bytes: navigation ? navigation.transferSize : null,
+        resource_count: resources.length,
+        resource_bytes: resources.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+        slowest_resource_ms: resources.reduce((slowest, entry) => Math.max(slowest, entry.duration), 0),
+    };
+}"""
+
+@dataclass
+class PageMetrics:
+    """Browser-side timings of one page load, returned by BasePage.get_performance_metrics."""
+    ttfb_ms: Optional[float] = None
+    dom_interactive_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_ms: Optional[float] = None
+    first_paint_ms: Optional[float] = None
+    first_contentful_paint_ms: Optional[float] = None
+    cumulative_layout_shift: Optional[float] = None
+    document_bytes: Optional[int] = None
+    resource_count: int = 0
+    resource_bytes: int = 0
+    slowest_resource_ms: float = 0.0
+
+@dataclass
+class ElementState:
+    """Snapshot of one element returned by BasePage.query_elements."""
+    found: bool
+    visible: bool = False
+    text: Optional[str] = None
+    bounding_box: Optional[Dict[str, float]] = None
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+
+class BasePage(InstrumentedPage):
+    # Run check_responses through page navigations instead of the request API, for
+    # contexts whose traffic must go through page routing (HAR record and replay)
+    render_response_checks = False
 
-class BasePage:
     def __init__(self, page: Page):
         self.page = page
 
@@ -42,13 +170,214 @@ class BasePage:
         return self.page.query_selector_all(selector)
 
     def wait_for_navigation(self) -> None:
-        """Wait for navigation to complete."""
-        self.page.wait_for_load_state("networkidle")
+        """Wait for navigation to complete, i.e. the load event; use the explicit waits for later content."""
+        self.page.wait_for_load_state("load")
+
+    def wait_until(self, predicate: str, arg: Any = None, timeout: Optional[float] = None) -> None:
+        """Wait until a JavaScript predicate returns a truthy value."""
+        self.page.wait_for_function(predicate, arg=arg, timeout=timeout)
+
+    def wait_for_text(self, selector: str, text: str, exact: bool = True, timeout: Optional[float] = None) -> None:
+        """Wait until an element's trimmed text equals (or, with exact=False, contains) the given text."""
+        self.wait_until(WAIT_FOR_TEXT_SCRIPT, [selector, text, exact], timeout=timeout)
+
+    def wait_for_attribute(
+        self, selector: str, name: str, value: Optional[str] = None, timeout: Optional[float] = None
+    ) -> None:
+        """Wait until an element has an attribute, or the attribute has a specific value."""
+        self.wait_until(WAIT_FOR_ATTRIBUTE_SCRIPT, [selector, name, value], timeout=timeout)
+
+    def wait_for_response(
+        self,
+        url_or_predicate: Union[str, Pattern[str], Callable[[Response], bool]],
+        action: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Response:
+        """Run an action and wait for the response it triggers."""
+        with self.page.expect_response(url_or_predicate, timeout=timeout) as response_info:
+            action()
+        return response_info.value
+
+    def wait_for_signal(self, name: str, action: Optional[Callable[[], Any]] = None, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a custom signal raised by the page.
+
+        Args:
+            name: Event dispatched on window, or key the page sets in window.__signals
+            action: Optional action that makes the page raise the signal; it must not navigate
+            timeout: Maximum time to wait in milliseconds, defaults to the page timeout
+
+        Returns:
+            Any: The event detail or the value stored in window.__signals
+        """
+        self.page.evaluate(LISTEN_FOR_SIGNAL_SCRIPT, name)
+        if action is not None:
+            action()
+        handle = self.page.wait_for_function(SIGNAL_RAISED_SCRIPT, arg=name, timeout=timeout)
+        return handle.json_value()["value"]
+
+    def get_performance_metrics(self) -> PageMetrics:
+        """Read the current document's load, paint, layout-shift and resource timings from the browser."""
+        return PageMetrics(**self.page.evaluate(PERFORMANCE_METRICS_SCRIPT))
 
-    def screenshot(self, path: str) -> None:
-        """Take a screenshot."""
-        self.page.screenshot(path=path)
+    def screenshot(self, path: Optional[str] = None, full_page: bool = False) -> bytes:
+        """Take a screenshot, saving it to `path` if given, and return the PNG bytes."""
+        return self.page.screenshot(path=path, full_page=full_page)
 
     def get_viewport_size(self) -> dict:
         """Get the current viewport size."""
-        return self.page.viewport_size 
\ No newline at end of file
+        return self.page.viewport_size
+
+    def check_response(self, url: str, max_redirects: int = 0, read_body: bool = False,
+                       timeout: Optional[float] = None) -> ResponseCheck:
+        """Request a URL without rendering it; see check_responses."""
+        return self.check_responses([url], max_redirects, read_body, timeout)[0]
+
+    def check_responses(
+        self,
+        urls: Sequence[str],
+        max_redirects: int = 0,
+        read_body: bool = False,
+        timeout: Optional[float] = None,
+        concurrency: int = DEFAULT_CHECK_CONCURRENCY,
+    ) -> List[ResponseCheck]:
+        """
+        Request URLs through the browser context's API request context, concurrently.
+
+        Requests share the context's cookies but skip the page entirely: nothing is
+        rendered and no subresources load. Use navigate when an assertion needs the DOM.
+        With render_response_checks set, each URL is opened in the page instead, one at
+        a time, and redirects are followed.
+
+        Args:
+            urls: URLs to GET
+            max_redirects: Redirects to follow; 0 reports a 3xx response as is
+            read_body: Also read each response body as text
+            timeout: Maximum time per request in milliseconds, defaults to the context timeout
+            concurrency: Requests in flight at once
+
+        Returns:
+            list: ResponseCheck per URL, in the order given; failed requests have `error` set
+        """
+        if self.render_response_checks:
+            return [self._render_response_check(url, read_body, timeout) for url in urls]
+        return check_responses_sync(self.page.context.request, urls, max_redirects, read_body, timeout, concurrency)
+
+    def _render_response_check(self, url: str, read_body: bool, timeout: Optional[float]) -> ResponseCheck:
+        started = time.perf_counter()
+        try:
+            response = self.page.goto(url, timeout=timeout)
+            if response is None:
+                raise RuntimeError(f"No response for {url}")
+            return ResponseCheck(
+                url,
+                status=response.status,
+                status_text=response.status_text,
+                headers=response.headers,
+                body=response.text() if read_body else None,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
+        except Exception as e:
+            return ResponseCheck(url, error=str(e), elapsed_ms=(time.perf_counter() - started) * 1000)
+
+    def get_table(self, selector: str, chunk_size: Optional[int] = None) -> TableData:
+        """
+        Read a table's header and body cells as columns.
+
+        Args:
+            selector: CSS selector of the <table>
+            chunk_size: Read this many rows per evaluation instead of all at once, for
+                tables too large to transfer in one message
+
+        Returns:
+            TableData: The table, one NumPy array per column
+        """
+        if chunk_size is not None:
+            return TableData.concat(self.iter_table_chunks(selector, chunk_size))
+        return self._read_table_chunk(selector, 0, None)
+
+    def iter_table_chunks(self, selector: str, chunk_size: int = 5000) -> Iterator[TableData]:
+        """Read a table `chunk_size` rows at a time, one evaluation per chunk."""
+        start = 0
+        while True:
+            chunk = self._read_table_chunk(selector, start, chunk_size)
+            if len(chunk) or not start:
+                yield chunk
+            start += len(chunk)
+            if not len(chunk) or start >= chunk.total_rows:
+                return
+
+    def _read_table_chunk(self, selector: str, start: int, limit: Optional[int]) -> TableData:
+        chunk = self.page.evaluate(TABLE_CHUNK_SCRIPT, {"selector": selector, "start": start, "limit": limit})
+        if chunk is None:
+            raise ValueError(f"No table matches '{selector}'")
+        return TableData.from_chunk(chunk)
+
+    def query_elements(
+        self,
+        selectors: Dict[str, str],
+        properties: Sequence[str] = ("text",),
+        attributes: Sequence[str] = (),
+        wait: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, ElementState]:
+        """
+        Read the state of several elements in one driver round trip.
+
+        Args:
+            selectors: Mapping of result names to CSS selectors
+            properties: Any of "text" and "bounding_box"; visibility is always reported
+            attributes: Attribute names to read from every element
+            wait: Wait until every element exists and is visible, like is_element_visible
+            timeout: Maximum time to wait in milliseconds, defaults to the page timeout
+
+        Returns:
+            dict: ElementState per name, with found=False for elements that don't exist
+        """
+        arg = {
+            "selectors": selectors,
+            "properties": list(properties),
+            "attributes": list(attributes),
+            "waitVisible": wait,
+        }
+        snapshot = self.page.evaluate(QUERY_ELEMENTS_SCRIPT, arg)
+        if wait and not snapshot["ready"]:
+            try:
+                handle = self.page.wait_for_function(
+                    f"arg => {{ const snapshot = ({QUERY_ELEMENTS_SCRIPT})(arg); return snapshot.ready && snapshot; }}",
+                    arg=arg,
+                    timeout=timeout,
+                )
+                snapshot = handle.json_value()
+            except PlaywrightTimeoutError:
+                snapshot = self.page.evaluate(QUERY_ELEMENTS_SCRIPT, arg)
+
+        states = {}
+        for name, state in snapshot["result"].items():
+            if state.get("unsupported"):
+                states[name] = self._query_element_fallback(selectors[name], properties, attributes, wait, timeout)
+            else:
+                states[name] = ElementState(**state)
+        return states
+
+    def _query_element_fallback(
+        self,
+        selector: str,
+        properties: Sequence[str],
+        attributes: Sequence[str],
+        wait: bool,
+        timeout: Optional[float],
+    ) -> ElementState:
+        """Read one element through the locator API, for selectors that aren't plain CSS."""
+        if wait:
+            self.is_element_visible(selector, timeout=timeout)
+        locator = self.page.locator(selector).first
+        if locator.count() == 0:
+            return ElementState(found=False)
+        return ElementState(
+            found=True,
+            visible=locator.is_visible(),
+            text=locator.text_content() if "text" in properties else None,
+            bounding_box=locator.bounding_box() if "bounding_box" in properties else None,
+            attributes={attr: locator.get_attribute(attr) for attr in attributes},
+        )
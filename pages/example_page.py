@@ -1,15 +1,20 @@
-from .base_page import BasePage
+from .base_page import BasePage, ElementState
 from playwright.sync_api import Page
+from typing import Dict
+
+class ExampleSelectors:
+    """Selectors shared by the sync and async example.com page objects."""
+    URL = "https://example.com"
 
-class ExamplePage(BasePage):
     # Selectors
     HEADING = "h1"
     PARAGRAPH = "p"
     MORE_INFO_LINK = "a"
-    
+
+class ExamplePage(ExampleSelectors, BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = "https://example.com"
+        self.url = self.URL
 
     def navigate_to_home(self) -> None:
         """Navigate to the example.com homepage."""
@@ -27,20 +32,24 @@ class ExamplePage(BasePage):
         """Click the 'More information' link."""
         self.click(self.MORE_INFO_LINK)
 
+    def get_main_elements(self) -> Dict[str, ElementState]:
+        """Wait for the heading, paragraph and link and read them in one round trip."""
+        return self.query_elements(
+            {'heading': self.HEADING, 'paragraph': self.PARAGRAPH, 'link': self.MORE_INFO_LINK},
+            wait=True,
+        )
+
     def verify_page_loaded(self) -> bool:
         """Verify that the page has loaded successfully."""
-        return (
-            self.is_element_visible(self.HEADING) and
-            self.is_element_visible(self.PARAGRAPH) and
-            self.is_element_visible(self.MORE_INFO_LINK)
-        )
+        return all(state.visible for state in self.get_main_elements().values())
 
     def verify_responsive_elements(self) -> dict:
         """Verify responsive elements are displayed correctly."""
         viewport = self.get_viewport_size()
+        elements = self.get_main_elements()
         return {
             'viewport': viewport,
-            'heading_visible': self.is_element_visible(self.HEADING),
-            'paragraph_visible': self.is_element_visible(self.PARAGRAPH),
-            'link_visible': self.is_element_visible(self.MORE_INFO_LINK)
+            'heading_visible': elements['heading'].visible,
+            'paragraph_visible': elements['paragraph'].visible,
+            'link_visible': elements['link'].visible
         } 
\ No newline at end of file
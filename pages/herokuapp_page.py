@@ -1,77 +1,122 @@
 from .base_page import BasePage
+from .retry import retryable
+from .table_data import TableData
 from playwright.sync_api import Page, expect
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional
+from urllib.parse import urljoin
 
-class HerokuappPage(BasePage):
+class HerokuappSelectors:
+    """Selectors and routing data shared by the sync and async Herokuapp page objects."""
+
+    DEFAULT_URL = "http://the-internet.herokuapp.com"
+
+    # Names used for examples whose homepage link text differs
+    EXAMPLE_ALIASES = {
+        "Data Tables": "Sortable Data Tables",
+        "Sortable Tables": "Sortable Data Tables",
+        "Tables": "Sortable Data Tables",
+        "Status Code": "Status Codes",
+    }
+
+    ROUTE_INDEX_SCRIPT = "links => links.map(link => [link.textContent.trim(), link.getAttribute('href')])"
+
+    # Homepage link tables keyed by base URL, shared by every instance in the process
+    _route_index: Dict[str, Dict[str, str]] = {}
+
+    # Main page elements
+    heading = "h1"
+    subheading = "h2"
+    footer = "#page-footer"
+
+    # Navigation and links
+    available_examples = "ul li a"
+
+    # Form Authentication
+    username_input = "#username"
+    password_input = "#password"
+    login_button = "button[type='submit']"
+    flash_message = "#flash"
+
+    # Dynamic Loading
+    start_button = "#start button"
+    finish_text = "#finish h4"
+    loading_indicator = "#loading"
+
+    # Checkboxes
+    checkboxes = "input[type='checkbox']"
+
+    # Drag and Drop
+    draggable = "#column-a"
+    droppable = "#column-b"
+
+    # File Upload
+    file_upload_input = "#file-upload"
+    upload_button = "#file-submit"
+
+    # Frames
+    iframe_link = "text=iFrame"
+    iframe = "#mce_0_ifr"
+    frame_content = "body#tinymce"
+
+    # Alerts
+    js_alert_button = "button[onclick='jsAlert()']"
+    js_confirm_button = "button[onclick='jsConfirm()']"
+    js_prompt_button = "button[onclick='jsPrompt()']"
+    result = "#result"
+
+    # Key Presses
+    key_press_input = "#target"
+    key_press_result = "#result"
+
+    # Horizontal Slider
+    slider = "input[type='range']"
+    slider_value = "span#range"
+
+    # Tables
+    table = "#table1"
+    table_headers = "#table1 th"
+    table_rows = "#table1 tbody tr"
+    table_cells = "td"
+
+    # Status Codes
+    status_codes = {
+        200: "200",
+        301: "301",
+        404: "404",
+        500: "500"
+    }
+
+    def _match_example(self, index: Dict[str, str], example_name: str) -> str:
+        """Match an example name, alias or partial name against a route index and return its URL."""
+        names = [example_name, self.EXAMPLE_ALIASES.get(example_name, example_name)]
+
+        # First try exact match, then case-insensitive, then partial match ignoring spaces
+        href = next((index[name] for name in names if name in index), None)
+        if href is None:
+            lowered = {name.lower(): link for name, link in index.items()}
+            href = next((lowered[name.lower()] for name in names if name.lower() in lowered), None)
+        if href is None:
+            wanted = [name.lower().replace(" ", "") for name in names]
+            href = next(
+                (link for name, link in index.items()
+                 if any(want in name.lower().replace(" ", "") for want in wanted)),
+                None,
+            )
+        if href is None:
+            raise ValueError(f"Example '{example_name}' not found")
+        return urljoin(f"{self.url}/", href)
+
+    def status_code_url(self, code: int) -> str:
+        """URL of the page that responds with a given status code."""
+        return f"{self.url}/status_codes/{code}"
+
+class HerokuappPage(HerokuappSelectors, BasePage):
     """Page object for The Internet Herokuapp test site."""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, url: Optional[str] = None):
         super().__init__(page)
-        self.url = "http://the-internet.herokuapp.com"
-        
-        # Main page elements
-        self.heading = "h1"
-        self.subheading = "h2"
-        self.footer = "#page-footer"
-        
-        # Navigation and links
-        self.available_examples = "ul li a"
-        
-        # Form Authentication
-        self.username_input = "#username"
-        self.password_input = "#password"
-        self.login_button = "button[type='submit']"
-        self.flash_message = "#flash"
-        
-        # Dynamic Loading
-        self.start_button = "#start button"
-        self.finish_text = "#finish h4"
-        self.loading_indicator = "#loading"
-        
-        # Checkboxes
-        self.checkboxes = "input[type='checkbox']"
-        
-        # Drag and Drop
-        self.draggable = "#column-a"
-        self.droppable = "#column-b"
-        
-        # File Upload
-        self.file_upload_input = "#file-upload"
-        self.upload_button = "#file-submit"
-        
-        # Frames
-        self.iframe_link = "text=iFrame"
-        self.iframe = "#mce_0_ifr"
-        self.frame_content = "body#tinymce"
-        
-        # Alerts
-        self.js_alert_button = "button[onclick='jsAlert()']"
-        self.js_confirm_button = "button[onclick='jsConfirm()']"
-        self.js_prompt_button = "button[onclick='jsPrompt()']"
-        self.result = "#result"
-
-        # Key Presses
-        self.key_press_input = "#target"
-        self.key_press_result = "#result"
-
-        # Horizontal Slider
-        self.slider = "input[type='range']"
-        self.slider_value = "span#range"
-
-        # Tables
-        self.table = "#table1"
-        self.table_headers = "#table1 th"
-        self.table_rows = "#table1 tbody tr"
-        self.table_cells = "td"
-
-        # Status Codes
-        self.status_codes = {
-            200: "200",
-            301: "301",
-            404: "404",
-            500: "500"
-        }
+        self.url = (url or self.DEFAULT_URL).rstrip("/")
 
     def navigate_to_home(self) -> None:
         """Navigate to the homepage."""
@@ -82,41 +127,26 @@ class HerokuappPage(BasePage):
         elements = self.page.query_selector_all(self.available_examples)
         return [element.text_content().strip() for element in elements]
         
+    def get_route_index(self) -> Dict[str, str]:
+        """Get the homepage link table (name -> href), extracted once per session."""
+        index = self._route_index.get(self.url)
+        if index is None:
+            if self.page.url.rstrip("/") != self.url:
+                self.navigate_to_home()
+            index = dict(self.page.eval_on_selector_all(self.available_examples, self.ROUTE_INDEX_SCRIPT))
+            self._route_index[self.url] = index
+        return index
+
+    def resolve_example(self, example_name: str) -> str:
+        """Resolve an example name, alias or partial name to its URL."""
+        return self._match_example(self.get_route_index(), example_name)
+
+    @retryable()
     def navigate_to_example(self, example_name: str) -> None:
-        """Navigate to a specific example page."""
-        # First try exact match
-        link = self.page.get_by_text(example_name, exact=True)
-        if link.count() > 0:
-            link.click()
-            return
-            
-        # Then try case-insensitive partial match with common variations
-        variations = [
-            example_name,
-            example_name.lower(),
-            example_name.title(),
-            example_name.replace(" ", ""),
-            "Sortable Tables" if example_name == "Sortable Data Tables" else example_name,
-            "Data Tables" if example_name == "Tables" else example_name,
-            "Status Codes" if example_name == "Status Code" else example_name
-        ]
-        
-        elements = self.page.query_selector_all(self.available_examples)
-        for element in elements:
-            element_text = element.text_content().strip()
-            if any(var.lower() in element_text.lower() for var in variations):
-                element.click()
-                return
-                
-        # Try to find by URL pattern
-        if example_name == "Data Tables":
-            self.page.goto(f"{self.url}/tables")
-            return
-        elif example_name == "Status Codes":
-            self.page.goto(f"{self.url}/status_codes")
-            return
-                
-        raise ValueError(f"Example '{example_name}' not found")
+        """Navigate to a specific example page, staying put if it is already open; retried on transient errors."""
+        url = self.resolve_example(example_name)
+        if self.page.url != url:
+            self.page.goto(url)
 
     def login(self, username: str, password: str) -> None:
         """Perform login with given credentials."""
@@ -125,6 +155,11 @@ class HerokuappPage(BasePage):
         self.fill(self.password_input, password)
         self.click(self.login_button)
         
+    def open_secure_area(self) -> bool:
+        """Open the secure area directly; returns False if the session is not logged in."""
+        self.navigate(f"{self.url}/secure")
+        return self.verify_secure_page()
+        
     def get_flash_message(self) -> str:
         """Get the flash message text."""
         return self.get_text(self.flash_message)
@@ -199,14 +234,15 @@ class HerokuappPage(BasePage):
         
     def verify_secure_page(self) -> bool:
         """Verify that we're on the secure page."""
-        return "secure" in self.page.url and "Secure Area" in self.get_text(self.subheading)
+        if "secure" not in self.page.url:
+            return False
+        subheading = self.query_elements({"subheading": self.subheading}, wait=True)["subheading"]
+        return "Secure Area" in (subheading.text or "")
         
     def verify_page_loaded(self) -> bool:
         """Verify that the page has loaded successfully."""
-        return (
-            self.is_element_visible(self.heading) and
-            "Welcome to the-internet" in self.get_text(self.heading)
-        )
+        heading = self.query_elements({"heading": self.heading}, wait=True)["heading"]
+        return heading.visible and "Welcome to the-internet" in (heading.text or "")
 
     def press_key(self, key: str) -> str:
         """Press a key and get the result."""
@@ -235,7 +271,7 @@ class HerokuappPage(BasePage):
             node.dispatchEvent(new Event('input', {{ bubbles: true }}));
             node.dispatchEvent(new Event('change', {{ bubbles: true }}));
         }}""")
-        self.page.wait_for_timeout(500)  # Wait for the value to update
+        self.wait_for_text(self.slider_value, f"{value:g}")
 
     def get_slider_value(self) -> float:
         """Get the current slider value."""
@@ -244,27 +280,15 @@ class HerokuappPage(BasePage):
 
     def get_table_data(self) -> List[Dict[str, str]]:
         """Get table data as a list of dictionaries."""
+        return self.get_table_columns().rows()
+
+    def get_table_columns(self, chunk_size: Optional[int] = None) -> TableData:
+        """Get table data column by column, read in one evaluation (or one per `chunk_size` rows)."""
         self.navigate_to_example("Data Tables")
-        
+
         # Wait for the table to be visible
         self.page.wait_for_selector(self.table)
-        
-        # Get headers
-        headers = [header.text_content().strip() 
-                  for header in self.page.query_selector_all(self.table_headers)]
-        
-        # Get rows
-        rows = self.page.query_selector_all(self.table_rows)
-        table_data = []
-        
-        for row in rows:
-            cells = row.query_selector_all(self.table_cells)
-            row_data = {}
-            for header, cell in zip(headers, cells):
-                row_data[header] = cell.text_content().strip()
-            table_data.append(row_data)
-            
-        return table_data
+        return self.get_table(self.table, chunk_size)
 
     def sort_table_by_column(self, column_name: str) -> None:
         """Sort table by clicking on a column header."""
@@ -280,23 +304,25 @@ class HerokuappPage(BasePage):
                 break
 
     def check_status_code(self, code: int) -> bool:
-        """Check a specific status code page."""
-        try:
-            # Navigate directly to the status code page
-            self.page.goto(f"{self.url}/status_codes/{code}")
-            # Wait for the page to load
-            self.page.wait_for_load_state("networkidle")
-            # Verify we're on the correct page
-            current_url = self.page.url
-            return str(code) in current_url and "status_codes" in current_url
-        except Exception as e:
-            print(f"Error accessing status code {code}: {str(e)}")
-            return False
+        """Check that a status code page responds with its code, without rendering it."""
+        return self.check_status_codes([code])[code]
+
+    def check_status_codes(self, codes: List[int]) -> Dict[int, bool]:
+        """
+        Check several status code pages concurrently through the context's request API.
+
+        A page counts as responding when it returns its own code; use check_responses
+        for the error of a request that failed outright.
+        """
+        checks = self.check_responses([self.status_code_url(code) for code in codes])
+        return {code: check.status == code for code, check in zip(codes, checks)}
 
     def verify_status_code_message(self, code: int) -> str:
-        """Get the message from a status code page."""
+        """Get the message from a status code page, rendering it since the message is read from the DOM."""
         try:
-            self.check_status_code(code)
+            url = self.status_code_url(code)
+            if self.page.url != url:
+                self.page.goto(url)
             message = self.page.locator("p").text_content()
             return message.strip()
         except Exception:
@@ -0,0 +1,272 @@
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from pages.private_api import connection_of
+
+# Profiler the page objects report to; None keeps instrumentation to a single check per call
+_active_profiler: Optional["ActionProfiler"] = None
+
+# Nesting of the instrumented call currently running, per thread / asyncio task
+_current_action: ContextVar[Optional["ActionRecord"]] = ContextVar("current_action", default=None)
+
+
+@dataclass
+class ActionRecord:
+    """One page-object action: its wall time, driver round trips and selector."""
+
+    action: str
+    page_object: str
+    selector: Optional[str] = None
+    seconds: float = 0.0
+    round_trips: int = 0
+    depth: int = 0
+    failed: bool = False
+
+
+@dataclass
+class ActionTotals:
+    """Aggregated timings for one action type or selector."""
+
+    count: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    round_trips: int = 0
+
+    def add(self, seconds: float, round_trips: int, count: int = 1, max_seconds: Optional[float] = None) -> None:
+        self.count += count
+        self.seconds += seconds
+        self.round_trips += round_trips
+        self.max_seconds = max(self.max_seconds, seconds if max_seconds is None else max_seconds)
+
+
+class ActionProfiler:
+    """
+    Records every instrumented page-object action while it is active.
+
+    Round trips are counted at the driver connection, so they include the calls page
+    objects make on `self.page` directly (waits, locators, evaluate). Nested actions,
+    e.g. `navigate` inside `navigate_to_example`, are recorded with their depth and
+    their times include the nested calls. Counting patches a private connection
+    method, so on Playwright releases outside PRIVATE_API_VERSIONS round trips stay 0.
+    """
+
+    def __init__(self):
+        self.records: List[ActionRecord] = []
+
+    @staticmethod
+    def watch(page: Any) -> None:
+        """Count the driver messages sent on the page's connection, once per connection."""
+        connection = connection_of(page)
+        if connection is None or getattr(connection, "_action_profiler_hook", False):
+            return
+        send = connection._send_message_to_server
+
+        def counting_send(object, method, params, *args, **kwargs):
+            action = _current_action.get()
+            if action is not None and _active_profiler is not None:
+                action.round_trips += 1
+                if action.selector is None and isinstance(params, dict):
+                    action.selector = params.get("selector")
+            return send(object, method, params, *args, **kwargs)
+
+        connection._send_message_to_server = counting_send
+        connection._action_profiler_hook = True
+
+    @contextmanager
+    def action(self, page_object: Any, action: str, selector: Optional[str]) -> Iterator[ActionRecord]:
+        """
+        Record one action; round trips of nested actions are folded into their parent.
+
+        Without a selector argument, the action is attributed to the first selector
+        it sends to the driver itself.
+        """
+        record = self.open(page_object, action, selector)
+        try:
+            with self.step(record):
+                yield record
+        finally:
+            self.records.append(record)
+
+    def open(self, page_object: Any, action: str, selector: Optional[str]) -> ActionRecord:
+        """Start a record for an action that runs in several steps, such as a generator's iterations."""
+        page = getattr(page_object, "page", None)
+        if page is not None:
+            self.watch(page)
+        parent = _current_action.get()
+        return ActionRecord(
+            action=action,
+            page_object=type(page_object).__name__,
+            selector=selector,
+            depth=0 if parent is None else parent.depth + 1,
+        )
+
+    @contextmanager
+    def step(self, record: ActionRecord) -> Iterator[ActionRecord]:
+        """Add one step's time and round trips to a record; the caller appends it to `records` when done."""
+        parent = _current_action.get()
+        round_trips = record.round_trips
+        token = _current_action.set(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record.failed = True
+            raise
+        finally:
+            record.seconds += time.perf_counter() - start
+            _current_action.reset(token)
+            if parent is not None:
+                parent.round_trips += record.round_trips - round_trips
+
+    def summary(self) -> Dict:
+        """Aggregate the records by action type and by selector, plus top-level totals."""
+        top_level = [record for record in self.records if record.depth == 0]
+        return {
+            "seconds": sum(record.seconds for record in top_level),
+            "round_trips": sum(record.round_trips for record in top_level),
+            "actions": {name: asdict(totals) for name, totals in _group(self.records, "action").items()},
+            "selectors": {name: asdict(totals) for name, totals in _group(self.records, "selector").items()},
+            "records": [asdict(record) for record in self.records],
+        }
+
+
+def _group(records: List[ActionRecord], key: str) -> Dict[str, ActionTotals]:
+    groups: Dict[str, ActionTotals] = {}
+    for record in records:
+        name = getattr(record, key)
+        if key == "action":
+            name = f"{record.page_object}.{name}"
+        if name is not None:
+            groups.setdefault(name, ActionTotals()).add(record.seconds, record.round_trips)
+    return groups
+
+
+def set_profiler(profiler: Optional[ActionProfiler]) -> None:
+    """Make page objects report to a profiler, or stop reporting with None."""
+    global _active_profiler
+    _active_profiler = profiler
+
+
+def get_profiler() -> Optional[ActionProfiler]:
+    """Get the profiler page objects currently report to."""
+    return _active_profiler
+
+
+def _selector_of(signature: inspect.Signature) -> Callable[[tuple, dict], Optional[str]]:
+    """Build a cheap lookup for the argument naming the element an action targets."""
+    names = list(signature.parameters)
+    for name in ("selector", "selectors"):
+        if name in names:
+            index = names.index(name)
+
+            def lookup(args, kwargs, name=name, index=index):
+                value = kwargs.get(name, args[index] if len(args) > index else None)
+                if isinstance(value, dict):
+                    return ", ".join(value.values())
+                return value
+
+            return lookup
+    return lambda args, kwargs: None
+
+
+def instrumented(func: Callable) -> Callable:
+    """
+    Time a page-object method whenever a profiler is active.
+
+    A generator method is recorded as one action covering all of its iterations;
+    only the time spent producing items counts, not the caller's work between them.
+    """
+    action = func.__name__
+    selector_of = _selector_of(inspect.signature(func))
+
+    if inspect.isasyncgenfunction(func):
+        @wraps(func)
+        async def async_generator_wrapper(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                async for item in func(*args, **kwargs):
+                    yield item
+                return
+            record = profiler.open(args[0], action, selector_of(args, kwargs))
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    with profiler.step(record):
+                        try:
+                            item = await generator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                    yield item
+            finally:
+                await generator.aclose()
+                profiler.records.append(record)
+
+        async_generator_wrapper.__instrumented__ = True
+        return async_generator_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        @wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                return (yield from func(*args, **kwargs))
+            record = profiler.open(args[0], action, selector_of(args, kwargs))
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    with profiler.step(record):
+                        try:
+                            item = next(generator)
+                        except StopIteration as stop:
+                            return stop.value
+                    yield item
+            finally:
+                generator.close()
+                profiler.records.append(record)
+
+        generator_wrapper.__instrumented__ = True
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                return await func(*args, **kwargs)
+            with profiler.action(args[0], action, selector_of(args, kwargs)):
+                return await func(*args, **kwargs)
+
+        async_wrapper.__instrumented__ = True
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _active_profiler
+        if profiler is None:
+            return func(*args, **kwargs)
+        with profiler.action(args[0], action, selector_of(args, kwargs)):
+            return func(*args, **kwargs)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def instrument_class(cls: type) -> type:
+    """Wrap the public methods a class defines with `instrumented`."""
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(value) or getattr(value, "__instrumented__", False):
+            continue
+        setattr(cls, name, instrumented(value))
+    return cls
+
+
+class InstrumentedPage:
+    """Base for page objects: every public method of every subclass is instrumented."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
@@ -0,0 +1,43 @@
+"""
+Checked access to Playwright internals.
+
+Everything that reaches past Playwright's public API goes through this module, so
+an upgrade that changes the internals is checked in one place. Callers either fail
+with `require_private_api` or fall back to working without the internals.
+"""
+from functools import lru_cache
+from importlib.metadata import version
+from typing import Any, Optional
+
+# Playwright releases whose internals (`_impl_obj`, `_sync`, the driver connection's
+# `_send_message_to_server` and `_transport`, a context's `_bindings` and async
+# `add_init_script`) were verified; extend after checking a new release still has them
+PRIVATE_API_VERSIONS = ("1.42",)
+
+
+@lru_cache(maxsize=None)
+def private_api_supported() -> bool:
+    """Whether the installed Playwright is a release the internals were verified on."""
+    installed = version("playwright")
+    return any(installed == supported or installed.startswith(f"{supported}.") for supported in PRIVATE_API_VERSIONS)
+
+
+def require_private_api(feature: str) -> None:
+    """Fail with a clear message if `feature` can't rely on the installed Playwright's internals."""
+    if not private_api_supported():
+        raise RuntimeError(
+            f"{feature} use Playwright internals verified on {', '.join(PRIVATE_API_VERSIONS)}, but "
+            f"{version('playwright')} is installed; check they still exist, then update PRIVATE_API_VERSIONS"
+        )
+
+
+def impl_of(obj: Any) -> Optional[Any]:
+    """The implementation object behind a sync or async API object, or None on an unverified release."""
+    if not private_api_supported():
+        return None
+    return getattr(obj, "_impl_obj", None)
+
+
+def connection_of(obj: Any) -> Optional[Any]:
+    """The driver connection an API object talks over, or None on an unverified release."""
+    return getattr(impl_of(obj), "_connection", None)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+from playwright.async_api import APIRequestContext as AsyncAPIRequestContext
+from playwright.sync_api import APIRequestContext
+from pages.private_api import require_private_api
+
+# Checks in flight at once per browser context
+DEFAULT_CHECK_CONCURRENCY = 16
+
+
+@dataclass
+class ResponseCheck:
+    """Outcome of requesting one URL without rendering it, returned by BasePage.check_responses."""
+    url: str
+    status: Optional[int] = None
+    status_text: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[str] = None
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None  # set when the request itself failed
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300
+
+    @property
+    def redirected(self) -> bool:
+        return self.status is not None and 300 <= self.status < 400
+
+    @property
+    def location(self) -> Optional[str]:
+        return self.headers.get("location")
+
+
+def _request_impl(request: Any) -> Any:
+    """
+    The implementation object behind a sync or async APIRequestContext.
+
+    The only place that reaches into Playwright internals for response checks, so an
+    upgrade that changes them fails here with a clear message instead of misbehaving.
+    """
+    require_private_api("Response checks")
+    return request._impl_obj
+
+
+def check_responses_sync(request: APIRequestContext, urls: Sequence[str], *args, **kwargs) -> List[ResponseCheck]:
+    """
+    Run check_responses from the sync API; see check_responses for the arguments.
+
+    The sync API can only wait on one call at a time, so the whole batch runs as one
+    coroutine on the implementation object, through the sync wrapper's event loop.
+    """
+    return request._sync(_check_responses(_request_impl(request), urls, *args, **kwargs))
+
+
+async def check_responses(request: AsyncAPIRequestContext, urls: Sequence[str], *args, **kwargs) -> List[ResponseCheck]:
+    """
+    GET every URL through a browser context's API request context, `concurrency` at a time.
+
+    The request context (BrowserContext.request) shares the browser context's cookies,
+    so checks run as the logged-in user.
+
+    Args:
+        urls: URLs to GET
+        max_redirects: Redirects to follow; 0 reports a 3xx response as is
+        read_body: Also read each response body as text
+        timeout: Maximum time per request in milliseconds
+        concurrency: Requests in flight at once
+    """
+    return await _check_responses(_request_impl(request), urls, *args, **kwargs)
+
+
+async def _check_responses(
+    request: Any,
+    urls: Sequence[str],
+    max_redirects: int = 0,
+    read_body: bool = False,
+    timeout: Optional[float] = None,
+    concurrency: int = DEFAULT_CHECK_CONCURRENCY,
+) -> List[ResponseCheck]:
+    semaphore = asyncio.Semaphore(concurrency)
+    options = {"failOnStatusCode": False, "maxRedirects": max_redirects}
+    if timeout is not None:
+        options["timeout"] = timeout
+
+    async def check(url: str) -> ResponseCheck:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await request.get(url, **options)
+            except Exception as e:
+                return ResponseCheck(url, error=str(e), elapsed_ms=(time.perf_counter() - started) * 1000)
+            try:
+                return ResponseCheck(
+                    url,
+                    status=response.status,
+                    status_text=response.status_text,
+                    headers=dict(response.headers),
+                    body=await response.text() if read_body else None,
+                    elapsed_ms=(time.perf_counter() - started) * 1000,
+                )
+            finally:
+                await response.dispose()
+
+    return list(await asyncio.gather(*(check(url) for url in urls)))
@@ -0,0 +1,175 @@
+import asyncio
+import inspect
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+# Playwright error messages of failures that can pass on their own: slow or interrupted
+# navigation, network errors and pages or frames that went away mid-call
+TRANSIENT_ERROR_PATTERN = re.compile(
+    r"Timeout \d+ms exceeded"
+    r"|net::ERR_|NS_ERROR_|WebKit encountered an internal error"
+    r"|Navigation failed because page (crashed|was closed)"
+    r"|Target (page, context or browser )?(has been |was )?closed"
+    r"|Frame was detached|frame got detached"
+    r"|Execution context was destroyed"
+    r"|interrupted by another navigation"
+    r"|Connection (refused|reset|closed)"
+    r"|ECONNRESET|ECONNREFUSED|socket hang up",
+    re.IGNORECASE,
+)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Classify an error as transient (worth retrying) or deterministic.
+
+    Timeouts, network errors and closed targets are transient. Assertion failures,
+    wrong selectors and everything else are deterministic and fail immediately.
+    """
+    if isinstance(error, (PlaywrightTimeoutError, ConnectionError, TimeoutError)):
+        return True
+    if isinstance(error, PlaywrightError):
+        return bool(TRANSIENT_ERROR_PATTERN.search(str(error.message or error)))
+    return False
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How often and how patiently to retry.
+
+    Delays grow exponentially from `base_delay` up to `max_delay`. With jitter, each
+    delay is drawn uniformly from [0, delay] ("full jitter"), so parallel workers hit
+    by the same outage don't retry in lockstep.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 5.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    classify: Callable[[BaseException], bool] = is_transient
+
+    def delay(self, retry: int) -> float:
+        """Seconds to wait before retry number `retry` (starting at 0)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** retry)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+@dataclass
+class StepRetries:
+    """Retry counters of one step (function or page-object method)."""
+
+    retries: int = 0
+    seconds: float = 0.0  # time lost to failed attempts and backoff
+    errors: Dict[str, int] = field(default_factory=dict)
+
+
+class RetryStats:
+    """Counts retries and the time they cost, per step, while it is active."""
+
+    def __init__(self):
+        self.steps: Dict[str, StepRetries] = {}
+
+    def record(self, step: str, error: BaseException, seconds: float) -> None:
+        stats = self.steps.setdefault(step, StepRetries())
+        stats.retries += 1
+        stats.seconds += seconds
+        name = type(error).__name__
+        stats.errors[name] = stats.errors.get(name, 0) + 1
+
+    @property
+    def retries(self) -> int:
+        return sum(stats.retries for stats in self.steps.values())
+
+    @property
+    def seconds(self) -> float:
+        return sum(stats.seconds for stats in self.steps.values())
+
+
+# Stats retries report to; None keeps retrying but stops counting
+_active_stats: Optional[RetryStats] = None
+
+
+def set_retry_stats(stats: Optional[RetryStats]) -> None:
+    """Make retries report to a RetryStats, or stop reporting with None."""
+    global _active_stats
+    _active_stats = stats
+
+
+def get_retry_stats() -> Optional[RetryStats]:
+    """Get the RetryStats retries currently report to."""
+    return _active_stats
+
+
+def _record(step: str, error: BaseException, seconds: float) -> None:
+    stats = _active_stats
+    if stats is not None:
+        stats.record(step, error, seconds)
+
+
+def call_with_retry(func: Callable, *args, policy: RetryPolicy = DEFAULT_POLICY, step: Optional[str] = None,
+                    **kwargs) -> Any:
+    """
+    Call `func`, retrying transient errors with backoff.
+
+    Deterministic errors, and transient ones on the last attempt, are raised as is.
+    """
+    step = step or func.__qualname__
+    for attempt in range(policy.max_attempts):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt + 1 >= policy.max_attempts or not policy.classify(e):
+                raise
+            time.sleep(policy.delay(attempt))  # wait-audit: ignore
+            _record(step, e, time.perf_counter() - started)
+
+
+async def async_call_with_retry(func: Callable, *args, policy: RetryPolicy = DEFAULT_POLICY,
+                                step: Optional[str] = None, **kwargs) -> Any:
+    """Async version of call_with_retry, for coroutine functions."""
+    step = step or func.__qualname__
+    for attempt in range(policy.max_attempts):
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt + 1 >= policy.max_attempts or not policy.classify(e):
+                raise
+            await asyncio.sleep(policy.delay(attempt))  # wait-audit: ignore
+            _record(step, e, time.perf_counter() - started)
+
+
+def retryable(policy: RetryPolicy = DEFAULT_POLICY) -> Callable[[Callable], Callable]:
+    """
+    Retry a function or page-object step on transient errors.
+
+    Only decorate steps that are safe to repeat, such as navigation; the retry then
+    re-runs the step instead of the whole test.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await async_call_with_retry(func, *args, policy=policy, step=func.__qualname__, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return call_with_retry(func, *args, policy=policy, step=func.__qualname__, **kwargs)
+
+        return wrapper
+
+    return decorate
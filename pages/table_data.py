@@ -0,0 +1,140 @@
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+# Reads the header and a slice of body rows of an HTML table column by column, in one
+# evaluation. table.rows is indexed directly, so reading a chunk costs only its rows.
+TABLE_CHUNK_SCRIPT = """({ selector, start, limit }) => {
+    const table = document.querySelector(selector);
+    if (!table) return null;
+    const headRows = table.tHead ? table.tHead.rows.length : 0;
+    const footRows = table.tFoot ? table.tFoot.rows.length : 0;
+    const end = table.rows.length - footRows;
+    const headerRow = headRows ? table.tHead.rows[headRows - 1] : null;
+    const headers = headerRow ? Array.from(headerRow.cells, cell => cell.textContent.trim()) : [];
+    const first = headRows + start;
+    const last = limit === null ? end : Math.min(end, first + limit);
+    const width = Math.max(headers.length, first < last ? table.rows[first].cells.length : 0);
+    const columns = Array.from({ length: width }, () => []);
+    for (let index = first; index < last; index++) {
+        const cells = table.rows[index].cells;
+        for (let column = 0; column < width; column++) {
+            columns[column].push(column < cells.length ? cells[column].textContent.trim() : "");
+        }
+    }
+    return { headers, columns, total: Math.max(end - headRows, 0) };
+}"""
+
+CURRENCY_SYMBOLS = ("$", "€", "£")
+
+
+class TableData:
+    """
+    An HTML table held column by column as NumPy string arrays.
+
+    Columns are named by their header text, or "column <n>" when the table has no
+    header. The checks run over whole columns at once instead of row by row.
+    """
+
+    def __init__(self, headers: List[str], columns: Dict[str, np.ndarray], total_rows: Optional[int] = None):
+        self.headers = headers
+        self.columns = columns
+        self.total_rows = total_rows if total_rows is not None else len(self)
+
+    @classmethod
+    def from_chunk(cls, chunk: Dict) -> "TableData":
+        """Build from the result of TABLE_CHUNK_SCRIPT."""
+        columns = chunk["columns"]
+        headers = list(chunk["headers"]) + [f"column {index + 1}" for index in range(len(chunk["headers"]), len(columns))]
+        return cls(headers, {
+            header: np.array(values, dtype=str) for header, values in zip(headers, columns)
+        }, chunk["total"])
+
+    @classmethod
+    def concat(cls, chunks: Iterable["TableData"]) -> "TableData":
+        """Join chunks of the same table in order."""
+        chunks = list(chunks)
+        if not chunks:
+            return cls([], {}, 0)
+        headers = chunks[0].headers
+        return cls(headers, {
+            header: np.concatenate([chunk.columns[header] for chunk in chunks]) for header in headers
+        }, chunks[0].total_rows)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, header: str) -> np.ndarray:
+        return self.columns[header]
+
+    def rows(self) -> List[Dict[str, str]]:
+        """The table as one dict per row, the shape get_table_data returns."""
+        return [dict(zip(self.headers, values)) for values in zip(*(self.columns[h].tolist() for h in self.headers))]
+
+    def to_numbers(self, header: str) -> np.ndarray:
+        """
+        A column as floats, ignoring currency signs, thousands separators and percent
+        signs; cells that aren't numbers become NaN.
+        """
+        cleaned = self.columns[header]
+        for symbol in CURRENCY_SYMBOLS + (",", "%"):
+            cleaned = np.char.replace(cleaned, symbol, "")
+        cleaned = np.char.strip(cleaned)
+        try:
+            return cleaned.astype(float)
+        except ValueError:
+            # Some cells aren't numeric: convert cell by cell
+            return np.array([_to_float(value) for value in cleaned.tolist()], dtype=float)
+
+    def is_sorted(self, header: str, descending: bool = False, numeric: bool = False) -> bool:
+        """Whether a column is in order, compared as text or, with `numeric`, as numbers."""
+        values = self.to_numbers(header) if numeric else self.columns[header]
+        if len(values) < 2:
+            return True
+        pairs = values[1:] <= values[:-1] if descending else values[:-1] <= values[1:]
+        return bool(np.all(pairs))
+
+    def is_unique(self, header: str) -> bool:
+        return len(np.unique(self.columns[header])) == len(self)
+
+    def duplicates(self, header: str) -> List[str]:
+        """Values that appear more than once in a column."""
+        values, counts = np.unique(self.columns[header], return_counts=True)
+        return values[counts > 1].tolist()
+
+    def matches_type(self, header: str, kind: str) -> np.ndarray:
+        """
+        Per-cell check of a column's type.
+
+        Args:
+            header: Column name
+            kind: "number", "currency" (a number with a leading currency sign), "email",
+                "url" or "non-empty"
+
+        Returns:
+            np.ndarray: Boolean mask, True where the cell matches
+        """
+        values = self.columns[header]
+        if kind in ("number", "currency"):
+            signed = np.zeros(len(values), dtype=bool)
+            for symbol in CURRENCY_SYMBOLS:
+                signed |= np.char.startswith(values, symbol)
+            return ~np.isnan(self.to_numbers(header)) & (signed if kind == "currency" else ~signed)
+        if kind == "email":
+            at = np.char.find(values, "@")
+            return (at > 0) & (np.char.rfind(values, ".") > at + 1) & (np.char.count(values, " ") == 0)
+        if kind == "url":
+            return np.char.startswith(values, "http://") | np.char.startswith(values, "https://")
+        if kind == "non-empty":
+            return np.char.str_len(values) > 0
+        raise ValueError(f"Unknown column type '{kind}'")
+
+    def has_type(self, header: str, kind: str) -> bool:
+        """Whether every cell of a column matches `kind`; see matches_type."""
+        return bool(np.all(self.matches_type(header, kind)))
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
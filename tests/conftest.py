@@ -1,8 +1,50 @@
+import glob
+import itertools
+import json
 import os
+import allure
 import pytest
-from typing import Dict, Generator
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Callable, Dict, Generator, List, Optional
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 from dotenv import load_dotenv
+from pages.herokuapp_page import HerokuappPage
+from pages.instrumentation import ActionProfiler, set_profiler
+from pages.private_api import connection_of
+from pages.retry import RetryStats, set_retry_stats
+from tests.utils.action_profile import ACTION_PROFILE_KEY, ActionProfile, ActionProfileXdistPlugin, write_action_profile
+from tests.utils.artifacts import flush_artifacts
+from tests.utils.async_runner import AsyncBrowserRunner, ContextSetup
+from tests.utils.auth_cache import AuthStateCache, restore_storage_state
+from tests.utils.browser_pool import BrowserPoolXdistPlugin, BrowserServerPool, PooledBrowser
+from tests.utils.context_pool import ContextPool, DeviceContextPool
+from tests.utils.cross_browser import ENGINES, CrossBrowserResult, CrossBrowserRunner
+from tests.utils.datasets import DatasetRow, dataset_params
+from tests.utils.duration_scheduler import GROUP_SEPARATOR, DurationSchedulerPlugin, DurationStore, fixture_group
+from tests.utils.sharding import SHARD_TIMINGS_FILE, ShardPlugin, ShardXdistPlugin, parse_shard
+from tests.utils.failure_capture import CAPTURE_MODES, CaptureMeter, FailureCapture, artifact_name
+from tests.utils.herokuapp_server import HerokuappServer
+from tests.utils.history import TestHistoryPlugin, TestHistoryXdistPlugin, new_run_id
+from tests.utils.network_cache import NETWORK_MODES, HarCache
+from tests.utils.perf_metrics import (
+    PERF_RESULTS_KEY,
+    PerformanceBudgets,
+    PerformanceRecorder,
+    PerformanceResults,
+    PerformanceResultsXdistPlugin,
+    write_performance_results,
+)
+from tests.utils.resource_profiles import RESOURCE_PROFILES, ResourceBlocker, ResourceSizes
+from tests.utils.run_stats import RUN_STATS_KEY, RunStats, RunStatsXdistPlugin, record_run_stats, write_run_stats
+from tests.utils.visual import (
+    VISUAL_RESULTS_KEY,
+    VisualChecker,
+    VisualComparator,
+    VisualResultsXdistPlugin,
+    write_visual_results,
+)
+from tests.utils.wait_audit import WaitAuditor
 
 # Load environment variables
 load_dotenv()
@@ -13,6 +55,37 @@ BROWSER_NAME = os.getenv('BROWSER', 'chromium')
 HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
 SLOW_MO = int(os.getenv('SLOW_MO', 0))
 BASE_URL = os.getenv('BASE_URL', 'https://example.com')
+HEROKUAPP_URL = os.getenv('HEROKUAPP_URL', 'http://the-internet.herokuapp.com')
+LOCAL_SERVER = os.getenv('LOCAL_SERVER', 'true').lower() == 'true'
+HAR_DIR = os.getenv('HAR_DIR', os.path.join('tests', 'har'))
+RESOURCE_SIZES_PATH = os.getenv('RESOURCE_SIZES_PATH', '.resource_sizes.json')
+BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', 0))
+CONTEXT_POOL = os.getenv('CONTEXT_POOL', 'true').lower() == 'true'
+RESPONSIVE_VIEWPORT_SWITCH = os.getenv('RESPONSIVE_VIEWPORT_SWITCH', 'false').lower() == 'true'
+HEROKUAPP_USERNAME = os.getenv('HEROKUAPP_USERNAME', 'tomsmith')
+HEROKUAPP_PASSWORD = os.getenv('HEROKUAPP_PASSWORD', 'SuperSecretPassword!')
+AUTH_STATE_DIR = os.getenv('AUTH_STATE_DIR', '.auth')
+AUTH_STATE_TTL = int(os.getenv('AUTH_STATE_TTL', 1800))
+PERF_BUDGETS_PATH = os.getenv('PERF_BUDGETS_PATH', os.path.join('config', 'performance_budgets.json'))
+PERF_RESULTS_DIR = os.getenv('PERF_RESULTS_DIR', os.path.join('reports', 'perf'))
+PERF_RUNS = int(os.getenv('PERF_RUNS', 5))
+HISTORY_DB = os.getenv('HISTORY_DB', os.path.join('reports', 'history.sqlite'))
+DURATIONS_PATH = os.getenv('DURATIONS_PATH', '.test_durations.json')
+SHARD_TIMINGS_PATH = os.getenv('SHARD_TIMINGS_PATH', os.path.join('reports', SHARD_TIMINGS_FILE))
+ACTION_PROFILE_PATH = os.getenv('ACTION_PROFILE_PATH', os.path.join('reports', 'action_profile.json'))
+TRACES_DIR = os.getenv('TRACES_DIR', os.path.join('reports', 'traces'))
+CAPTURE_WINDOW = int(os.getenv('CAPTURE_WINDOW', 50))
+CAPTURE_SCREENSHOTS = int(os.getenv('CAPTURE_SCREENSHOTS', 0))
+VISUAL_BASELINE_DIR = os.getenv('VISUAL_BASELINE_DIR', os.path.join('tests', 'visual_baselines'))
+VISUAL_OUTPUT_DIR = os.getenv('VISUAL_OUTPUT_DIR', os.path.join('reports', 'visual'))
+VISUAL_CACHE_DIR = os.getenv('VISUAL_CACHE_DIR', '.visual_cache')
+DATASET_CACHE_DIR = os.getenv('DATASET_CACHE_DIR', '.dataset_cache')
+VISUAL_THRESHOLD = int(os.getenv('VISUAL_THRESHOLD', 16))
+VISUAL_MAX_DIFF_RATIO = float(os.getenv('VISUAL_MAX_DIFF_RATIO', 0.001))
+
+BROWSER_POOL_KEY = pytest.StashKey[BrowserServerPool]()
+PHASE_REPORTS_KEY = pytest.StashKey[Dict[str, pytest.TestReport]]()
+RESOURCE_SIZES_KEY = pytest.StashKey[ResourceSizes]()
 
 # Device configurations for responsive testing
 DEVICES = {
@@ -21,8 +94,446 @@ DEVICES = {
     'desktop': {'viewport': {'width': 1920, 'height': 1080}},
 }
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--network",
+        choices=NETWORK_MODES,
+        default=os.getenv('NETWORK_MODE', 'live'),
+        help="live: use the network; record: capture responses into per-module HAR archives; "
+             "replay: serve responses from those archives without opening sockets",
+    )
+    parser.addoption(
+        "--browser-pool",
+        type=int,
+        default=BROWSER_POOL_SIZE,
+        help="Number of shared browser servers for all xdist workers on this node (0 = one browser per worker)",
+    )
+    parser.addoption(
+        "--resource-profile",
+        choices=list(RESOURCE_PROFILES),
+        default=os.getenv('RESOURCE_PROFILE', 'functional'),
+        help="Default request filtering profile; override per test with @pytest.mark.resource_profile(name)",
+    )
+    parser.addoption(
+        "--audit-waits",
+        action="store_true",
+        default=os.getenv('AUDIT_WAITS', 'false').lower() == 'true',
+        help="Time fixed sleeps and networkidle waits and report their cost per test",
+    )
+    parser.addoption(
+        "--history-db",
+        default=HISTORY_DB,
+        help="SQLite database that records every test result (empty to disable); "
+             "query it with python -m tests.utils.history",
+    )
+    parser.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        default=os.getenv('SCHEDULE_BY_DURATION', 'false').lower() == 'true',
+        help=f"Dispatch xdist work longest-first from the durations in {DURATIONS_PATH}, keeping tests "
+             "that share a device or login on one worker",
+    )
+    parser.addoption(
+        "--shard",
+        type=parse_shard,
+        default=os.getenv('SHARD') or None,
+        metavar="i/N",
+        help=f"Run only shard i of N, planned from the durations in {DURATIONS_PATH} so every machine "
+             "agrees on the split; merge the shards' reports with python -m tests.utils.sharding merge",
+    )
+    parser.addoption(
+        "--cross-browsers",
+        type=lambda value: [engine.strip() for engine in value.split(",") if engine.strip()],
+        default=os.getenv('CROSS_BROWSERS', ",".join(ENGINES)),
+        metavar="ENGINES",
+        help="Comma-separated engines that run_cross_browser runs each flow on concurrently",
+    )
+    parser.addoption(
+        "--profile-actions",
+        action="store_true",
+        default=os.getenv('PROFILE_ACTIONS', 'false').lower() == 'true',
+        help="Time every page-object action, attach per-test profiles to Allure and "
+             f"summarize the slowest actions and selectors (JSON in {ACTION_PROFILE_PATH})",
+    )
+    parser.addoption(
+        "--capture-mode",
+        choices=CAPTURE_MODES,
+        default=os.getenv('CAPTURE_MODE', 'trace'),
+        help=f"trace: buffer a trace, console and screenshots per test and write them to {TRACES_DIR} "
+             "only on failure; video: record video of every test; off: capture nothing",
+    )
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=os.getenv('UPDATE_BASELINES', 'false').lower() == 'true',
+        help=f"Write every screenshot compared by the visual fixture as the new baseline in {VISUAL_BASELINE_DIR}",
+    )
+    parser.addoption(
+        "--require-baselines",
+        action="store_true",
+        default=os.getenv('REQUIRE_BASELINES', 'false').lower() == 'true',
+        help="Fail visual comparisons that have no baseline instead of skipping them",
+    )
+    parser.addoption(
+        "--data-limit",
+        type=int,
+        default=int(os.environ['DATA_LIMIT']) if os.getenv('DATA_LIMIT') else None,
+        help="Run at most this many rows of each @pytest.mark.dataset dataset",
+    )
+    parser.addoption(
+        "--data-sample",
+        type=float,
+        default=float(os.environ['DATA_SAMPLE']) if os.getenv('DATA_SAMPLE') else None,
+        help="Run a deterministic fraction (0-1) of the rows of each dataset, e.g. 0.1 for smoke runs",
+    )
+    parser.addoption(
+        "--data-seed",
+        default=os.getenv('DATA_SEED', '0'),
+        help="Seed that picks which rows --data-sample keeps",
+    )
+
+def pytest_configure(config):
+    """Set up run-wide counters and start the shared browser server pool on the controlling process."""
+    config.stash[RUN_STATS_KEY] = RunStats()
+    config.stash[ACTION_PROFILE_KEY] = ActionProfile()
+    config.stash[PERF_RESULTS_KEY] = PerformanceResults()
+    config.stash[VISUAL_RESULTS_KEY] = []
+    resource_sizes = config.stash[RESOURCE_SIZES_KEY] = ResourceSizes(RESOURCE_SIZES_PATH)
+    if config.getoption("network") == "replay":
+        # The archives hold the sizes of exactly the responses replay would serve
+        for har in glob.glob(os.path.join(HAR_DIR, "*.har")):
+            resource_sizes.load_har(har)
+    if config.pluginmanager.hasplugin("xdist") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(RunStatsXdistPlugin(config.stash[RUN_STATS_KEY]))
+        config.pluginmanager.register(ActionProfileXdistPlugin(config.stash[ACTION_PROFILE_KEY]))
+        config.pluginmanager.register(PerformanceResultsXdistPlugin(config.stash[PERF_RESULTS_KEY]))
+        config.pluginmanager.register(VisualResultsXdistPlugin(config.stash[VISUAL_RESULTS_KEY]))
+
+    history_db = config.getoption("history_db")
+    if history_db:
+        run_id = config.workerinput["history_run_id"] if hasattr(config, "workerinput") else new_run_id()
+        config.pluginmanager.register(TestHistoryPlugin(history_db, run_id, BROWSER_NAME))
+        if config.pluginmanager.hasplugin("xdist") and not hasattr(config, "workerinput"):
+            config.pluginmanager.register(TestHistoryXdistPlugin(run_id))
+
+    if config.getoption("schedule_by_duration") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationSchedulerPlugin(DurationStore(DURATIONS_PATH)))
+
+    shard = config.getoption("shard")
+    if shard:
+        shard_plugin = ShardPlugin(*shard, DurationStore(DURATIONS_PATH), SHARD_TIMINGS_PATH)
+        config.pluginmanager.register(shard_plugin)
+        if config.pluginmanager.hasplugin("xdist") and not hasattr(config, "workerinput"):
+            config.pluginmanager.register(ShardXdistPlugin(shard_plugin))
+
+    pool_size = config.getoption("browser_pool")
+    if pool_size and not hasattr(config, "workerinput"):
+        pool = BrowserServerPool(pool_size, BROWSER_NAME, {"headless": HEADLESS})
+        pool.start()
+        config.stash[BROWSER_POOL_KEY] = pool
+        if config.pluginmanager.hasplugin("xdist"):
+            config.pluginmanager.register(BrowserPoolXdistPlugin(pool))
+
+def pytest_generate_tests(metafunc):
+    """Parametrize `data_row` from the dataset named by @pytest.mark.dataset, sharded across xdist workers."""
+    marker = metafunc.definition.get_closest_marker("dataset")
+    if marker is None or "data_row" not in metafunc.fixturenames:
+        return
+    config = metafunc.config
+    workers = config.workerinput.get("workercount", 1) if hasattr(config, "workerinput") else 1
+    metafunc.parametrize(
+        "data_row",
+        dataset_params(
+            marker.args[0],
+            limit=config.getoption("data_limit"),
+            sample=config.getoption("data_sample"),
+            seed=config.getoption("data_seed"),
+            shards=workers,
+            cache_dir=DATASET_CACHE_DIR,
+        ),
+        indirect=True,
+    )
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Run each module's responsive tests device by device, and on xdist workers tag tests
+    that share expensive fixtures so the duration scheduler keeps them together.
+    """
+    _group_by_device(items)
+    if not (config.getoption("schedule_by_duration") and hasattr(config, "workerinput")):
+        return
+    for item in items:
+        group = fixture_group(item)
+        if group:
+            item._nodeid = f"{item.nodeid}{GROUP_SEPARATOR}{group}"
+
+def _group_by_device(items) -> None:
+    """Reorder responsive_page tests in place so each device's tests run back to back, within their module."""
+    positions = [
+        index for index, item in enumerate(items)
+        if "responsive_page" in getattr(getattr(item, "callspec", None), "params", {})
+    ]
+    devices = list(DEVICES)
+    grouped = sorted(
+        (items[index] for index in positions),
+        key=lambda item: (item.nodeid.split("::")[0], devices.index(item.callspec.params["responsive_page"])),
+    )
+    for index, item in zip(positions, grouped):
+        items[index] = item
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Keep each phase's report on the item so fixtures can tell in teardown whether the test failed."""
+    outcome = yield
+    report = outcome.get_result()
+    item.stash.setdefault(PHASE_REPORTS_KEY, {})[report.when] = report
+
+def pytest_unconfigure(config):
+    pool = config.stash.get(BROWSER_POOL_KEY, None)
+    if pool is not None:
+        pool.stop()
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report run-wide counters and the browser server pool's cost next to an estimate for one browser per worker."""
+    write_run_stats(terminalreporter, config.stash[RUN_STATS_KEY])
+    _write_fixed_waits(terminalreporter)
+    _write_retry_costs(terminalreporter)
+    _write_browser_divergences(terminalreporter)
+    write_action_profile(terminalreporter, config.stash[ACTION_PROFILE_KEY])
+    write_performance_results(terminalreporter, config.stash[PERF_RESULTS_KEY])
+    write_visual_results(terminalreporter, config.stash[VISUAL_RESULTS_KEY])
+
+    pool = config.stash.get(BROWSER_POOL_KEY, None)
+    if pool is None:
+        return
+    stats = pool.stats()
+    mib = 1024 * 1024
+    terminalreporter.write_sep("-", "browser server pool")
+    terminalreporter.write_line(
+        f"{stats['servers']} servers for {stats['workers']} workers, {stats['restarts']} restarts"
+    )
+    terminalreporter.write_line(
+        f"pool startup: {stats['startup_wall_seconds']:.2f}s wall; browser launch time (summed over launches): "
+        f"{stats['launch_seconds']:.2f}s pooled vs ~{stats['estimated_per_worker_launch_seconds']:.2f}s "
+        "estimated for one browser per worker"
+    )
+    terminalreporter.write_line(
+        f"RSS: {stats['rss_bytes'] / mib:.0f} MiB pooled (measured) vs "
+        f"~{stats['estimated_per_worker_rss_bytes'] / mib:.0f} MiB estimated for one browser per worker "
+        f"(~{(stats['estimated_per_worker_rss_bytes'] - stats['rss_bytes']) / mib:.0f} MiB estimated saving)"
+    )
+
+def _write_fixed_waits(terminalreporter) -> None:
+    """List the tests that spent time in fixed waits, most expensive first."""
+    costs = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            for name, value in getattr(report, "user_properties", []):
+                if name == "fixed_wait_seconds" and value:
+                    costs[report.nodeid] = value
+    if not costs:
+        return
+    terminalreporter.write_sep("-", "fixed waits per test")
+    for nodeid, seconds in sorted(costs.items(), key=lambda item: item[1], reverse=True):
+        terminalreporter.write_line(f"{seconds:.3f}s {nodeid}")
+
+def _write_retry_costs(terminalreporter) -> None:
+    """List the tests whose steps were retried, by time lost to retrying."""
+    costs = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            properties = dict(getattr(report, "user_properties", []))
+            if properties.get("retries"):
+                costs[report.nodeid] = (properties["retry_seconds"], properties["retries"])
+    if not costs:
+        return
+    terminalreporter.write_sep("-", "retry cost per test")
+    for nodeid, (seconds, retries) in sorted(costs.items(), key=lambda item: item[1], reverse=True):
+        terminalreporter.write_line(f"{seconds:.3f}s {retries} retries {nodeid}")
+
+def _write_browser_divergences(terminalreporter) -> None:
+    """List the cross-browser tests whose engines disagreed, with each group of engines' outcome."""
+    divergences = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            for name, value in getattr(report, "user_properties", []):
+                if name == "browser_divergences" and value:
+                    divergences.setdefault(report.nodeid, []).extend(value)
+    if not divergences:
+        return
+    terminalreporter.write_sep("-", "cross-browser divergences")
+    for nodeid, runs in divergences.items():
+        terminalreporter.write_line(nodeid)
+        for run in runs:
+            for outcome, engines in run.items():
+                terminalreporter.write_line(f"  {', '.join(engines)}: {outcome}")
+
+@contextmanager
+def _resource_profile(context: BrowserContext, request) -> Generator[ResourceBlocker, None, None]:
+    """Apply the test's resource profile to a context and record what it blocked."""
+    marker = request.node.get_closest_marker("resource_profile")
+    profile = marker.args[0] if marker else request.config.getoption("resource_profile")
+    blocker = ResourceBlocker(profile, request.config.stash[RESOURCE_SIZES_KEY])
+    blocker.attach(context)
+    try:
+        yield blocker
+    finally:
+        blocker.detach(context)
+        request.node.user_properties.append(("resource_profile", profile))
+        request.node.user_properties.append(("blocked_requests", blocker.blocked_requests))
+        # Unknown rather than 0 when none of the blocked resources has a known size
+        all_unknown = blocker.blocked_requests and blocker.unknown_size_requests == blocker.blocked_requests
+        request.node.user_properties.append(("bytes_saved", None if all_unknown else blocker.bytes_saved))
+        request.node.user_properties.append(("blocked_unknown_size", blocker.unknown_size_requests))
+        record_run_stats(request.config, "resource blocking", {
+            "blocked_requests": blocker.blocked_requests,
+            "known_bytes_saved": blocker.bytes_saved,
+            "blocked_unknown_size": blocker.unknown_size_requests,
+            **{f"blocked_{resource_type}": count for resource_type, count in blocker.blocked_by_type.items()},
+        })
+
+@contextmanager
+def _failure_capture(context: BrowserContext, playwright: Playwright, request) -> Generator[None, None, None]:
+    """Buffer failure evidence for a test in trace mode and record what capturing cost."""
+    mode = request.config.getoption("capture_mode")
+    capture = FailureCapture(context, TRACES_DIR, CAPTURE_WINDOW, CAPTURE_SCREENSHOTS) if mode == "trace" else None
+    if capture:
+        capture.start(request.node.nodeid)
+    meter = CaptureMeter(_driver_pid(playwright))
+    meter.start()
+    try:
+        yield
+    finally:
+        reports = request.node.stash.get(PHASE_REPORTS_KEY, {})
+        failed = any(report.failed for report in reports.values())
+        if capture:
+            for path in capture.finish(failed, artifact_name(request.node.nodeid)):
+                if path.endswith(".zip"):
+                    allure.attach.file(path, name="trace", extension="zip")
+        cpu_seconds, disk_bytes, _ = meter.stop()
+        request.node.user_properties.append(("capture_mode", mode))
+        request.node.user_properties.append(("capture_cpu_seconds", cpu_seconds))
+        request.node.user_properties.append(("capture_disk_bytes", disk_bytes))
+        record_run_stats(request.config, f"capture ({mode})", {
+            "tests": 1,
+            "failures_captured": int(failed and capture is not None),
+            "cpu_seconds": cpu_seconds,
+            "disk_bytes": disk_bytes,
+        })
+
+def _driver_pid(playwright: Playwright) -> Optional[int]:
+    """Process id of the Playwright driver, whose children are the locally launched browsers; None if unknown."""
+    try:
+        return connection_of(playwright)._transport._proc.pid
+    except AttributeError:
+        return None
+
+def _browser_pool_endpoint(config) -> Optional[str]:
+    """Get the pool server endpoint assigned to this process, if pooling is enabled."""
+    if hasattr(config, "workerinput"):
+        return config.workerinput.get("browser_pool_endpoint")
+    pool = config.stash.get(BROWSER_POOL_KEY, None)
+    return pool.assign("main") if pool else None
+
+def pytest_sessionfinish(session):
+    """Wait for pending artifact writes, then merge HARs recorded by every worker once the whole run has finished."""
+    config = session.config
+    writer = flush_artifacts()
+    config.stash[RESOURCE_SIZES_KEY].save()
+    if writer is not None:
+        record_run_stats(config, "artifacts", {**writer.stats, "errors": len(writer.errors)})
+    if config.getoption("network") == "record" and not hasattr(config, "workerinput"):
+        HarCache("record", HAR_DIR).merge_partials()
+    if config.getoption("profile_actions") and not hasattr(config, "workerinput"):
+        config.stash[ACTION_PROFILE_KEY].export(ACTION_PROFILE_PATH)
+    perf_results = config.stash[PERF_RESULTS_KEY]
+    if perf_results.pages and not hasattr(config, "workerinput"):
+        perf_results.save(PERF_RESULTS_DIR)
+
+@pytest.fixture
+def performance(request) -> Generator[PerformanceRecorder, None, None]:
+    """Fixture to measure repeated page loads against the budgets in config/performance_budgets.json."""
+    results = request.config.stash[PERF_RESULTS_KEY]
+    yield PerformanceRecorder(PerformanceBudgets.load(PERF_BUDGETS_PATH), results, PERF_RUNS)
+    if hasattr(request.config, "workeroutput"):
+        request.config.workeroutput["perf_results"] = results.pages
+
+@pytest.fixture
+def data_row(request) -> Dict:
+    """Fixture to load the dataset row a @pytest.mark.dataset test was parametrized with."""
+    row: DatasetRow = request.param
+    return row.load()
+
+@pytest.fixture
+def visual(request) -> Generator[VisualChecker, None, None]:
+    """Fixture to compare page-object screenshots with the baselines in tests/visual_baselines."""
+    comparator = VisualComparator(
+        VISUAL_BASELINE_DIR,
+        VISUAL_OUTPUT_DIR,
+        threshold=VISUAL_THRESHOLD,
+        max_diff_ratio=VISUAL_MAX_DIFF_RATIO,
+        update=request.config.getoption("update_baselines"),
+        cache_dir=VISUAL_CACHE_DIR,
+    )
+    checker = VisualChecker(
+        comparator, prefix=f"{BROWSER_NAME}/", require_baselines=request.config.getoption("require_baselines")
+    )
+    yield checker
+    results = request.config.stash[VISUAL_RESULTS_KEY]
+    for result in checker.results:
+        results.append(asdict(result))
+        for name, path in (("actual", result.actual_path), ("diff", result.diff_path)):
+            if path:
+                allure.attach.file(path, name=f"{result.name} {name}", attachment_type=allure.attachment_type.PNG)
+    if hasattr(request.config, "workeroutput"):
+        request.config.workeroutput["visual_results"] = results
+
+@pytest.fixture(autouse=True)
+def retry_stats(request) -> Generator[RetryStats, None, None]:
+    """Count the retries of each test's steps and the time they cost."""
+    stats = RetryStats()
+    set_retry_stats(stats)
+    try:
+        yield stats
+    finally:
+        set_retry_stats(None)
+        if stats.steps:
+            request.node.user_properties.append(("retries", stats.retries))
+            request.node.user_properties.append(("retry_seconds", round(stats.seconds, 3)))
+            request.node.user_properties.append(("retried_steps", {
+                step: {"retries": step_stats.retries, "seconds": round(step_stats.seconds, 3), "errors": step_stats.errors}
+                for step, step_stats in stats.steps.items()
+            }))
+            record_run_stats(request.config, "retries", {
+                "tests_retried": 1,
+                "retries": stats.retries,
+                "seconds": stats.seconds,
+                **{f"retries {step}": step_stats.retries for step, step_stats in stats.steps.items()},
+            })
+
+@pytest.fixture(autouse=True)
+def action_profiler(request) -> Generator[Optional[ActionProfiler], None, None]:
+    """Profile the page-object actions of each test when --profile-actions is set."""
+    if not request.config.getoption("profile_actions"):
+        yield None
+        return
+    profiler = ActionProfiler()
+    set_profiler(profiler)
+    try:
+        yield profiler
+    finally:
+        set_profiler(None)
+        summary = profiler.summary()
+        allure.attach(
+            json.dumps(summary, indent=2), name="action profile", attachment_type=allure.attachment_type.JSON
+        )
+        profile = request.config.stash[ACTION_PROFILE_KEY]
+        profile.add_test(request.node.nodeid, summary)
+        if hasattr(request.config, "workeroutput"):
+            request.config.workeroutput["action_profile"] = profile.to_dict()
+
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args: Dict) -> Dict:
+def browser_context_args(browser_context_args: Dict, pytestconfig) -> Dict:
     """Fixture to set default browser context arguments."""
     return {
         **browser_context_args,
@@ -30,7 +541,7 @@ def browser_context_args(browser_context_args: Dict) -> Dict:
             "width": 1920,
             "height": 1080,
         },
-        "record_video_dir": "reports/videos" if os.getenv('VIDEO_ON_FAILURE', 'true').lower() == 'true' else None,
+        "record_video_dir": "reports/videos" if pytestconfig.getoption("capture_mode") == "video" else None,
     }
 
 @pytest.fixture(scope="session")
@@ -41,40 +552,228 @@ def browser_type_launch_args():
     }
 
 @pytest.fixture(scope="session")
-def browser(playwright: Playwright) -> Generator[Browser, None, None]:
-    """Fixture to launch browser."""
-    browser = getattr(playwright, BROWSER_NAME).launch(
-        headless=HEADLESS,
-        slow_mo=SLOW_MO,
-    )
+def browser(playwright: Playwright, pytestconfig) -> Generator[Browser, None, None]:
+    """Fixture to launch browser, or connect to the shared browser server pool."""
+    endpoint = _browser_pool_endpoint(pytestconfig)
+    if endpoint:
+        browser = PooledBrowser(getattr(playwright, BROWSER_NAME), endpoint, slow_mo=SLOW_MO)
+    else:
+        browser = getattr(playwright, BROWSER_NAME).launch(
+            headless=HEADLESS,
+            slow_mo=SLOW_MO,
+        )
     yield browser
     browser.close()
 
+@pytest.fixture(scope="session")
+def har_cache(pytestconfig) -> HarCache:
+    """Fixture to get the HAR cache for the selected --network mode."""
+    return HarCache(pytestconfig.getoption("network"), HAR_DIR)
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, browser_context_args: Dict, pytestconfig) -> Generator[Optional[ContextPool], None, None]:
+    """Fixture to keep reusable browser contexts for this worker."""
+    # Recorded HARs are only written when a context closes, so recording needs fresh contexts.
+    if not CONTEXT_POOL or pytestconfig.getoption("network") == "record":
+        yield None
+        return
+    pool = ContextPool(browser, browser_context_args)
+    yield pool
+    pool.close()
+    record_run_stats(pytestconfig, "context pool", pool.stats)
+
 @pytest.fixture
-def context(browser: Browser, browser_context_args: Dict) -> Generator[BrowserContext, None, None]:
-    """Fixture to create new browser context."""
-    context = browser.new_context(**browser_context_args)
-    yield context
-    context.close()
+def context(
+    playwright: Playwright,
+    browser: Browser,
+    browser_context_args: Dict,
+    context_pool: Optional[ContextPool],
+    har_cache: HarCache,
+    request,
+) -> Generator[BrowserContext, None, None]:
+    """Fixture to get a clean browser context, reused from the pool when enabled."""
+    fresh = request.node.get_closest_marker("fresh_context") is not None
+    if context_pool is None:
+        context = browser.new_context(**browser_context_args)
+    else:
+        context = context_pool.acquire(fresh=fresh)
+    har_cache.attach(context, request.module.__name__, request.node.nodeid)
+    with _resource_profile(context, request), _failure_capture(context, playwright, request):
+        yield context
+    if context_pool is None:
+        context.close()
+    else:
+        context_pool.release(context, reusable=not fresh)
 
 @pytest.fixture
-def page(context: BrowserContext) -> Generator[Page, None, None]:
+def page(context: BrowserContext, request) -> Generator[Page, None, None]:
     """Fixture to create new page."""
     page = context.new_page()
     page.set_default_timeout(DEFAULT_TIMEOUT)
+    if not request.config.getoption("audit_waits"):
+        yield page
+        return
+    auditor = WaitAuditor()
+    auditor.attach(page)
     yield page
+    request.node.user_properties.append(("fixed_wait_seconds", round(auditor.seconds, 3)))
+    record_run_stats(request.config, "fixed waits", {"calls": len(auditor.calls), "seconds": auditor.seconds})
+
+@pytest.fixture(scope="session")
+def device_context_pool(browser: Browser, pytestconfig) -> Generator[Optional[DeviceContextPool], None, None]:
+    """Fixture to keep one reusable browser context per responsive device for this worker."""
+    # Recorded HARs are only written when a context closes, so recording needs fresh contexts.
+    if not CONTEXT_POOL or pytestconfig.getoption("network") == "record":
+        yield None
+        return
+    pool = DeviceContextPool(browser, DEVICES, switch_viewports=RESPONSIVE_VIEWPORT_SWITCH)
+    yield pool
+    pool.close()
+    record_run_stats(pytestconfig, "device context pool", pool.stats)
 
 @pytest.fixture(params=DEVICES.keys())
-def responsive_page(browser: Browser, request) -> Generator[Page, None, None]:
-    """Fixture for responsive testing across different device sizes."""
-    device_config = DEVICES[request.param]
-    context = browser.new_context(**device_config)
-    page = context.new_page()
-    page.set_default_timeout(DEFAULT_TIMEOUT)
-    yield page
-    context.close()
+def responsive_page(
+    playwright: Playwright,
+    browser: Browser,
+    device_context_pool: Optional[DeviceContextPool],
+    har_cache: HarCache,
+    request,
+) -> Generator[Page, None, None]:
+    """Fixture for responsive testing across different device sizes, on a context reused per device."""
+    device = request.param
+    fresh = request.node.get_closest_marker("fresh_context") is not None
+    if device_context_pool is None:
+        context = browser.new_context(**DEVICES[device])
+    else:
+        context = device_context_pool.acquire(device, fresh=fresh)
+    har_cache.attach(context, request.module.__name__, request.node.nodeid)
+    with _resource_profile(context, request), _failure_capture(context, playwright, request):
+        if device_context_pool is None:
+            page = context.new_page()
+        else:
+            page = device_context_pool.new_page(device, context)
+        page.set_default_timeout(DEFAULT_TIMEOUT)
+        yield page
+    if device_context_pool is None:
+        context.close()
+    else:
+        device_context_pool.release(device, context, reusable=not fresh)
+
+@pytest.fixture(scope="session")
+def async_browser_runner(browser_context_args: Dict) -> Generator[AsyncBrowserRunner, None, None]:
+    """Fixture to launch an async browser on a background event loop."""
+    runner = AsyncBrowserRunner(
+        BROWSER_NAME,
+        {"headless": HEADLESS, "slow_mo": SLOW_MO},
+        browser_context_args,
+        DEFAULT_TIMEOUT,
+    ).start()
+    yield runner
+    runner.stop()
+
+def _har_setup(har_cache: HarCache, request) -> ContextSetup:
+    """Attach the test module's HAR to each async flow's context, with one partial per context when recording."""
+    contexts = itertools.count()
+    return lambda context, name: har_cache.attach_async(
+        context, request.module.__name__, f"{request.node.nodeid}-{name}-{next(contexts)}"
+    )
+
+@pytest.fixture
+def run_page_flows(async_browser_runner: AsyncBrowserRunner, har_cache: HarCache, request) -> Callable[..., List]:
+    """Fixture to run async page flows concurrently, each on its own context and page."""
+    setup = _har_setup(har_cache, request)
+    return lambda *flows: async_browser_runner.run_flows(list(flows), setup)
+
+@pytest.fixture(scope="session")
+def cross_browser_runner(browser_context_args: Dict, pytestconfig) -> Generator[CrossBrowserRunner, None, None]:
+    """Fixture to launch every --cross-browsers engine on one background event loop."""
+    runner = CrossBrowserRunner(
+        pytestconfig.getoption("cross_browsers"),
+        {"headless": HEADLESS, "slow_mo": SLOW_MO},
+        browser_context_args,
+        DEFAULT_TIMEOUT,
+    ).start()
+    yield runner
+    runner.stop()
+
+@pytest.fixture
+def run_cross_browser(
+    cross_browser_runner: CrossBrowserRunner, har_cache: HarCache, request
+) -> Generator[Callable[..., CrossBrowserResult], None, None]:
+    """Fixture to run an async page flow on every engine at once and report the results per engine."""
+    runs: List[CrossBrowserResult] = []
+    setup = _har_setup(har_cache, request)
+
+    def run(flow) -> CrossBrowserResult:
+        result = cross_browser_runner.run_across(flow, setup)
+        runs.append(result)
+        allure.attach(result.summary(), name=f"cross-browser run {len(runs)}", attachment_type=allure.attachment_type.TEXT)
+        return result
+
+    yield run
+    if not runs:
+        return
+    request.node.user_properties.append(("browser_results", [
+        {engine: {"passed": engine_result.passed, "seconds": round(engine_result.seconds, 3)}
+         for engine, engine_result in result.results.items()}
+        for result in runs
+    ]))
+    request.node.user_properties.append(("browser_divergences", [result.divergent for result in runs if result.divergent]))
+    record_run_stats(request.config, "cross-browser", {
+        "runs": len(runs),
+        "divergent_runs": sum(1 for result in runs if result.divergent),
+        "wall_seconds": sum(result.seconds for result in runs),
+        "sequential_seconds": sum(result.sequential_seconds for result in runs),
+        **{f"failures {engine}": sum(1 for result in runs if engine in result.failed)
+           for engine in cross_browser_runner.engines},
+    })
 
 @pytest.fixture(scope="session")
 def base_url() -> str:
     """Fixture to get base URL from environment variables."""
-    return BASE_URL 
\ No newline at end of file
+    return BASE_URL 
+
+@pytest.fixture(scope="session")
+def herokuapp_server(pytestconfig) -> Generator[Optional[HerokuappServer], None, None]:
+    """Fixture to start the local stand-in for the-internet.herokuapp.com."""
+    # HAR archives are keyed by URL, so record/replay always targets the real site.
+    if not LOCAL_SERVER or pytestconfig.getoption("network") != "live":
+        yield None
+        return
+    server = HerokuappServer().start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def herokuapp_url(herokuapp_server: Optional[HerokuappServer]) -> str:
+    """Fixture to get the Herokuapp base URL, local when the stand-in server is enabled."""
+    return herokuapp_server.url if herokuapp_server else HEROKUAPP_URL
+
+@pytest.fixture(scope="session")
+def auth_cache(herokuapp_server: Optional[HerokuappServer], herokuapp_url: str) -> Generator[AuthStateCache, None, None]:
+    """Fixture to get the on-disk cache of logged-in storage states."""
+    cache = AuthStateCache(AUTH_STATE_DIR, AUTH_STATE_TTL)
+    yield cache
+    # The local server's sessions and port die with it, so its states can never be reused
+    if herokuapp_server is not None:
+        cache.invalidate(herokuapp_url, HEROKUAPP_USERNAME)
+
+@pytest.fixture
+def authenticated_herokuapp(page: Page, herokuapp_url: str, auth_cache: AuthStateCache) -> Generator[HerokuappPage, None, None]:
+    """Fixture to create a HerokuappPage that is already logged in, reusing a cached session when possible."""
+    herokuapp = HerokuappPage(page, herokuapp_url)
+    state = auth_cache.load(herokuapp_url, HEROKUAPP_USERNAME)
+    if state:
+        restore_storage_state(page.context, state)
+        if herokuapp.open_secure_area():
+            yield herokuapp
+            return
+        # The secure page redirected back to /login, so the cached session is stale.
+        auth_cache.invalidate(herokuapp_url, HEROKUAPP_USERNAME)
+        page.context.clear_cookies()
+
+    herokuapp.navigate_to_home()
+    herokuapp.login(HEROKUAPP_USERNAME, HEROKUAPP_PASSWORD)
+    assert herokuapp.verify_secure_page(), "UI login failed"
+    auth_cache.save(herokuapp_url, HEROKUAPP_USERNAME, page.context.storage_state())
+    yield herokuapp
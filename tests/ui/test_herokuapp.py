@@ -1,13 +1,17 @@
 import pytest
 import allure
+from pages.async_herokuapp_page import AsyncHerokuappPage
 from pages.herokuapp_page import HerokuappPage
+from functools import partial
 import os
 from typing import Generator
 
 @pytest.fixture
-def herokuapp(page) -> Generator[HerokuappPage, None, None]:
+def herokuapp(page, herokuapp_url, har_cache) -> Generator[HerokuappPage, None, None]:
     """Fixture to create HerokuappPage instance."""
-    page_instance = HerokuappPage(page)
+    page_instance = HerokuappPage(page, herokuapp_url)
+    # The request API bypasses page routing, so HAR record/replay checks responses by navigating
+    page_instance.render_response_checks = har_cache.mode != "live"
     page_instance.navigate_to_home()
     yield page_instance
 
@@ -46,6 +50,31 @@ class TestAuthentication:
         with allure.step("Verify error message is displayed"):
             assert "Your username is invalid!" in herokuapp.get_flash_message()
 
+    @allure.title("Test login outcomes for each row of the credentials dataset")
+    @pytest.mark.dataset("credentials")
+    def test_login_dataset(self, herokuapp, data_row):
+        """
+        Test Steps:
+        1. Log in with the row's credentials
+        2. Verify the flash message and whether the secure area was reached
+        """
+        with allure.step(f"Login as '{data_row['username']}'"):
+            herokuapp.login(data_row["username"], data_row["password"])
+
+        with allure.step("Verify the outcome"):
+            assert data_row["message"] in herokuapp.get_flash_message()
+            assert herokuapp.verify_secure_page() == data_row["secure"]
+
+    @allure.title("Test secure area is reachable with a cached login")
+    def test_cached_login(self, authenticated_herokuapp):
+        """
+        Test Steps:
+        1. Get a logged-in page from the storage-state cache
+        2. Verify user is on secure page
+        """
+        with allure.step("Verify user is on secure page"):
+            assert authenticated_herokuapp.verify_secure_page()
+
 @allure.epic("Herokuapp Test Suite")
 @pytest.mark.dynamic
 class TestDynamicLoading:
@@ -220,6 +249,33 @@ class TestNavigation:
             assert len(examples) > 0
             assert "Form Authentication" in examples
 
+    @allure.title("Test example pages resolve from the route index")
+    def test_navigate_to_example_by_alias(self, herokuapp):
+        """
+        Test Steps:
+        1. Navigate to an example by its alias
+        2. Verify the example page is open
+        """
+        with allure.step("Navigate to 'Data Tables'"):
+            herokuapp.navigate_to_example("Data Tables")
+
+        with allure.step("Verify the Sortable Data Tables page is open"):
+            assert herokuapp.get_url().endswith("/tables")
+
+    @allure.title("Test homepage load stays within its performance budget")
+    def test_homepage_performance(self, herokuapp, performance):
+        """
+        Test Steps:
+        1. Load the homepage repeatedly and read browser-side metrics
+        2. Verify p50/p95/p99 are within the herokuapp_home budgets
+        """
+        with allure.step("Measure homepage load metrics"):
+            summary, violations = performance.measure("herokuapp_home", herokuapp, herokuapp.navigate_to_home)
+
+        with allure.step("Verify performance budgets"):
+            assert "load_ms" in summary
+            assert not violations, f"Performance budget exceeded: {'; '.join(violations)}"
+
 @allure.epic("Herokuapp Test Suite")
 @pytest.mark.keys
 class TestKeyPresses:
@@ -239,6 +295,14 @@ class TestKeyPresses:
                 expected = f"You entered: {key.upper()}"
                 assert expected in result, f"Expected '{expected}' but got '{result}'"
 
+    @allure.title("Test key press detection for each row of the keys dataset")
+    @pytest.mark.dataset("keys")
+    def test_key_press_dataset(self, herokuapp, data_row):
+        with allure.step(f"Press key: {data_row['key']}"):
+            result = herokuapp.press_key(data_row["key"])
+        expected = f"You entered: {data_row['expected']}"
+        assert expected in result, f"Expected '{expected}' but got '{result}'"
+
 @allure.epic("Herokuapp Test Suite")
 @pytest.mark.slider
 class TestHorizontalSlider:
@@ -258,6 +322,14 @@ class TestHorizontalSlider:
                 actual_value = herokuapp.get_slider_value()
                 assert actual_value == value, f"Expected {value} but got {actual_value}"
 
+    @allure.title("Test slider values for each row of the slider dataset")
+    @pytest.mark.dataset("slider")
+    def test_slider_dataset(self, herokuapp, data_row):
+        with allure.step(f"Set slider value to {data_row['value']}"):
+            herokuapp.set_slider_value(float(data_row["value"]))
+        actual_value = herokuapp.get_slider_value()
+        assert actual_value == float(data_row["expected"]), f"Expected {data_row['expected']} but got {actual_value}"
+
 @allure.epic("Herokuapp Test Suite")
 @pytest.mark.tables
 class TestSortableTables:
@@ -286,16 +358,41 @@ class TestSortableTables:
         4. Verify sorting
         """
         with allure.step("Get initial table data"):
-            initial_data = herokuapp.get_table_data()
+            initial_data = herokuapp.get_table_columns()
 
         with allure.step("Sort table by Last Name"):
             herokuapp.sort_table_by_column("Last Name")
-            sorted_data = herokuapp.get_table_data()
+            sorted_data = herokuapp.get_table_columns()
+
+        with allure.step("Verify sorting"):
+            assert sorted_data.is_sorted("Last Name"), "Table should be sorted by Last Name"
+            assert sorted(sorted_data["Last Name"]) == sorted(initial_data["Last Name"]), \
+                "Sorting should keep the same rows"
+            assert sorted_data.has_type("Email", "email"), "Email column should hold email addresses"
+            assert sorted_data.has_type("Due", "currency"), "Due column should hold amounts"
+
+    @allure.title("Test table sorting on every browser engine")
+    def test_table_sorting_across_browsers(self, run_cross_browser, herokuapp_url):
+        """
+        Test Steps:
+        1. Sort the table by Last Name on every engine at the same time
+        2. Verify sorting on every engine
+        3. Verify every engine sorted the same way
+        """
+        async def sort_by_last_name(page):
+            herokuapp = AsyncHerokuappPage(page, herokuapp_url)
+            await herokuapp.navigate_to_home()
+            await herokuapp.sort_table_by_column("Last Name")
+            return list((await herokuapp.get_table_columns())["Last Name"])
+
+        with allure.step("Sort table by Last Name on every engine"):
+            result = run_cross_browser(sort_by_last_name)
+            result.raise_for_failures()
 
         with allure.step("Verify sorting"):
-            initial_last_names = [row["Last Name"] for row in initial_data]
-            sorted_last_names = [row["Last Name"] for row in sorted_data]
-            assert sorted_last_names == sorted(initial_last_names), "Table should be sorted by Last Name"
+            for engine, last_names in result.values.items():
+                assert last_names == sorted(last_names), f"Table should be sorted by Last Name on {engine}"
+            assert not result.divergent, f"Engines sorted differently:\n{result.summary()}"
 
 @allure.epic("Herokuapp Test Suite")
 @pytest.mark.status
@@ -309,10 +406,34 @@ class TestStatusCodes:
         3. Verify status code pages
         """
         status_codes = [200, 301, 404, 500]
-        
+
+        with allure.step("Check all status codes through the request API"):
+            responding = herokuapp.check_status_codes(status_codes)
+
         for code in status_codes:
             with allure.step(f"Check status code {code}"):
-                assert herokuapp.check_status_code(code), f"Failed to access {code} status code page"
+                assert responding[code], f"Failed to access {code} status code page"
                 
                 message = herokuapp.verify_status_code_message(code)
-                assert str(code) in message, f"Status code {code} not found in message: {message}" 
\ No newline at end of file
+                assert str(code) in message, f"Status code {code} not found in message: {message}"
+
+    @allure.title("Test status code pages concurrently")
+    def test_status_codes_concurrently(self, run_page_flows, herokuapp_url):
+        """
+        Test Steps:
+        1. Open every status code page at the same time, each in its own page
+        2. Verify status code pages
+        """
+        status_codes = [200, 301, 404, 500]
+
+        async def check(page, code):
+            herokuapp = AsyncHerokuappPage(page, herokuapp_url)
+            return await herokuapp.check_status_code(code), await herokuapp.verify_status_code_message(code)
+
+        with allure.step("Check all status codes concurrently"):
+            results = run_page_flows(*(partial(check, code=code) for code in status_codes))
+
+        for code, (reachable, message) in zip(status_codes, results):
+            with allure.step(f"Verify status code {code}"):
+                assert reachable, f"Failed to access {code} status code page"
+                assert str(code) in message, f"Status code {code} not found in message: {message}"
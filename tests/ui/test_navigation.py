@@ -1,6 +1,5 @@
 import pytest
 from pages.example_page import ExamplePage
-import time
 
 @pytest.mark.ui
 @pytest.mark.navigation
@@ -36,15 +35,12 @@ class TestNavigation:
         
         assert expected_text in page.content(), f"Expected text '{expected_text}' not found on page"
 
-    def test_page_load_performance(self, page):
-        """Test page load performance."""
+    def test_page_load_performance(self, page, performance):
+        """Test page load performance against the example_home budgets."""
         example_page = ExamplePage(page)
         
-        # Measure page load time
-        start_time = time.time()
-        example_page.navigate_to_home()
-        example_page.wait_for_navigation()
-        load_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        # Measure browser-side load metrics over repeated loads
+        summary, violations = performance.measure("example_home", example_page, example_page.navigate_to_home)
         
-        # Page load should be less than 5 seconds
-        assert load_time < 5000, f"Page load took too long: {load_time:.2f}ms" 
\ No newline at end of file
+        assert summary["load_ms"]["samples"] == performance.runs, "Navigation timing was not reported"
+        assert not violations, f"Performance budget exceeded: {'; '.join(violations)}" 
\ No newline at end of file
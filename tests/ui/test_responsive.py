@@ -3,6 +3,7 @@ from pages.example_page import ExamplePage
 
 @pytest.mark.ui
 @pytest.mark.responsive
+@pytest.mark.resource_profile("full")
 class TestResponsive:
     def test_responsive_elements_visibility(self, responsive_page):
         """Test that elements are visible across different viewport sizes."""
@@ -55,4 +56,14 @@ class TestResponsive:
         assert bbox['x'] >= 0, f"Element {element_selector} positioned outside left viewport"
         assert bbox['y'] >= 0, f"Element {element_selector} positioned outside top viewport"
         assert bbox['x'] + bbox['width'] <= viewport['width'], f"Element {element_selector} positioned outside right viewport"
-        assert bbox['y'] + bbox['height'] <= viewport['height'], f"Element {element_selector} positioned outside bottom viewport" 
\ No newline at end of file
+        assert bbox['y'] + bbox['height'] <= viewport['height'], f"Element {element_selector} positioned outside bottom viewport"
+
+    def test_visual_regression(self, responsive_page, visual):
+        """Test that the home page looks the same as its baseline at each viewport size."""
+        example_page = ExamplePage(responsive_page)
+        example_page.navigate_to_home()
+
+        viewport = example_page.get_viewport_size()
+        result = visual.compare(example_page, f"example_home-{viewport['width']}x{viewport['height']}")
+
+        assert result.matched, result.message
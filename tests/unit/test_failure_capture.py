@@ -0,0 +1,79 @@
+import pytest
+from tests.utils import failure_capture
+from tests.utils.failure_capture import FailureCapture
+
+PNG = b"\x89PNG fake"
+
+
+class FakeTracing:
+    def __init__(self):
+        self.stopped_with = []
+
+    def start(self, **kwargs):
+        pass
+
+    def start_chunk(self, **kwargs):
+        pass
+
+    def stop_chunk(self, path=None):
+        self.stopped_with.append(path)
+
+
+class FakePage:
+    def screenshot(self, **kwargs):
+        return PNG
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+
+class FakeContext:
+    def __init__(self, pages):
+        self.pages = pages
+        self.tracing = FakeTracing()
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Collect what FailureCapture hands to the artifact writer."""
+    artifacts = []
+
+    def save(artifact_type, data, test_name):
+        artifacts.append((artifact_type, data))
+        return f"{test_name}.{artifact_type}"
+
+    monkeypatch.setattr(failure_capture, "save_test_artifact", save)
+    return artifacts
+
+
+@pytest.mark.unit
+class TestFailureCapture:
+    def test_failure_saves_final_screenshots_without_ring(self, tmp_path, saved):
+        """Test that with page-load screenshots off, a failure still saves one PNG per open page."""
+        context = FakeContext([FakePage(), FakePage()])
+        capture = FailureCapture(context, str(tmp_path), screenshots=0)
+        capture.start("test")
+
+        paths = capture.finish(failed=True, name="test")
+
+        assert saved == [("png", PNG), ("png", PNG)]
+        assert paths[0] == str(tmp_path / "test.zip")
+        assert len(paths) == 3
+
+    def test_pass_exports_nothing(self, tmp_path, saved):
+        """Test that a passing test stops its trace chunk without exporting anything."""
+        context = FakeContext([FakePage()])
+        capture = FailureCapture(context, str(tmp_path))
+        capture.start("test")
+
+        assert capture.finish(failed=False, name="test") == []
+        assert saved == [] and context.tracing.stopped_with == [None]
@@ -0,0 +1,64 @@
+import pytest
+from pages import private_api
+from pages.instrumentation import ActionProfiler
+from pages.private_api import connection_of, impl_of, require_private_api
+from tests.utils.context_pool import ContextPool
+
+
+class FakeConnection:
+    def _send_message_to_server(self, *args, **kwargs):
+        pass
+
+
+class FakeImpl:
+    def __init__(self):
+        self._connection = FakeConnection()
+
+
+class FakeContext:
+    def __init__(self):
+        self._impl_obj = FakeImpl()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def new_context(self, **kwargs):
+        return FakeContext()
+
+
+@pytest.fixture
+def unverified(monkeypatch):
+    """Pretend the installed Playwright is a release the internals weren't verified on."""
+    monkeypatch.setattr(private_api, "private_api_supported", lambda: False)
+
+
+@pytest.mark.unit
+class TestPrivateApi:
+    def test_unverified_release(self, unverified):
+        """Test that internals are withheld, and required ones fail, on an unverified release."""
+        context = FakeContext()
+
+        assert impl_of(context) is None and connection_of(context) is None
+        with pytest.raises(RuntimeError, match="PRIVATE_API_VERSIONS"):
+            require_private_api("Response checks")
+
+    def test_context_pool_discards_on_unverified_release(self, unverified):
+        """Test that without internals the pool hands out a fresh context after every release."""
+        pool = ContextPool(FakeBrowser(), {})
+        context = pool.acquire()
+
+        pool.release(context)
+
+        assert context.closed and pool.stats["discarded"] == 1
+        assert pool.acquire() is not context
+
+    def test_profiler_skips_round_trips_on_unverified_release(self, unverified):
+        """Test that the action profiler leaves the driver connection alone on an unverified release."""
+        context = FakeContext()
+
+        ActionProfiler.watch(context)
+
+        assert "_send_message_to_server" not in vars(context._impl_obj._connection)
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import pytest
+from tests.utils.duration_scheduler import DurationStore
+from tests.utils.sharding import _read_html_data, assign_shards, merge_html, merge_timings, parse_shard
+
+SAMPLE_TESTS = """
+import pytest
+
+def test_{name}_passes():
+    pass
+
+def test_{name}_fails():
+    assert False
+
+@pytest.mark.skip
+def test_{name}_skipped():
+    pass
+"""
+
+
+def _html_report(directory, name: str) -> str:
+    """Run a small suite with pytest-html in a subprocess and return the report path."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"test_{name}.py"), "w", encoding="utf-8") as f:
+        f.write(SAMPLE_TESTS.format(name=name))
+    with open(os.path.join(directory, "pytest.ini"), "w", encoding="utf-8") as f:
+        f.write("[pytest]\n")
+    report = os.path.join(directory, "reports", "report.html")
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", f"--html={report}", f"test_{name}.py"],
+        cwd=directory, capture_output=True, check=False,
+    )
+    return report
+
+
+@pytest.mark.unit
+class TestShardAssignment:
+    def test_parse_shard(self):
+        """Test that i/N parses and out-of-range shards are rejected."""
+        assert parse_shard("2/4") == (2, 4)
+        assert parse_shard(" 1 / 1 ") == (1, 1)
+        for value in ("0/4", "5/4", "2", "a/b"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                parse_shard(value)
+
+    def test_assignment_is_deterministic(self):
+        """Test that the plan depends only on the costs, not on their order."""
+        costs = {f"tests/test_{index}.py::test": float(index % 7) for index in range(50)}
+        shuffled = list(costs.items())
+        random.Random(1).shuffle(shuffled)
+
+        assert assign_shards(costs, 4) == assign_shards(dict(shuffled), 4)
+
+    def test_assignment_covers_every_unit_once(self):
+        """Test that every unit lands on exactly one shard in range."""
+        costs = {f"t{index}": 1.0 + index for index in range(23)}
+        assignment = assign_shards(costs, 5)
+
+        assert set(assignment) == set(costs)
+        assert set(assignment.values()) <= set(range(1, 6))
+
+    def test_assignment_balances_load(self):
+        """Test that LPT keeps the heaviest shard within the longest unit of the lightest."""
+        costs = {f"t{index}": float(cost) for index, cost in enumerate([9, 8, 7, 6, 5, 4, 3, 2, 1, 1, 1])}
+        assignment = assign_shards(costs, 3)
+        loads = [sum(cost for unit, cost in costs.items() if assignment[unit] == shard) for shard in (1, 2, 3)]
+
+        assert max(loads) - min(loads) <= max(costs.values())
+
+    def test_ties_break_by_nodeid(self):
+        """Test that equal costs go to shards in nodeid order."""
+        assert assign_shards({"b": 1.0, "a": 1.0, "c": 1.0}, 3) == {"a": 1, "b": 2, "c": 3}
+
+
+@pytest.mark.unit
+class TestShardMerge:
+    def test_merge_html_reports(self, tmp_path):
+        """Test that merging real pytest-html reports combines their tests and recounts outcomes."""
+        reports = [_html_report(str(tmp_path / name), name) for name in ("first", "second")]
+        output = str(tmp_path / "merged" / "report.html")
+
+        results = merge_html(reports, output, wall_seconds=12.0)
+
+        text, data = _read_html_data(output)
+        assert results == 6
+        assert len(data["tests"]) == 6
+        assert '<span class="passed">2 ' in text and '<span class="failed">2 ' in text
+        assert '<span class="skipped">2 ' in text
+        assert 'data-test-result="xfailed" disabled/>' in text
+        assert 'data-test-result="passed" />' in text
+        assert '<p class="run-count">4 tests took 12s on 2 shards.</p>' in text
+        assert os.path.isdir(tmp_path / "merged" / "assets")
+
+    def test_merge_timings_updates_durations(self, tmp_path):
+        """Test that shard durations are folded into the durations file, without group suffixes."""
+        path = str(tmp_path / "durations.json")
+        merge_timings([
+            {"durations": {"t.py::a@login": 2.0}},
+            {"durations": {"t.py::b": 4.0}},
+        ], path)
+
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"t.py::a": 2.0, "t.py::b": 4.0}
+        assert DurationStore(path).estimate("t.py::unknown") == 3.0
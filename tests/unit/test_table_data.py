@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from pages.table_data import TableData
+
+CHUNK = {
+    "headers": ["Last Name", "Email", "Due"],
+    "columns": [
+        ["Bach", "Conway", "Doe", "Smith"],
+        ["fbach@yahoo.com", "tconway@earthlink.net", "jdoe@hotmail.com", "jsmith@gmail.com"],
+        ["$51.00", "$1,000.50", "$100.00", "$50.00"],
+    ],
+    "total": 4,
+}
+
+
+@pytest.mark.unit
+class TestTableData:
+    def test_rows_and_chunks(self):
+        """Test that chunks join in order and convert back to one dict per row."""
+        first = TableData.from_chunk({**CHUNK, "columns": [column[:2] for column in CHUNK["columns"]]})
+        second = TableData.from_chunk({**CHUNK, "columns": [column[2:] for column in CHUNK["columns"]]})
+        table = TableData.concat([first, second])
+
+        assert len(table) == 4 and table.total_rows == 4
+        assert table.rows() == TableData.from_chunk(CHUNK).rows()
+        assert table.rows()[1] == {"Last Name": "Conway", "Email": "tconway@earthlink.net", "Due": "$1,000.50"}
+
+    def test_unnamed_columns(self):
+        """Test that columns without a header cell get a positional name."""
+        table = TableData.from_chunk({"headers": ["A"], "columns": [["1"], ["2"]], "total": 1})
+
+        assert table.headers == ["A", "column 2"]
+
+    def test_numbers_and_sorting(self):
+        """Test that currency columns compare as numbers and text columns as text."""
+        table = TableData.from_chunk(CHUNK)
+
+        np.testing.assert_array_equal(table.to_numbers("Due"), [51.0, 1000.5, 100.0, 50.0])
+        assert table.is_sorted("Last Name")
+        assert not table.is_sorted("Due", numeric=True)
+        assert not table.is_sorted("Last Name", descending=True)
+
+    def test_types_and_duplicates(self):
+        """Test the per-column type checks and duplicate detection."""
+        table = TableData.from_chunk({
+            "headers": ["Email", "Due", "Web"],
+            "columns": [["a@b.com", "not an email"], ["$5", "5"], ["https://x.org", "https://x.org"]],
+            "total": 2,
+        })
+
+        assert table.matches_type("Email", "email").tolist() == [True, False]
+        assert table.matches_type("Due", "currency").tolist() == [True, False]
+        assert table.matches_type("Due", "number").tolist() == [False, True]
+        assert table.has_type("Web", "url")
+        assert table.duplicates("Web") == ["https://x.org"] and not table.is_unique("Web")
+        with pytest.raises(ValueError):
+            table.matches_type("Email", "date")
@@ -0,0 +1,32 @@
+import io
+import pytest
+from _pytest.outcomes import Skipped
+from PIL import Image
+from tests.utils.visual import VisualChecker, VisualComparator
+
+
+class FakePageObject:
+    def screenshot(self, full_page=False):
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8), "white").save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+@pytest.mark.unit
+class TestMissingBaseline:
+    def test_missing_baseline_skips(self, tmp_path):
+        """Test that a comparison without a baseline skips and still records the screenshot."""
+        checker = VisualChecker(VisualComparator(str(tmp_path / "baselines"), str(tmp_path / "out")))
+
+        with pytest.raises(Skipped, match="python -m tests.utils.visual accept"):
+            checker.compare(FakePageObject(), "home")
+        assert checker.results[0].status == "missing"
+        assert (tmp_path / "out" / "home" / "actual.png").exists()
+
+    def test_missing_baseline_fails_when_required(self, tmp_path):
+        """Test that required baselines turn a missing one into a failed result."""
+        comparator = VisualComparator(str(tmp_path / "baselines"), str(tmp_path / "out"))
+
+        result = VisualChecker(comparator, require_baselines=True).compare(FakePageObject(), "home")
+
+        assert not result.matched and result.status == "missing"
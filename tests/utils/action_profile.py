@@ -0,0 +1,79 @@
+import json
+import os
+from typing import Dict
+import pytest
+from pages.instrumentation import ActionTotals
+from pages.private_api import private_api_supported
+
+
+class ActionProfile:
+    """Per-test action summaries folded into run-wide totals by action type and selector."""
+
+    def __init__(self):
+        self.tests: Dict[str, Dict] = {}
+        self.actions: Dict[str, ActionTotals] = {}
+        self.selectors: Dict[str, ActionTotals] = {}
+
+    def add_test(self, nodeid: str, summary: Dict) -> None:
+        """Add the summary of one test's ActionProfiler."""
+        self.merge({
+            "tests": {nodeid: {key: summary[key] for key in ("seconds", "round_trips", "actions")}},
+            "actions": summary["actions"],
+            "selectors": summary["selectors"],
+        })
+
+    def merge(self, data: Dict) -> None:
+        """Fold in the output of to_dict() from another process."""
+        self.tests.update(data.get("tests", {}))
+        for group, totals in (("actions", self.actions), ("selectors", self.selectors)):
+            for name, values in data.get(group, {}).items():
+                totals.setdefault(name, ActionTotals()).add(
+                    values["seconds"], values["round_trips"], values["count"], values["max_seconds"]
+                )
+
+    def to_dict(self) -> Dict:
+        return {
+            "tests": self.tests,
+            "actions": {name: vars(totals) for name, totals in self.actions.items()},
+            "selectors": {name: vars(totals) for name, totals in self.selectors.items()},
+        }
+
+    def export(self, path: str) -> None:
+        """Write the run-wide profile as JSON."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+ACTION_PROFILE_KEY = pytest.StashKey[ActionProfile]()
+
+
+def _write_table(terminalreporter, title: str, totals: Dict[str, ActionTotals], limit: int) -> None:
+    terminalreporter.write_sep("-", title)
+    terminalreporter.write_line(f"{'total s':>9} {'count':>6} {'mean ms':>9} {'max ms':>9} {'trips':>6}  name")
+    slowest = sorted(totals.items(), key=lambda item: item[1].seconds, reverse=True)[:limit]
+    for name, entry in slowest:
+        terminalreporter.write_line(
+            f"{entry.seconds:9.3f} {entry.count:6d} {entry.seconds / entry.count * 1000:9.1f} "
+            f"{entry.max_seconds * 1000:9.1f} {entry.round_trips:6d}  {name}"
+        )
+
+
+def write_action_profile(terminalreporter, profile: ActionProfile, limit: int = 10) -> None:
+    """Write the slowest actions and selectors of the run to the terminal summary."""
+    if not profile.actions:
+        return
+    _write_table(terminalreporter, "slowest actions", profile.actions, limit)
+    _write_table(terminalreporter, "slowest selectors", profile.selectors, limit)
+    if not private_api_supported():
+        terminalreporter.write_line("round trips not counted: Playwright release not in PRIVATE_API_VERSIONS")
+
+
+class ActionProfileXdistPlugin:
+    """Collects the action profile each xdist worker publishes when it shuts down."""
+
+    def __init__(self, profile: ActionProfile):
+        self.profile = profile
+
+    def pytest_testnodedown(self, node, error) -> None:
+        self.profile.merge(getattr(node, "workeroutput", {}).get("action_profile", {}))
@@ -0,0 +1,170 @@
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for ARTIFACT_COMPRESSION=zstd
+    zstandard = None
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Formats that are already compressed and gain nothing from another pass
+PRECOMPRESSED_TYPES = {"png", "jpg", "jpeg", "webm", "zip", "gz", "zst"}
+
+
+def encode_artifact(artifact_type: str, data: Any) -> bytes:
+    """Serialize artifact data the way save_test_artifact always has, with compact JSON."""
+    if artifact_type == "json":
+        return json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    return str(data).encode("utf-8")
+
+
+class ArtifactWriter:
+    """
+    Writes artifacts on background threads, named by their content hash.
+
+    `submit` only serializes and hashes on the caller's thread, then hands the bytes
+    to a bounded queue drained by a small thread pool, so tests never wait on disk.
+    Identical content maps to the same file and is written once; each write goes to
+    a temporary file that is atomically renamed, so parallel xdist workers writing
+    the same artifact cannot collide or leave partial files. Every submission is
+    recorded in `index.jsonl` with the test it came from.
+    """
+
+    def __init__(self, root: str, compression: str = "none", workers: int = 2, max_pending: int = 64):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown artifact compression '{compression}', expected one of {COMPRESSIONS}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd artifact compression requires the 'zstandard' package")
+        self.root = root
+        self.compression = compression
+        self.stats = {"submitted": 0, "written": 0, "deduplicated": 0, "bytes_in": 0, "bytes_written": 0,
+                      "queue_full_waits": 0}
+        self.errors: List[str] = []
+        self._known = set()
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple]]" = queue.Queue(maxsize=max_pending)
+        self._threads = [
+            threading.Thread(target=self._drain, name=f"artifact-writer-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def path_for(self, artifact_type: str, digest: str) -> str:
+        extension = {"gzip": ".gz", "zstd": ".zst"}.get(self._compression_for(artifact_type), "")
+        return os.path.join(self.root, artifact_type, digest[:2], f"{digest}.{artifact_type}{extension}")
+
+    def _compression_for(self, artifact_type: str) -> str:
+        return "none" if artifact_type in PRECOMPRESSED_TYPES else self.compression
+
+    def submit(self, artifact_type: str, data: Any, test_name: str) -> str:
+        """
+        Queue an artifact for writing.
+
+        Returns:
+            str: The path the artifact will have once written
+        """
+        payload = encode_artifact(artifact_type, data)
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        path = self.path_for(artifact_type, digest)
+        with self._lock:
+            self.stats["submitted"] += 1
+            self.stats["bytes_in"] += len(payload)
+            duplicate = path in self._known
+            self._known.add(path)
+        entry = {"test": test_name, "type": artifact_type, "path": path, "size": len(payload), "created": time.time()}
+        item = (path, artifact_type, None if duplicate else payload, entry)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self.stats["queue_full_waits"] += 1
+            self._queue.put(item)
+        return path
+
+    def flush(self) -> None:
+        """Block until every queued artifact has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Flush and stop the writer threads."""
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                self.errors.append(f"{item[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: str, artifact_type: str, payload: Optional[bytes], entry: Dict) -> None:
+        if payload is None or os.path.exists(path):
+            with self._lock:
+                self.stats["deduplicated"] += 1
+        else:
+            compression = self._compression_for(artifact_type)
+            if compression == "gzip":
+                payload = gzip.compress(payload, compresslevel=6, mtime=0)
+            elif compression == "zstd":
+                payload = zstandard.ZstdCompressor(level=3).compress(payload)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self.stats["written"] += 1
+                self.stats["bytes_written"] += len(payload)
+        self._append_index(entry)
+
+    def _append_index(self, entry: Dict) -> None:
+        # One O_APPEND write per line keeps lines from different processes intact
+        os.makedirs(self.root, exist_ok=True)
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+        fd = os.open(os.path.join(self.root, "index.jsonl"), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+
+_writer: Optional[ArtifactWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """Get the process-wide writer, configured from ARTIFACTS_DIR and ARTIFACT_COMPRESSION."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ArtifactWriter(
+                os.getenv("ARTIFACTS_DIR", os.path.join("reports", "artifacts")),
+                compression=os.getenv("ARTIFACT_COMPRESSION", "none"),
+                workers=int(os.getenv("ARTIFACT_WRITER_THREADS", 2)),
+            )
+        return _writer
+
+
+def flush_artifacts() -> Optional[ArtifactWriter]:
+    """Session-end barrier: wait for pending artifact writes, if anything was ever saved."""
+    if _writer is not None:
+        _writer.flush()
+    return _writer
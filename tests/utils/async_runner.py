@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+PageFlow = Callable[[Page], Awaitable[Any]]
+# Prepares each flow's context before its page opens, e.g. HAR routing; gets the flow's name
+ContextSetup = Callable[[BrowserContext, str], Awaitable[None]]
+
+
+class AsyncBrowserRunner:
+    """
+    Drives an async Playwright browser on a background event loop.
+
+    The sync API keeps its own event loop on the test thread, so the async browser
+    lives on a dedicated thread and tests hand it coroutines to run.
+    """
+
+    def __init__(self, browser_name: str, launch_options: Dict, context_args: Dict, default_timeout: float):
+        self.browser_name = browser_name
+        self.launch_options = launch_options
+        self.context_args = context_args
+        self.default_timeout = default_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+
+    def start(self) -> "AsyncBrowserRunner":
+        """Start the event loop thread and launch the browser on it."""
+        self._thread.start()
+        self.run(self._start())
+        return self
+
+    def run(self, coroutine: Awaitable) -> Any:
+        """Run a coroutine on the runner's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def run_flows(self, flows: List[PageFlow], setup: Optional[ContextSetup] = None) -> List[Any]:
+        """
+        Run independent page flows concurrently, each in its own context and page.
+
+        Args:
+            flows: Async callables taking a Page
+            setup: Called with each flow's context and its index before the flow runs
+
+        Returns:
+            list: The result of every flow, in the order given
+        """
+        return self.run(self._run_flows(flows, setup))
+
+    def stop(self) -> None:
+        """Close the browser and stop the event loop thread."""
+        self.run(self._stop())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _start(self) -> None:
+        self._playwright = await async_playwright().start()
+        self._browser = await getattr(self._playwright, self.browser_name).launch(**self.launch_options)
+
+    async def _stop(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def _run_flows(self, flows: List[PageFlow], setup: Optional[ContextSetup]) -> List[Any]:
+        return list(await asyncio.gather(*(
+            self._run_flow(flow, setup=setup, name=str(index)) for index, flow in enumerate(flows)
+        )))
+
+    async def _run_flow(
+        self,
+        flow: PageFlow,
+        browser: Optional[Browser] = None,
+        setup: Optional[ContextSetup] = None,
+        name: str = "",
+    ) -> Any:
+        context = await (browser or self._browser).new_context(**self.context_args)
+        try:
+            if setup is not None:
+                await setup(context, name)
+            page = await context.new_page()
+            page.set_default_timeout(self.default_timeout)
+            return await flow(page)
+        finally:
+            await context.close()
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+from playwright.sync_api import BrowserContext
+
+# Blank document served for every origin whose localStorage is restored
+RESTORE_PAGE_PATH = "/__auth_state_restore__"
+
+RESTORE_STORAGE_SCRIPT = """items => {
+    for (const {name, value} of items) {
+        localStorage.setItem(name, value);
+    }
+}"""
+
+
+def restore_storage_state(context: BrowserContext, state: Dict) -> None:
+    """
+    Apply a storage state to an existing context: its cookies and every origin's localStorage.
+
+    Pooled contexts can't be created with `storage_state=`, so each origin is opened
+    on a blank routed page to write its localStorage without reaching the network.
+    """
+    if state.get("cookies"):
+        context.add_cookies(state["cookies"])
+    origins = [origin for origin in state.get("origins", []) if origin.get("localStorage")]
+    if not origins:
+        return
+    page = context.new_page()
+    try:
+        page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+        for origin in origins:
+            page.goto(f"{origin['origin']}{RESTORE_PAGE_PATH}")
+            page.evaluate(RESTORE_STORAGE_SCRIPT, origin["localStorage"])
+    finally:
+        page.close()
+
+
+class AuthStateCache:
+    """
+    Storage states of logged-in sessions, cached on disk per (base_url, username).
+
+    Workers share the cache directory, so the UI login normally runs once per run and
+    at most once per worker. States older than the TTL are treated as missing and are
+    deleted the next time a state is saved.
+    """
+
+    def __init__(self, cache_dir: str, ttl_seconds: float):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    def path(self, base_url: str, username: str) -> str:
+        """Get the file holding the storage state for a user on a site."""
+        key = hashlib.sha256(f"{base_url.rstrip('/')}|{username}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, base_url: str, username: str) -> Optional[Dict]:
+        """Get a cached storage state, or None if it is missing or expired."""
+        path = self.path(base_url, username)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, base_url: str, username: str, state: Dict) -> None:
+        """Cache the storage state of a freshly logged-in context."""
+        path = self.path(base_url, username)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete every state older than the TTL; returns how many were deleted."""
+        pruned = 0
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return 0
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if name.endswith(".json") and time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                    os.remove(path)
+                    pruned += 1
+            except OSError:
+                continue  # another worker pruned or replaced it
+        return pruned
+
+    def invalidate(self, base_url: str, username: str) -> None:
+        """Drop a cached state, e.g. after the server rejected its session."""
+        try:
+            os.remove(self.path(base_url, username))
+        except FileNotFoundError:
+            pass
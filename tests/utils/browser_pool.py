@@ -0,0 +1,270 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+from playwright._impl._driver import compute_driver_executable
+from playwright.sync_api import Browser, BrowserType
+
+# Runs BrowserType.launchServer through the Node driver bundled with the Python package
+# and prints the WebSocket endpoint. The server shuts down when its stdin closes, so it
+# never outlives the pytest process that owns it.
+LAUNCH_SERVER_SCRIPT = """
+const playwright = require(process.argv[1]);
+playwright[process.argv[2]].launchServer(JSON.parse(process.argv[3])).then(server => {
+  console.log(server.wsEndpoint());
+  process.stdin.on('end', () => server.close().then(() => process.exit(0)));
+  process.stdin.resume();
+}).catch(error => {
+  console.error(error.message);
+  process.exit(1);
+});
+"""
+
+
+def process_tree(root_pid: int) -> List[int]:
+    """List a process and all of its descendants (Linux only; empty elsewhere)."""
+    if not os.path.isdir("/proc"):
+        return []
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # The command name may contain spaces, so split after its closing paren.
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids = []
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def _drain(stream: IO[str], lines: Deque[str]) -> threading.Thread:
+    """Keep reading a pipe on a daemon thread so a chatty server never blocks on a full pipe."""
+    def read() -> None:
+        for line in stream:
+            lines.append(line.rstrip("\n"))
+
+    thread = threading.Thread(target=read, daemon=True)
+    thread.start()
+    return thread
+
+
+def _process_tree_rss(root_pid: int) -> int:
+    """Sum the resident set size of a process and all of its descendants (Linux only)."""
+    total = 0
+    for pid in process_tree(root_pid):
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class BrowserServer:
+    """A single browser launched with `launchServer`, reachable over the Playwright wire protocol."""
+
+    def __init__(self, browser_name: str, launch_options: Dict):
+        self.browser_name = browser_name
+        self.launch_options = {**launch_options, "port": 0, "wsPath": f"/{uuid.uuid4().hex}"}
+        self.ws_endpoint: Optional[str] = None
+        self.startup_time = 0.0
+        self.restarts = 0
+        # Last lines the server wrote, e.g. with DEBUG=pw:*, for diagnosing crashes
+        self.output: Deque[str] = deque(maxlen=200)
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        """Launch the server and wait until it reports its endpoint."""
+        driver_dir = compute_driver_executable().parent
+        node = driver_dir / ("node.exe" if sys.platform == "win32" else "node")
+        started = time.perf_counter()
+        self._process = subprocess.Popen(
+            [str(node), "-e", LAUNCH_SERVER_SCRIPT, str(driver_dir / "package"),
+             self.browser_name, json.dumps(self.launch_options)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        stderr = _drain(self._process.stderr, self.output)
+        endpoint = self._process.stdout.readline().strip()
+        if not endpoint:
+            self._process.wait()
+            stderr.join()
+            error = "\n".join(self.output)
+            raise RuntimeError(f"Failed to launch {self.browser_name} server: {error}")
+        _drain(self._process.stdout, self.output)
+        self.startup_time = time.perf_counter() - started
+        self.ws_endpoint = endpoint
+        # Pin the port so a restarted server comes back on the same endpoint.
+        self.launch_options["port"] = urlsplit(endpoint).port
+
+    def is_alive(self) -> bool:
+        """Check whether the server process is still running."""
+        return self._process is not None and self._process.poll() is None
+
+    def restart(self) -> None:
+        """Relaunch a crashed server on its previous endpoint."""
+        self.stop()
+        self.start()
+        self.restarts += 1
+
+    def rss_bytes(self) -> int:
+        """Get the memory used by the server and the browser processes it spawned."""
+        return _process_tree_rss(self._process.pid) if self.is_alive() else 0
+
+    def stop(self) -> None:
+        """Shut the server down and wait for it to exit."""
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        self._process = None
+
+
+class BrowserServerPool:
+    """
+    A small set of browser servers shared by every xdist worker on a node.
+
+    Workers are assigned to the server with the fewest workers so far, and a watchdog
+    thread restarts any server whose process exits.
+    """
+
+    def __init__(self, size: int, browser_name: str, launch_options: Dict, check_interval: float = 1.0):
+        self.servers = [BrowserServer(browser_name, launch_options) for _ in range(size)]
+        self.assignments: Dict[str, int] = {}
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self.startup_wall_seconds = 0.0
+
+    def start(self) -> None:
+        """Launch all servers in parallel and start watching them."""
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.servers)) as executor:
+                list(executor.map(lambda server: server.start(), self.servers))
+        except Exception:
+            for server in self.servers:
+                server.stop()
+            raise
+        self.startup_wall_seconds = time.perf_counter() - started
+        self._watchdog = threading.Thread(target=self._watch, daemon=True)
+        self._watchdog.start()
+
+    def assign(self, worker_id: str) -> str:
+        """Get the endpoint of the least-loaded server for a worker."""
+        with self._lock:
+            loads = [0] * len(self.servers)
+            for index in self.assignments.values():
+                loads[index] += 1
+            index = loads.index(min(loads))
+            self.assignments[worker_id] = index
+            return self.servers[index].ws_endpoint
+
+    def stats(self) -> Dict:
+        """
+        Compare the pool with launching one browser per worker.
+
+        `launch_seconds` sums the servers' launch times, although they launch in
+        parallel; `startup_wall_seconds` is how long the pool took to start. The
+        `estimated_per_worker_*` figures are not measured: they scale the pooled
+        servers' average launch time and memory to one browser per worker.
+        """
+        workers = max(len(self.assignments), 1)
+        startups = [server.startup_time for server in self.servers]
+        rss = [server.rss_bytes() for server in self.servers]
+        average_startup = sum(startups) / len(startups)
+        average_rss = sum(rss) / len(rss)
+        return {
+            "servers": len(self.servers),
+            "workers": workers,
+            "restarts": sum(server.restarts for server in self.servers),
+            "startup_wall_seconds": self.startup_wall_seconds,
+            "launch_seconds": sum(startups),
+            "estimated_per_worker_launch_seconds": average_startup * workers,
+            "rss_bytes": sum(rss),
+            "estimated_per_worker_rss_bytes": int(average_rss * workers),
+        }
+
+    def stop(self) -> None:
+        """Stop the watchdog and shut down every server."""
+        self._stopped.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+        for server in self.servers:
+            server.stop()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self._check_interval):
+            for server in self.servers:
+                if not server.is_alive() and not self._stopped.is_set():
+                    try:
+                        server.restart()
+                    except RuntimeError:
+                        # Keep watching; the next check retries the launch.
+                        pass
+
+
+class PooledBrowser:
+    """
+    Browser connected to a pool server that reconnects after the server restarts.
+
+    Attribute access is forwarded to the underlying Browser, so it can stand in for
+    one wherever fixtures expect a Browser.
+    """
+
+    def __init__(self, browser_type: BrowserType, ws_endpoint: str, slow_mo: float = 0):
+        self._browser_type = browser_type
+        self._ws_endpoint = ws_endpoint
+        self._slow_mo = slow_mo
+        self._browser: Optional[Browser] = None
+
+    def _current(self) -> Browser:
+        if self._browser is None or not self._browser.is_connected():
+            self._browser = self._browser_type.connect(self._ws_endpoint, slow_mo=self._slow_mo)
+        return self._browser
+
+    def __getattr__(self, name: str):
+        return getattr(self._current(), name)
+
+    def close(self) -> None:
+        """Disconnect from the server without closing the shared browser."""
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+
+
+class BrowserPoolXdistPlugin:
+    """Hands each xdist worker the endpoint of a pool server as the worker starts."""
+
+    def __init__(self, pool: BrowserServerPool):
+        self.pool = pool
+
+    def pytest_configure_node(self, node) -> None:
+        node.workerinput["browser_pool_endpoint"] = self.pool.assign(node.gateway.id)
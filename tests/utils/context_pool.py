@@ -0,0 +1,223 @@
+import json
+import time
+from typing import Any, Dict, List
+from playwright.sync_api import Browser, BrowserContext, Error, Page
+from pages.private_api import impl_of
+
+# Blank document served for every origin whose storage is being cleared, so the reset
+# never reaches the network.
+RESET_PAGE_PATH = "/__context_pool_reset__"
+
+CLEAR_STORAGE_SCRIPT = """async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map(db => new Promise(resolve => {
+            const request = indexedDB.deleteDatabase(db.name);
+            request.onsuccess = request.onerror = request.onblocked = () => resolve();
+        })));
+    }
+}"""
+
+
+def _listener_counts(impl: Any) -> Dict[str, int]:
+    """Count the event handlers registered on a context's implementation object."""
+    return {event: len(impl.listeners(event)) for event in impl.event_names()}
+
+
+def _track_init_scripts(impl: Any, baseline: Dict) -> None:
+    """Count the init scripts added to a context; Playwright has no way to remove them."""
+    add_init_script = impl.add_init_script
+
+    async def counting_add_init_script(*args, **kwargs):
+        baseline["init_scripts"] += 1
+        return await add_init_script(*args, **kwargs)
+
+    impl.add_init_script = counting_add_init_script
+
+
+class ContextPool:
+    """
+    Per-worker pool of browser contexts that are reset between tests instead of recreated.
+
+    A released context has its pages closed and its cookies, storage, permissions,
+    routes, headers, geolocation and offline state restored to the creation arguments.
+    State that cannot be undone, such as extra event handlers, exposed bindings or
+    init scripts, makes the pool discard the context and create a fresh one on the
+    next acquire. That state is read from Playwright internals; on a release they
+    weren't verified on, every released context is discarded.
+    """
+
+    def __init__(self, browser: Browser, context_args: Dict, max_size: int = 1, prewarm: int = 1):
+        self.browser = browser
+        self.context_args = context_args
+        self.max_size = max_size
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "resets": 0,
+            "discarded": 0,
+            "reset_seconds": 0.0,
+        }
+        self._idle: List[BrowserContext] = []
+        self._baselines: Dict[BrowserContext, Dict] = {}
+        for _ in range(min(prewarm, max_size)):
+            self._idle.append(self._create())
+
+    def acquire(self, fresh: bool = False) -> BrowserContext:
+        """
+        Get a clean context, reusing an idle one when possible.
+
+        Args:
+            fresh: Always create a new context, e.g. for tests that add init scripts
+        """
+        if self._idle and not fresh:
+            self.stats["hits"] += 1
+            return self._idle.pop()
+        self.stats["misses"] += 1
+        return self._create()
+
+    def release(self, context: BrowserContext, reusable: bool = True) -> None:
+        """Reset a context and return it to the pool, or close it if isolation can't be guaranteed."""
+        if not reusable or len(self._idle) >= self.max_size or not self._is_isolated(context):
+            self._discard(context)
+            return
+
+        started = time.perf_counter()
+        try:
+            self._reset(context)
+        except Error:
+            self._discard(context)
+            return
+        self.stats["resets"] += 1
+        self.stats["reset_seconds"] += time.perf_counter() - started
+        self._idle.append(context)
+
+    def close(self) -> None:
+        """Close every idle context."""
+        while self._idle:
+            self._idle.pop().close()
+        self._baselines.clear()
+
+    def _create(self) -> BrowserContext:
+        context = self.browser.new_context(**self.context_args)
+        self.stats["created"] += 1
+        impl = impl_of(context)
+        if impl is not None:
+            baseline = self._baselines[context] = {
+                "listeners": _listener_counts(impl),
+                "bindings": len(impl._bindings),
+                "init_scripts": 0,
+            }
+            _track_init_scripts(impl, baseline)
+        return context
+
+    def _discard(self, context: BrowserContext) -> None:
+        self.stats["discarded"] += 1
+        self._baselines.pop(context, None)
+        try:
+            context.close()
+        except Error:
+            pass
+
+    def _is_isolated(self, context: BrowserContext) -> bool:
+        baseline = self._baselines.get(context)
+        if baseline is None:
+            return False
+        impl = impl_of(context)
+        return (
+            _listener_counts(impl) == baseline["listeners"]
+            and len(impl._bindings) == baseline["bindings"]
+            and not baseline["init_scripts"]
+        )
+
+    def _reset(self, context: BrowserContext) -> None:
+        origins = [origin["origin"] for origin in context.storage_state()["origins"]]
+        for page in context.pages:
+            page.close()
+
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers(self.context_args.get("extra_http_headers") or {})
+        context.set_geolocation(self.context_args.get("geolocation"))
+        context.set_offline(self.context_args.get("offline", False))
+
+        if origins:
+            page = context.new_page()
+            page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+            for origin in origins:
+                page.goto(f"{origin}{RESET_PAGE_PATH}")
+                page.evaluate(CLEAR_STORAGE_SCRIPT)
+            page.close()
+
+
+def emulation_key(context_args: Dict) -> str:
+    """Context arguments other than the viewport, which a page can change after creation."""
+    return json.dumps({name: value for name, value in context_args.items() if name != "viewport"}, sort_keys=True)
+
+
+class DeviceContextPool:
+    """
+    One ContextPool per emulated device, so responsive tests reuse a context per device.
+
+    With `switch_viewports`, devices whose emulation settings differ only in viewport
+    share a context, and each test's page is resized to its device with
+    set_viewport_size instead.
+    """
+
+    def __init__(self, browser: Browser, devices: Dict[str, Dict], switch_viewports: bool = False):
+        self.browser = browser
+        self.devices = devices
+        self.switch_viewports = switch_viewports
+        self.acquired = 0
+        self.viewport_switches = 0
+        self._pools: Dict[str, ContextPool] = {}
+        self._last_device: Dict[str, str] = {}
+
+    def _key(self, device: str) -> str:
+        return emulation_key(self.devices[device]) if self.switch_viewports else device
+
+    def acquire(self, device: str, fresh: bool = False) -> BrowserContext:
+        """Get a clean context emulating a device; see ContextPool.acquire."""
+        key = self._key(device)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = ContextPool(self.browser, self.devices[device], prewarm=0)
+        self.acquired += 1
+        return pool.acquire(fresh=fresh)
+
+    def new_page(self, device: str, context: BrowserContext) -> Page:
+        """Open a page in an acquired context, sized to the device if the context is shared."""
+        page = context.new_page()
+        if self.switch_viewports:
+            key = self._key(device)
+            if self._last_device.get(key, device) != device:
+                self.viewport_switches += 1
+            self._last_device[key] = device
+            page.set_viewport_size(self.devices[device]["viewport"])
+        return page
+
+    def release(self, device: str, context: BrowserContext, reusable: bool = True) -> None:
+        """Reset a context and keep it for the next test on the device; see ContextPool.release."""
+        self._pools[self._key(device)].release(context, reusable)
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """The device pools' counters summed, with the context creations reuse avoided."""
+        totals: Dict[str, float] = {}
+        for pool in self._pools.values():
+            for name, value in pool.stats.items():
+                totals[name] = totals.get(name, 0) + value
+        created = int(totals.get("created", 0))
+        return {
+            **totals,
+            "contexts_avoided": self.acquired - created,
+            "viewport_switches": self.viewport_switches,
+        }
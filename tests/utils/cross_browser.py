@@ -0,0 +1,128 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+from playwright.async_api import Browser, async_playwright
+from tests.utils.async_runner import AsyncBrowserRunner, ContextSetup, PageFlow
+
+ENGINES = ("chromium", "firefox", "webkit")
+
+
+@dataclass
+class EngineResult:
+    """Outcome of one flow on one browser engine."""
+    engine: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    seconds: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None
+
+    @property
+    def outcome(self) -> str:
+        """What is compared across engines: the returned value, or the error's type and message."""
+        if self.error is not None:
+            return f"{type(self.error).__name__}: {str(self.error).splitlines()[0] if str(self.error) else ''}"
+        return repr(self.value)
+
+
+@dataclass
+class CrossBrowserResult:
+    """Per-engine results of one flow run on several engines at once."""
+    results: Dict[str, EngineResult]
+    seconds: float = 0.0  # wall time of the whole fan-out
+    divergent: Dict[str, List[str]] = field(init=False)
+
+    def __post_init__(self):
+        outcomes: Dict[str, List[str]] = {}
+        for engine, result in self.results.items():
+            outcomes.setdefault(result.outcome, []).append(engine)
+        # Only worth reporting when the engines disagree
+        self.divergent = outcomes if len(outcomes) > 1 else {}
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        return {engine: result.value for engine, result in self.results.items()}
+
+    @property
+    def failed(self) -> List[str]:
+        return [engine for engine, result in self.results.items() if not result.passed]
+
+    @property
+    def sequential_seconds(self) -> float:
+        """Time the engines would have taken one after another."""
+        return sum(result.seconds for result in self.results.values())
+
+    def summary(self) -> str:
+        """One line per engine, then the outcomes the engines disagree on."""
+        lines = [
+            f"{engine:9} {'passed' if result.passed else 'FAILED'} {result.seconds:6.2f}s  {result.outcome}"
+            for engine, result in self.results.items()
+        ]
+        lines.append(f"wall {self.seconds:.2f}s, sequential {self.sequential_seconds:.2f}s")
+        if self.divergent:
+            lines.append("engines diverge:")
+            lines.extend(f"  {', '.join(engines)}: {outcome}" for outcome, engines in self.divergent.items())
+        return "\n".join(lines)
+
+    def raise_for_failures(self) -> None:
+        """Fail with the per-engine summary if the flow failed on any engine."""
+        if self.failed:
+            raise AssertionError(f"Failed on {', '.join(self.failed)}\n{self.summary()}") from self.results[
+                self.failed[0]
+            ].error
+
+
+class CrossBrowserRunner(AsyncBrowserRunner):
+    """
+    Runs one async page flow on several browser engines at the same time.
+
+    All engines are driven from one async Playwright instance on the runner's
+    background event loop, so a fan-out takes about as long as the slowest engine
+    rather than the sum of all of them. An engine that fails to launch (e.g. not
+    installed) is reported as an error on every flow instead of stopping the others.
+    """
+
+    def __init__(self, engines: Sequence[str], launch_options: Dict, context_args: Dict, default_timeout: float):
+        super().__init__(engines[0], launch_options, context_args, default_timeout)
+        self.engines = list(engines)
+        self._browsers: Dict[str, Browser] = {}
+        self._launch_errors: Dict[str, BaseException] = {}
+
+    def run_across(self, flow: PageFlow, setup: Optional[ContextSetup] = None) -> CrossBrowserResult:
+        """Run a flow on every engine concurrently, each in its own context and page; see run_flows for `setup`."""
+        return self.run(self._run_across(flow, setup))
+
+    async def _start(self) -> None:
+        self._playwright = await async_playwright().start()
+        launched = await asyncio.gather(
+            *(getattr(self._playwright, engine).launch(**self.launch_options) for engine in self.engines),
+            return_exceptions=True,
+        )
+        for engine, browser in zip(self.engines, launched):
+            if isinstance(browser, BaseException):
+                self._launch_errors[engine] = browser
+            else:
+                self._browsers[engine] = browser
+
+    async def _stop(self) -> None:
+        await asyncio.gather(*(browser.close() for browser in self._browsers.values()), return_exceptions=True)
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def _run_across(self, flow: PageFlow, setup: Optional[ContextSetup]) -> CrossBrowserResult:
+        started = time.perf_counter()
+        results = await asyncio.gather(*(self._run_engine(engine, flow, setup) for engine in self.engines))
+        return CrossBrowserResult({result.engine: result for result in results}, time.perf_counter() - started)
+
+    async def _run_engine(self, engine: str, flow: PageFlow, setup: Optional[ContextSetup]) -> EngineResult:
+        if engine in self._launch_errors:
+            return EngineResult(engine, error=self._launch_errors[engine])
+        started = time.perf_counter()
+        try:
+            value = await self._run_flow(flow, self._browsers[engine], setup, engine)
+        except Exception as e:
+            return EngineResult(engine, error=e, seconds=time.perf_counter() - started)
+        return EngineResult(engine, value=value, seconds=time.perf_counter() - started)
@@ -0,0 +1,182 @@
+import csv
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+import pytest
+
+DATA_DIR = os.path.join("tests", "data")
+DATASET_FORMATS = (".jsonl", ".csv")
+
+
+def _stable_fraction(*parts: str) -> float:
+    """Map strings to [0, 1) the same way in every process, unlike hash()."""
+    digest = hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
+@dataclass(frozen=True)
+class DatasetRow:
+    """
+    Handle to one row of a dataset file, loaded only when a test uses it.
+
+    Collection only keeps each row's byte offset and id, so the rows themselves are
+    read on whichever worker runs the test.
+    """
+
+    path: str
+    offset: int
+    line: int
+    key: str
+    header: Optional[Tuple[str, ...]] = None  # CSV column names
+
+    def load(self) -> Dict:
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            text = f.readline().decode("utf-8")
+        if self.header is None:
+            return json.loads(text)
+        values = next(csv.reader([text]))
+        return dict(zip(self.header, values))
+
+
+class DatasetIndex:
+    """
+    Byte offsets of the rows of a JSONL or CSV dataset, built in one streaming pass.
+
+    JSONL files hold one JSON object per line; CSV files start with a header row and
+    hold one record per line (quoted fields spanning lines are not supported). Blank
+    lines and lines starting with "#" are skipped. A row's key is its "id" field, or
+    its line number when it has none.
+    """
+
+    def __init__(self, path: str, header: Optional[Tuple[str, ...]] = None,
+                 rows: Optional[List[Tuple[int, int, str]]] = None):
+        self.path = path
+        self.header = header
+        self.rows: List[Tuple[int, int, str]] = list(self._scan()) if rows is None else rows
+
+    def _scan(self) -> Iterator[Tuple[int, int, str]]:
+        is_csv = self.path.endswith(".csv")
+        with open(self.path, "rb") as f:
+            offset = 0
+            for number, raw in enumerate(f, start=1):
+                line_offset, offset = offset, offset + len(raw)
+                text = raw.decode("utf-8").strip()
+                if not text or text.startswith("#"):
+                    continue
+                if is_csv and self.header is None:
+                    self.header = tuple(next(csv.reader([text])))
+                    continue
+                yield line_offset, number, self._key(text, number, is_csv)
+
+    def _key(self, text: str, number: int, is_csv: bool) -> str:
+        if is_csv:
+            row = dict(zip(self.header, next(csv.reader([text]))))
+        else:
+            row = json.loads(text)
+        return str(row.get("id", number))
+
+    def select(self, limit: Optional[int] = None, sample: Optional[float] = None, seed: str = "0") -> List[DatasetRow]:
+        """
+        Rows kept for this run.
+
+        Args:
+            limit: Keep at most this many rows (after sampling), in file order
+            sample: Keep each row with this probability, decided by hashing its key with `seed`,
+                so every process keeps the same rows without coordinating
+            seed: Changes which rows a sample keeps
+        """
+        selected = []
+        for offset, line, key in self.rows:
+            if sample is not None and _stable_fraction(seed, key) >= sample:
+                continue
+            selected.append(DatasetRow(self.path, offset, line, key, self.header))
+            if limit is not None and len(selected) >= limit:
+                break
+        return selected
+
+    def save(self, path: str, version: Tuple[int, int]) -> None:
+        """Write the index atomically, tagged with the dataset's (mtime, size)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": list(version), "header": self.header, "rows": self.rows}, f,
+                      separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, dataset: str, path: str, version: Tuple[int, int]) -> Optional["DatasetIndex"]:
+        """Read a saved index, or None if it is missing or was built from another version of the dataset."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if tuple(saved["version"]) != version:
+            return None
+        header = tuple(saved["header"]) if saved["header"] is not None else None
+        return cls(dataset, header, [tuple(row) for row in saved["rows"]])
+
+
+_indexes: Dict[str, Tuple[Tuple[int, int], DatasetIndex]] = {}
+
+
+def dataset_path(name: str, data_dir: str = DATA_DIR) -> str:
+    """Find tests/data/<name>.jsonl or .csv."""
+    for extension in DATASET_FORMATS:
+        path = os.path.join(data_dir, f"{name}{extension}")
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No dataset '{name}' in {data_dir} (expected {' or '.join(DATASET_FORMATS)})")
+
+
+def get_dataset_index(path: str, cache_dir: Optional[str] = None) -> DatasetIndex:
+    """
+    Index of a dataset, rebuilt only when the file's mtime or size changes.
+
+    Indexes are kept in memory and, with a `cache_dir`, saved there so later runs and
+    other xdist workers skip the scan.
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _indexes.get(path)
+    if cached is None or cached[0] != version:
+        saved_path = os.path.join(cache_dir, f"{os.path.basename(path)}.index.json") if cache_dir else None
+        index = DatasetIndex.load(path, saved_path, version) if saved_path else None
+        if index is None:
+            index = DatasetIndex(path)
+            if saved_path:
+                index.save(saved_path, version)
+        cached = (version, index)
+        _indexes[path] = cached
+    return cached[1]
+
+
+def shard_of(key: str, shards: int) -> int:
+    """Deterministic shard of a row key."""
+    return int(_stable_fraction(key) * shards)
+
+
+def dataset_params(
+    name: str,
+    limit: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: str = "0",
+    shards: int = 1,
+    data_dir: str = DATA_DIR,
+    cache_dir: Optional[str] = None,
+) -> List:
+    """
+    pytest.param per selected row of a dataset, with the row key as test id.
+
+    With more than one shard each row gets an xdist_group mark for its shard, so
+    `--dist loadgroup` (or --schedule-by-duration) sends a shard's rows to one worker.
+    """
+    rows = get_dataset_index(dataset_path(name, data_dir), cache_dir).select(limit, sample, seed)
+    params = []
+    for row in rows:
+        marks = [pytest.mark.xdist_group(f"{name}-{shard_of(row.key, shards)}")] if shards > 1 else []
+        params.append(pytest.param(row, id=f"{name}-{row.key}", marks=marks))
+    return params
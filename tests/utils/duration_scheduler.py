@@ -0,0 +1,185 @@
+import heapq
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+# Separates a test's nodeid from the group it shares expensive fixtures with
+GROUP_SEPARATOR = "@"
+
+
+def strip_group(nodeid: str) -> str:
+    """Remove the group suffix workers add to nodeids."""
+    if nodeid.rfind(GROUP_SEPARATOR) > nodeid.rfind("]"):
+        return nodeid.rsplit(GROUP_SEPARATOR, 1)[0]
+    return nodeid
+
+
+def fixture_group(item: pytest.Item) -> Optional[str]:
+    """
+    Name the expensive state a test shares with others, if any.
+
+    Tests with an xdist_group mark, the same responsive device or the cached login
+    are kept on one worker so they can reuse that state.
+    """
+    marker = item.get_closest_marker("xdist_group")
+    if marker:
+        return marker.args[0] if marker.args else marker.kwargs.get("name", "default")
+    params = getattr(item, "callspec", None) and item.callspec.params
+    if params and "responsive_page" in params:
+        return f"device-{params['responsive_page']}"
+    if "authenticated_herokuapp" in item.fixturenames:
+        return "authenticated"
+    return None
+
+
+def predict_makespan(costs: List[float], workers: int) -> float:
+    """Makespan of handing out costs in order, each to the least-loaded worker."""
+    loads = [0.0] * max(workers, 1)
+    for cost in costs:
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+class DurationStore:
+    """Historical per-test durations, smoothed over runs and keyed by nodeid without group suffix."""
+
+    def __init__(self, path: str, smoothing: float = 0.5):
+        self.path = path
+        self.smoothing = smoothing
+        self.durations: Dict[str, float] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.durations = json.load(f)
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration of a test; unknown tests are assumed to take the average."""
+        nodeid = strip_group(nodeid)
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return sum(self.durations.values()) / len(self.durations) if self.durations else 1.0
+
+    def update(self, measured: Dict[str, float]) -> None:
+        for nodeid, seconds in measured.items():
+            nodeid = strip_group(nodeid)
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else (
+                self.smoothing * seconds + (1 - self.smoothing) * previous
+            )
+
+    def save(self) -> None:
+        """Write the store atomically so concurrent readers never see a partial file."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    Hands out work units longest-first, so xdist's dispatch to the next free worker
+    becomes LPT (longest processing time) scheduling.
+
+    A work unit is one test, or all tests of a fixture group (see fixture_group),
+    whose cost is the sum of their historical durations.
+    """
+
+    def __init__(self, config, store: DurationStore, log=None):
+        super().__init__(config, log)
+        self.store = store
+        self.predicted_makespan = 0.0
+        self.started: Optional[float] = None
+        self.workers = 0
+        self.units = 0
+
+    def _split_scope(self, nodeid: str) -> str:
+        if nodeid.rfind(GROUP_SEPARATOR) > nodeid.rfind("]"):
+            return nodeid.rsplit(GROUP_SEPARATOR, 1)[1]
+        return nodeid
+
+    def schedule(self) -> None:
+        """Build the work queue ordered by predicted cost, then dispatch like LoadScopeScheduling."""
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        units: Dict[str, OrderedDict] = OrderedDict()
+        costs: Dict[str, float] = {}
+        for nodeid in self.collection:
+            scope = self._split_scope(nodeid)
+            units.setdefault(scope, OrderedDict())[nodeid] = False
+            costs[scope] = costs.get(scope, 0.0) + self.store.estimate(nodeid)
+        for scope in sorted(units, key=lambda scope: costs[scope], reverse=True):
+            self.workqueue[scope] = units[scope]
+
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _ = self.assigned_work.popitem(last=True)
+            self.log(f"Shutting down unused node {unused_node}")
+            unused_node.shutdown()
+
+        self.workers = len(self.nodes)
+        self.units = len(self.workqueue)
+        self.predicted_makespan = predict_makespan(list(map(costs.get, self.workqueue)), self.workers)
+        self.started = time.monotonic()
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
+
+
+class DurationSchedulerPlugin:
+    """
+    Records test durations and, under xdist, installs DurationScheduling.
+
+    Durations are taken from the reports the controller receives, so runs without
+    xdist also feed the history used by later parallel runs.
+    """
+
+    def __init__(self, store: DurationStore):
+        self.store = store
+        self.scheduler: Optional[DurationScheduling] = None
+        self.measured: Dict[str, float] = {}
+        self.finished: Optional[float] = None
+
+    def pytest_xdist_make_scheduler(self, config, log):
+        self.scheduler = DurationScheduling(config, self.store, log)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report) -> None:
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+        self.finished = time.monotonic()
+
+    def pytest_sessionfinish(self, session) -> None:
+        if self.measured:
+            self.store.update(self.measured)
+            self.store.save()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        scheduler = self.scheduler
+        if scheduler is None or scheduler.started is None or self.finished is None:
+            return
+        actual = self.finished - scheduler.started
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        terminalreporter.write_line(
+            f"{len(scheduler.collection)} tests in {scheduler.units} work units on {scheduler.workers} workers"
+        )
+        terminalreporter.write_line(
+            f"makespan: predicted {scheduler.predicted_makespan:.2f}s, actual {actual:.2f}s "
+            f"(perfect balance {sum(self.measured.values()) / max(scheduler.workers, 1):.2f}s)"
+        )
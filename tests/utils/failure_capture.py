@@ -0,0 +1,151 @@
+import os
+import re
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from playwright.sync_api import BrowserContext, ConsoleMessage, Error, Page
+from tests.utils.browser_pool import process_tree
+from tests.utils.test_helpers import save_test_artifact
+
+CAPTURE_MODES = ("trace", "video", "off")
+
+
+def process_tree_usage(root_pid: Optional[int]) -> Tuple[float, int]:
+    """CPU seconds and bytes written to storage by a process tree so far (Linux only; zeros elsewhere)."""
+    if root_pid is None:
+        return 0.0, 0
+    ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    cpu_seconds, write_bytes = 0.0, 0
+    for pid in process_tree(root_pid):
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            # utime and stime are fields 14 and 15 of /proc/<pid>/stat
+            cpu_seconds += (int(fields[11]) + int(fields[12])) / ticks
+            with open(f"/proc/{pid}/io", "r") as f:
+                for line in f:
+                    if line.startswith("write_bytes:"):
+                        write_bytes += int(line.split()[1])
+                        break
+        except (OSError, IndexError, ValueError):
+            continue
+    return cpu_seconds, write_bytes
+
+
+class CaptureMeter:
+    """
+    Measures the CPU time and disk writes of the Playwright driver and its browsers during a test.
+
+    Browsers from the shared pool (--browser-pool) are not children of the driver, so
+    only the driver's own cost is measured for them.
+    """
+
+    def __init__(self, driver_pid: Optional[int]):
+        self.driver_pid = driver_pid
+        self._start = (0.0, 0)
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        self._start = process_tree_usage(self.driver_pid)
+        self._started_at = time.perf_counter()
+
+    def stop(self) -> Tuple[float, int, float]:
+        """Returns CPU seconds, bytes written and wall seconds since start()."""
+        cpu_seconds, write_bytes = process_tree_usage(self.driver_pid)
+        return (
+            cpu_seconds - self._start[0],
+            write_bytes - self._start[1],
+            time.perf_counter() - self._started_at,
+        )
+
+
+def artifact_name(nodeid: str) -> str:
+    """Turn a nodeid into a file-name-safe artifact name."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+
+
+class FailureCapture:
+    """
+    Capture of one test that is exported to the output directory only if the test fails.
+
+    The context records a Playwright trace (with screencast frames and DOM snapshots)
+    in one chunk per test. The driver writes trace events and resources to its own
+    artifacts directory while recording; a passing test's chunk is stopped without
+    being exported. Console messages and page errors go to a ring of the last `window`
+    entries. With `screenshots`, each page load also adds a screenshot to a ring of
+    that many; the trace's screencast already covers page loads, so this is off by default.
+    On failure the trace chunk is exported as a zip, and the buffered events, the
+    buffered screenshots and a final screenshot go to the artifact writer.
+    """
+
+    def __init__(self, context: BrowserContext, output_dir: str, window: int = 50, screenshots: int = 0):
+        self.context = context
+        self.output_dir = output_dir
+        self.events: Deque[str] = deque(maxlen=window)
+        self.screenshots: Deque[Tuple[str, bytes]] = deque(maxlen=screenshots)
+        self._pages: List[Page] = []
+
+    def start(self, title: str) -> None:
+        """Begin buffering a new test on the context."""
+        if not getattr(self.context, "_failure_capture_tracing", False):
+            self.context.tracing.start(screenshots=True, snapshots=True)
+            self.context._failure_capture_tracing = True
+        self.context.tracing.start_chunk(title=title)
+        self.context.on("console", self._on_console)
+        self.context.on("weberror", self._on_web_error)
+        if self.screenshots.maxlen:
+            self.context.on("page", self._watch_page)
+            for page in self.context.pages:
+                self._watch_page(page)
+
+    def finish(self, failed: bool, name: str) -> List[str]:
+        """
+        Stop buffering; on failure persist everything that was buffered.
+
+        Returns:
+            list: Paths of the persisted trace and artifacts, empty if the test passed
+        """
+        self.context.remove_listener("console", self._on_console)
+        self.context.remove_listener("weberror", self._on_web_error)
+        if self.screenshots.maxlen:
+            self.context.remove_listener("page", self._watch_page)
+            for page in self._pages:
+                page.remove_listener("load", self._on_load)
+        if not failed:
+            self.context.tracing.stop_chunk()
+            return []
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        trace_path = os.path.join(self.output_dir, f"{name}.zip")
+        self.context.tracing.stop_chunk(path=trace_path)
+        paths = [trace_path]
+        # Kept apart from the ring, which holds nothing when page-load screenshots are off
+        final_screenshots: List[Tuple[str, bytes]] = []
+        for page in self.context.pages:
+            try:
+                final_screenshots.append(("png", page.screenshot()))
+            except Error:
+                continue
+        paths.extend(
+            save_test_artifact(image_type, image, name)
+            for image_type, image in [*self.screenshots, *final_screenshots]
+        )
+        if self.events:
+            paths.append(save_test_artifact("log", "\n".join(self.events), name))
+        return paths
+
+    def _watch_page(self, page: Page) -> None:
+        self._pages.append(page)
+        page.on("load", self._on_load)
+
+    def _on_load(self, page: Page) -> None:
+        try:
+            self.screenshots.append(("jpg", page.screenshot(type="jpeg", quality=50)))
+        except Error:
+            pass  # the page navigated again or closed before the screenshot
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        self.events.append(f"[{message.type}] {message.text} ({message.page.url if message.page else ''})")
+
+    def _on_web_error(self, error) -> None:
+        self.events.append(f"[pageerror] {error.error}")
@@ -0,0 +1,532 @@
+import re
+import threading
+import uuid
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Links shown on the homepage, in the same order as the live site.
+EXAMPLES = [
+    ("A/B Testing", "/abtest"),
+    ("Add/Remove Elements", "/add_remove_elements/"),
+    ("Basic Auth", "/basic_auth"),
+    ("Broken Images", "/broken_images"),
+    ("Challenging DOM", "/challenging_dom"),
+    ("Checkboxes", "/checkboxes"),
+    ("Context Menu", "/context_menu"),
+    ("Digest Authentication", "/digest_auth"),
+    ("Disappearing Elements", "/disappearing_elements"),
+    ("Drag and Drop", "/drag_and_drop"),
+    ("Dropdown", "/dropdown"),
+    ("Dynamic Content", "/dynamic_content"),
+    ("Dynamic Controls", "/dynamic_controls"),
+    ("Dynamic Loading", "/dynamic_loading"),
+    ("Entry Ad", "/entry_ad"),
+    ("Exit Intent", "/exit_intent"),
+    ("File Download", "/download"),
+    ("File Upload", "/upload"),
+    ("Floating Menu", "/floating_menu"),
+    ("Forgot Password", "/forgot_password"),
+    ("Form Authentication", "/login"),
+    ("Frames", "/frames"),
+    ("Geolocation", "/geolocation"),
+    ("Horizontal Slider", "/horizontal_slider"),
+    ("Hovers", "/hovers"),
+    ("Infinite Scroll", "/infinite_scroll"),
+    ("Inputs", "/inputs"),
+    ("JQuery UI Menus", "/jqueryui/menu"),
+    ("JavaScript Alerts", "/javascript_alerts"),
+    ("JavaScript onload event error", "/javascript_error"),
+    ("Key Presses", "/key_presses"),
+    ("Large & Deep DOM", "/large"),
+    ("Multiple Windows", "/windows"),
+    ("Nested Frames", "/nested_frames"),
+    ("Notification Messages", "/notification_message_rendered"),
+    ("Redirect Link", "/redirector"),
+    ("Secure File Download", "/download_secure"),
+    ("Shadow DOM", "/shadowdom"),
+    ("Shifting Content", "/shifting_content"),
+    ("Slow Resources", "/slow"),
+    ("Sortable Data Tables", "/tables"),
+    ("Status Codes", "/status_codes"),
+    ("Typos", "/typos"),
+    ("WYSIWYG Editor", "/tinymce"),
+]
+
+VALID_USERNAME = "tomsmith"
+VALID_PASSWORD = "SuperSecretPassword!"
+
+TABLE_HEADERS = ["Last Name", "First Name", "Email", "Due", "Web Site", "Action"]
+TABLE_ROWS = [
+    ["Smith", "John", "jsmith@gmail.com", "$50.00", "http://www.jsmith.com"],
+    ["Bach", "Frank", "fbach@yahoo.com", "$51.00", "http://www.frank.com"],
+    ["Doe", "Jason", "jdoe@hotmail.com", "$100.00", "http://www.jdoe.com"],
+    ["Conway", "Tim", "tconway@earthlink.net", "$50.00", "http://www.timconway.com"],
+]
+
+STATUS_CODES = [200, 301, 404, 500]
+
+LAYOUT = """<!DOCTYPE html>
+<html class="no-js" lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>The Internet</title>
+</head>
+<body>
+  <div class="row">
+    <div id="flash-messages" class="large-12 columns">{flash}</div>
+  </div>
+  <div class="row">
+    <div id="content" class="large-12 columns">
+{content}
+    </div>
+  </div>
+  <div id="page-footer" class="row">
+    <div class="large-4 large-centered columns">
+      <hr>
+      <div style="text-align: center;">Powered by <a target="_blank" href="http://elementalselenium.com/">Elemental Selenium</a></div>
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+FLASH = '<div data-alert id="flash" class="flash {kind}">\n      {message}\n      <a href="#" class="close">x</a>\n    </div>'
+
+
+def _render_home() -> str:
+    links = "\n".join(f'        <li><a href="{href}">{name}</a></li>' for name, href in EXAMPLES)
+    return (
+        '      <h1 class="heading">Welcome to the-internet</h1>\n'
+        "      <h2>Available Examples</h2>\n"
+        f"      <ul>\n{links}\n      </ul>"
+    )
+
+
+def _render_login() -> str:
+    return """      <div class="example">
+        <h2>Login Page</h2>
+        <h4 class="subheader">This is where you can log into the secure area.</h4>
+        <form name="login" id="login" action="/authenticate" method="post">
+          <div class="row"><div class="large-6 small-12 columns">
+            <label for="username">Username</label>
+            <input type="text" name="username" id="username">
+          </div></div>
+          <div class="row"><div class="large-6 small-12 columns">
+            <label for="password">Password</label>
+            <input type="password" name="password" id="password">
+          </div></div>
+          <button class="radius" type="submit"><i class="fa fa-2x fa-sign-in"> Login</i></button>
+        </form>
+      </div>"""
+
+
+def _render_secure() -> str:
+    return """      <div class="example">
+        <h2><i class="icon-lock"></i> Secure Area</h2>
+        <h4 class="subheader">Welcome to the Secure Area. When you are done click logout below.</h4>
+        <a class="button secondary radius" href="/logout"><i class="icon-2x icon-signout"> Logout</i></a>
+      </div>"""
+
+
+def _render_dynamic_loading() -> str:
+    return """      <div class="example">
+        <h3>Dynamically Loaded Page Elements</h3>
+        <a href="/dynamic_loading/1">Example 1: Element on page that is hidden</a>
+        <br>
+        <a href="/dynamic_loading/2">Example 2: Element rendered after the fact</a>
+      </div>"""
+
+
+def _render_dynamic_loading_example(delay_ms: int) -> str:
+    return """      <div class="example">
+        <h3>Dynamically Loaded Page Elements</h3>
+        <h4>Example 1: Element on page that is hidden</h4>
+        <div id="start"><button>Start</button></div>
+        <div id="finish" style="display:none"><h4>Hello World!</h4></div>
+        <div id="loading" style="display:none">Loading... </div>
+        <script>
+          document.querySelector("#start button").addEventListener("click", function () {
+            document.getElementById("start").style.display = "none";
+            document.getElementById("loading").style.display = "block";
+            setTimeout(function () {
+              document.getElementById("loading").style.display = "none";
+              document.getElementById("finish").style.display = "block";
+            }, %d);
+          });
+        </script>
+      </div>""" % delay_ms
+
+
+def _render_checkboxes() -> str:
+    return """      <div class="example">
+        <h3>Checkboxes</h3>
+        <form id="checkboxes">
+          <input type="checkbox"> checkbox 1<br>
+          <input type="checkbox" checked> checkbox 2
+        </form>
+      </div>"""
+
+
+def _render_drag_and_drop() -> str:
+    return """      <div class="example">
+        <h3>Drag and Drop</h3>
+        <div id="columns">
+          <div class="column" id="column-a" draggable="true" style="width:150px;height:150px;display:inline-block;border:2px solid #666"><header>A</header></div>
+          <div class="column" id="column-b" draggable="true" style="width:150px;height:150px;display:inline-block;border:2px solid #666"><header>B</header></div>
+        </div>
+        <script>
+          var dragged = null;
+          document.querySelectorAll("#columns .column").forEach(function (column) {
+            column.addEventListener("dragstart", function (e) {
+              dragged = this;
+              e.dataTransfer.effectAllowed = "move";
+              e.dataTransfer.setData("text/html", this.innerHTML);
+            });
+            column.addEventListener("dragover", function (e) { e.preventDefault(); });
+            column.addEventListener("drop", function (e) {
+              e.preventDefault();
+              if (dragged && dragged !== this) {
+                dragged.innerHTML = this.innerHTML;
+                this.innerHTML = e.dataTransfer.getData("text/html");
+              }
+            });
+          });
+        </script>
+      </div>"""
+
+
+def _render_upload_form() -> str:
+    return """      <div class="example">
+        <h3>File Uploader</h3>
+        <form method="POST" enctype="multipart/form-data" action="/upload">
+          <input id="file-upload" type="file" name="file">
+          <input class="button" id="file-submit" type="submit" value="Upload">
+        </form>
+      </div>"""
+
+
+def _render_uploaded(filename: str) -> str:
+    return f"""      <div class="example">
+        <h3>File Uploaded!</h3>
+        <div id="uploaded-files" class="panel text-center">{filename}</div>
+      </div>"""
+
+
+def _render_frames() -> str:
+    return """      <div class="example">
+        <h3>Frames</h3>
+        <ul>
+          <li><a href="/nested_frames">Nested Frames</a></li>
+          <li><a href="/iframe">iFrame</a></li>
+        </ul>
+      </div>"""
+
+
+def _render_iframe() -> str:
+    editor = (
+        '<!DOCTYPE html><html><head></head>'
+        '<body id="tinymce" class="mce-content-body" contenteditable="true">'
+        "<p>Your content goes here.</p></body></html>"
+    )
+    return f"""      <div class="example">
+        <h3>An iFrame containing the TinyMCE WYSIWYG Editor</h3>
+        <iframe id="mce_0_ifr" title="Rich Text Area" srcdoc='{editor}'></iframe>
+      </div>"""
+
+
+def _render_javascript_alerts() -> str:
+    return """      <div class="example">
+        <h3>JavaScript Alerts</h3>
+        <p>Here are some examples of different JavaScript alerts which can be troublesome for automation</p>
+        <ul>
+          <li><button onclick="jsAlert()">Click for JS Alert</button></li>
+          <li><button onclick="jsConfirm()">Click for JS Confirm</button></li>
+          <li><button onclick="jsPrompt()">Click for JS Prompt</button></li>
+        </ul>
+        <h4>Result:</h4>
+        <p id="result" style="color:green"></p>
+        <script>
+          function log(message) { document.getElementById("result").textContent = message; }
+          function jsAlert() { alert("I am a JS Alert"); log("You successfully clicked an alert"); }
+          function jsConfirm() { log("You clicked: " + (confirm("I am a JS Confirm") ? "Ok" : "Cancel")); }
+          function jsPrompt() { log("You entered: " + prompt("I am a JS prompt")); }
+        </script>
+      </div>"""
+
+
+def _render_key_presses() -> str:
+    return """      <div class="example">
+        <h3>Key Presses</h3>
+        <p>Key presses are often used to interact with a website.</p>
+        <form><input id="target" type="text"></form>
+        <p id="result"></p>
+        <script>
+          document.addEventListener("keyup", function (e) {
+            var key = e.key.length === 1 ? e.key : e.key.replace(/([a-z])([A-Z])/g, "$1_$2");
+            document.getElementById("result").textContent = "You entered: " + key.toUpperCase();
+          });
+        </script>
+      </div>"""
+
+
+def _render_horizontal_slider() -> str:
+    return """      <div class="example">
+        <h3>Horizontal Slider</h3>
+        <div class="sliderContainer">
+          <input type="range" min="0.0" max="5.0" step="0.5" value="0">
+          <span id="range">0</span>
+        </div>
+        <script>
+          var slider = document.querySelector("input[type='range']");
+          function update() { document.getElementById("range").textContent = slider.value; }
+          slider.addEventListener("input", update);
+          slider.addEventListener("change", update);
+        </script>
+      </div>"""
+
+
+def _render_tables() -> str:
+    headers = "".join(f'<th class="header"><span>{header}</span></th>' for header in TABLE_HEADERS)
+    rows = "\n".join(
+        "            <tr>" + "".join(f"<td>{cell}</td>" for cell in row)
+        + '<td><a href="#edit">edit</a> <a href="#delete">delete</a></td></tr>'
+        for row in TABLE_ROWS
+    )
+    return f"""      <div class="example">
+        <h3>Data Tables</h3>
+        <table id="table1" class="tablesorter">
+          <thead><tr>{headers}</tr></thead>
+          <tbody>
+{rows}
+          </tbody>
+        </table>
+        <script>
+          document.querySelectorAll("#table1 th").forEach(function (th, index) {{
+            th.addEventListener("click", function () {{
+              var body = document.querySelector("#table1 tbody");
+              var descending = th.classList.contains("headerSortDown");
+              var rows = Array.prototype.slice.call(body.rows);
+              rows.sort(function (a, b) {{
+                var x = a.cells[index].textContent, y = b.cells[index].textContent;
+                return descending ? y.localeCompare(x) : x.localeCompare(y);
+              }});
+              rows.forEach(function (row) {{ body.appendChild(row); }});
+              document.querySelectorAll("#table1 th").forEach(function (other) {{
+                other.classList.remove("headerSortDown", "headerSortUp");
+              }});
+              th.classList.add(descending ? "headerSortUp" : "headerSortDown");
+            }});
+          }});
+        </script>
+      </div>"""
+
+
+def _render_status_codes() -> str:
+    links = "\n".join(
+        f'          <li><a href="status_codes/{code}">{code}</a></li>' for code in STATUS_CODES
+    )
+    return f"""      <div class="example">
+        <h3>Status Codes</h3>
+        <ul>
+{links}
+        </ul>
+      </div>"""
+
+
+def _render_status_code(code: int) -> str:
+    return f"""      <div class="example">
+        <h3>Status Codes</h3>
+        <p>This page returned a {code} status code.<br><br>
+        For a definition and description of all status codes, visit <a href="http://www.iana.org/assignments/http-status-codes/http-status-codes.xhtml">here</a>.<br><br>
+        To go back to the main page, <a href="/status_codes">click here</a>.</p>
+      </div>"""
+
+
+class _Session:
+    """Server-side session state for a single browser cookie."""
+
+    def __init__(self):
+        self.user: Optional[str] = None
+        self.flash: Optional[Tuple[str, str]] = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        path = urlsplit(self.path).path
+        session_id, session = self.server.get_session(self.headers.get("Cookie"))
+        self._session_id = session_id
+        self._session = session
+
+        status_match = re.fullmatch(r"/status_codes/(\d{3})", path)
+        if status_match:
+            code = int(status_match.group(1))
+            self._page(_render_status_code(code), status=code)
+            return
+
+        routes: Dict[Tuple[str, str], Callable[[], None]] = {
+            ("GET", "/"): lambda: self._page(_render_home()),
+            ("GET", "/login"): lambda: self._page(_render_login()),
+            ("POST", "/authenticate"): self._authenticate,
+            ("GET", "/secure"): self._secure,
+            ("GET", "/logout"): self._logout,
+            ("GET", "/dynamic_loading"): lambda: self._page(_render_dynamic_loading()),
+            ("GET", "/dynamic_loading/1"): lambda: self._page(
+                _render_dynamic_loading_example(self.server.loading_delay_ms)
+            ),
+            ("GET", "/checkboxes"): lambda: self._page(_render_checkboxes()),
+            ("GET", "/drag_and_drop"): lambda: self._page(_render_drag_and_drop()),
+            ("GET", "/upload"): lambda: self._page(_render_upload_form()),
+            ("POST", "/upload"): self._upload,
+            ("GET", "/frames"): lambda: self._page(_render_frames()),
+            ("GET", "/iframe"): lambda: self._page(_render_iframe()),
+            ("GET", "/javascript_alerts"): lambda: self._page(_render_javascript_alerts()),
+            ("GET", "/key_presses"): lambda: self._page(_render_key_presses()),
+            ("GET", "/horizontal_slider"): lambda: self._page(_render_horizontal_slider()),
+            ("GET", "/tables"): lambda: self._page(_render_tables()),
+            ("GET", "/status_codes"): lambda: self._page(_render_status_codes()),
+        }
+        handler = routes.get((method, path))
+        if handler is None:
+            self._drain_body()
+            self._page("      <h1>Not Found</h1>", status=404)
+            return
+        handler()
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _drain_body(self) -> None:
+        if self.command == "POST":
+            self._read_body()
+
+    def _authenticate(self) -> None:
+        form = parse_qs(self._read_body().decode("utf-8"))
+        username = form.get("username", [""])[0]
+        password = form.get("password", [""])[0]
+        if username != VALID_USERNAME:
+            self._session.flash = ("error", "Your username is invalid!")
+            self._redirect("/login")
+        elif password != VALID_PASSWORD:
+            self._session.flash = ("error", "Your password is invalid!")
+            self._redirect("/login")
+        else:
+            self._session.user = username
+            self._session.flash = ("success", "You logged into a secure area!")
+            self._redirect("/secure")
+
+    def _secure(self) -> None:
+        if self._session.user is None:
+            self._session.flash = ("error", "You must login to view the secure area!")
+            self._redirect("/login")
+            return
+        self._page(_render_secure())
+
+    def _logout(self) -> None:
+        self._session.user = None
+        self._session.flash = ("success", "You logged out of the secure area!")
+        self._redirect("/login")
+
+    def _upload(self) -> None:
+        body = self._read_body()
+        match = re.search(rb'filename="([^"]*)"', body)
+        if not match or not match.group(1):
+            self._page("      <h1>Internal Server Error</h1>", status=500)
+            return
+        self._page(_render_uploaded(match.group(1).decode("utf-8", "replace")))
+
+    def _redirect(self, location: str) -> None:
+        self.send_response(303)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self._send_session_cookie()
+        self.end_headers()
+
+    def _page(self, content: str, status: int = 200) -> None:
+        flash = ""
+        if self._session.flash is not None:
+            kind, message = self._session.flash
+            self._session.flash = None
+            flash = FLASH.format(kind=kind, message=message)
+        body = LAYOUT.format(flash=flash, content=content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self._send_session_cookie()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_session_cookie(self) -> None:
+        self.send_header("Set-Cookie", f"rack.session={self._session_id}; path=/; HttpOnly")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], loading_delay_ms: int):
+        super().__init__(address, _Handler)
+        self.loading_delay_ms = loading_delay_ms
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, cookie_header: Optional[str]) -> Tuple[str, _Session]:
+        """Return the session for the request cookie, creating one if needed."""
+        cookies = SimpleCookie(cookie_header or "")
+        session_id = cookies["rack.session"].value if "rack.session" in cookies else None
+        with self._lock:
+            if session_id not in self._sessions:
+                session_id = uuid.uuid4().hex
+                self._sessions[session_id] = _Session()
+            return session_id, self._sessions[session_id]
+
+
+class HerokuappServer:
+    """
+    Local stand-in for the routes of the-internet.herokuapp.com used by HerokuappPage.
+
+    The server runs on a background thread and binds to an ephemeral port by default,
+    so several instances (e.g. one per xdist worker) can run side by side.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, loading_delay_ms: int = 1000):
+        self._server = _Server((host, port), loading_delay_ms)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, without a trailing slash."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "HerokuappServer":
+        """Start serving requests on a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release its socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "HerokuappServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
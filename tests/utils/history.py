@@ -0,0 +1,311 @@
+"""
+Test history: a SQLite database of every test result, written by a pytest plugin.
+
+Usage:
+    python -m tests.utils.history flaky [--window 50] [--min-rate 0.1]
+    python -m tests.utils.history trend <nodeid substring> [--limit 30]
+    python -m tests.utils.history p95 [--window 200] [--match ui/]
+    python -m tests.utils.history prune --keep-days 90
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+import pytest
+from tests.utils.duration_scheduler import strip_group
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tests (
+    id INTEGER PRIMARY KEY,
+    nodeid TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    test_id INTEGER NOT NULL REFERENCES tests(id),
+    run_id TEXT NOT NULL,
+    finished REAL NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    retries INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    browser TEXT,
+    viewport TEXT,
+    failed_steps TEXT
+);
+CREATE INDEX IF NOT EXISTS results_by_test_time ON results (test_id, finished);
+CREATE INDEX IF NOT EXISTS results_by_test_duration ON results (test_id, duration);
+CREATE INDEX IF NOT EXISTS results_by_time ON results (finished);
+"""
+
+# Result tuple column order used by TestHistory.write
+RESULT_COLUMNS = ("nodeid", "run_id", "finished", "duration", "outcome", "retries", "worker", "browser",
+                  "viewport", "failed_steps")
+
+
+class TestHistory:
+    """
+    SQLite store of test results.
+
+    The database runs in WAL mode so readers never block the writer. Each process
+    buffers its results and writes them in one transaction per batch, so many xdist
+    workers sharing the file take the write lock rarely and briefly. Queries only use
+    the per-test indexes, which keeps them fast with millions of rows.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self._test_ids: Dict[str, int] = {}
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _test_id(self, nodeid: str) -> int:
+        test_id = self._test_ids.get(nodeid)
+        if test_id is None:
+            self.connection.execute("INSERT OR IGNORE INTO tests (nodeid) VALUES (?)", (nodeid,))
+            test_id = self.connection.execute("SELECT id FROM tests WHERE nodeid = ?", (nodeid,)).fetchone()[0]
+            self._test_ids[nodeid] = test_id
+        return test_id
+
+    def write(self, rows: Iterable[Tuple]) -> None:
+        """Insert result tuples (see RESULT_COLUMNS) in a single transaction."""
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany(
+                "INSERT INTO results (test_id, run_id, finished, duration, outcome, retries, worker, browser, "
+                "viewport, failed_steps) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(self._test_id(row[0]), *row[1:]) for row in rows],
+            )
+
+    def _tests(self, match: str = "") -> List[Tuple[int, str]]:
+        return self.connection.execute(
+            "SELECT id, nodeid FROM tests WHERE nodeid LIKE ? ORDER BY nodeid", (f"%{match}%",)
+        ).fetchall()
+
+    def _recent(self, test_id: int, column: str, window: int) -> List:
+        rows = self.connection.execute(
+            f"SELECT {column} FROM results WHERE test_id = ? ORDER BY finished DESC LIMIT ?", (test_id, window)
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def flakiness(self, window: int = 50, match: str = "") -> List[Dict]:
+        """
+        Failure and flip rates over each test's last `window` results.
+
+        The flip rate is the share of consecutive results whose outcome changed
+        between passed and failed, which separates flaky tests from broken ones.
+        """
+        report = []
+        for test_id, nodeid in self._tests(match):
+            outcomes = [outcome for outcome in self._recent(test_id, "outcome", window) if outcome != "skipped"]
+            if not outcomes:
+                continue
+            failures = sum(outcome != "passed" for outcome in outcomes)
+            flips = sum(
+                (before == "passed") != (after == "passed") for before, after in zip(outcomes, outcomes[1:])
+            )
+            report.append({
+                "nodeid": nodeid,
+                "runs": len(outcomes),
+                "failure_rate": failures / len(outcomes),
+                "flip_rate": flips / (len(outcomes) - 1) if len(outcomes) > 1 else 0.0,
+            })
+        return sorted(report, key=lambda entry: entry["flip_rate"], reverse=True)
+
+    def duration_trend(self, match: str, limit: int = 30) -> List[Dict]:
+        """Each matching test's recent durations and their least-squares slope (seconds per run)."""
+        trends = []
+        for test_id, nodeid in self._tests(match):
+            durations = self._recent(test_id, "duration", limit)
+            n = len(durations)
+            slope = 0.0
+            if n > 1:
+                mean_x, mean_y = (n - 1) / 2, sum(durations) / n
+                slope = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(durations)) / sum(
+                    (x - mean_x) ** 2 for x in range(n)
+                )
+            trends.append({"nodeid": nodeid, "durations": durations, "slope": slope})
+        return trends
+
+    def percentile(self, q: float = 95, window: Optional[int] = None, match: str = "") -> List[Dict]:
+        """Duration percentile per test, over all results or the last `window`."""
+        report = []
+        for test_id, nodeid in self._tests(match):
+            if window:
+                durations = sorted(self._recent(test_id, "duration", window))
+                if not durations:
+                    continue
+                value = durations[min(len(durations) - 1, math.ceil(q / 100 * len(durations)) - 1)]
+                count = len(durations)
+            else:
+                count = self.connection.execute(
+                    "SELECT COUNT(*) FROM results WHERE test_id = ?", (test_id,)
+                ).fetchone()[0]
+                if not count:
+                    continue
+                # Nearest-rank percentile read straight from the (test_id, duration) index
+                value = self.connection.execute(
+                    "SELECT duration FROM results WHERE test_id = ? ORDER BY duration LIMIT 1 OFFSET ?",
+                    (test_id, max(math.ceil(q / 100 * count) - 1, 0)),
+                ).fetchone()[0]
+            report.append({"nodeid": nodeid, "runs": count, f"p{q:g}": value})
+        return report
+
+    def prune(self, keep_days: float) -> int:
+        """Delete results older than `keep_days`; returns the number of rows removed."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM results WHERE finished < ?", (time.time() - keep_days * 86400,)
+            )
+        return cursor.rowcount
+
+
+class TestHistoryPlugin:
+    """
+    Collects one history row per test on the process that ran it.
+
+    Rows are buffered and flushed every `batch_size` tests and at session end.
+    Retries are counted from "rerun" reports and a "retries" user property.
+    Nodeids are stored without the group suffix --schedule-by-duration adds.
+    """
+
+    def __init__(self, path: str, run_id: str, browser: str, batch_size: int = 50):
+        self.path = path
+        self.run_id = run_id
+        self.browser = browser
+        self.batch_size = batch_size
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._pending: List[Tuple] = []
+        self._tests: Dict[str, Dict] = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        state = self._tests.setdefault(item.nodeid, {"duration": 0.0, "outcome": "passed", "retries": 0,
+                                                     "failed_steps": []})
+        page = item.funcargs.get("page") or item.funcargs.get("responsive_page")
+        if page is not None and "viewport" not in state:
+            viewport = page.viewport_size
+            state["viewport"] = f"{viewport['width']}x{viewport['height']}" if viewport else None
+        if report.failed:
+            state["failed_steps"].extend(self._failed_steps(item, report))
+
+    @staticmethod
+    def _failed_steps(item, report) -> List[Dict]:
+        """Timings of the actions that failed, or of the failing test phase without a profiler."""
+        profiler = item.funcargs.get("action_profiler")
+        steps = [
+            {"step": f"{record.page_object}.{record.action}", "selector": record.selector, "seconds": record.seconds}
+            for record in (profiler.records if profiler else []) if record.failed
+        ]
+        return steps or [{"step": report.when, "seconds": report.duration}]
+
+    def pytest_runtest_logreport(self, report) -> None:
+        state = self._tests.get(report.nodeid)
+        if state is None:
+            return
+        state["duration"] += report.duration
+        if report.outcome == "rerun":
+            state["retries"] += 1
+            state["failed_steps"] = []
+            return
+        if report.failed:
+            state["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and state["outcome"] == "passed":
+            state["outcome"] = "skipped"
+        if report.when != "teardown":
+            return
+        del self._tests[report.nodeid]
+        retries = state["retries"] + dict(report.user_properties).get("retries", 0)
+        self._pending.append((
+            strip_group(report.nodeid), self.run_id, time.time(), state["duration"], state["outcome"], retries, self.worker,
+            self.browser, state.get("viewport"), json.dumps(state["failed_steps"]) if state["failed_steps"] else None,
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        history = TestHistory(self.path)
+        try:
+            history.write(self._pending)
+        finally:
+            history.close()
+        self._pending = []
+
+    def pytest_sessionfinish(self, session) -> None:
+        self.flush()
+
+
+class TestHistoryXdistPlugin:
+    """Shares the controller's run id with every worker."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+
+    def pytest_configure_node(self, node) -> None:
+        node.workerinput["history_run_id"] = self.run_id
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=os.getenv("HISTORY_DB", os.path.join("reports", "history.sqlite")))
+    commands = parser.add_subparsers(dest="command", required=True)
+    flaky = commands.add_parser("flaky", help="Flip and failure rates per test")
+    flaky.add_argument("--window", type=int, default=50)
+    flaky.add_argument("--min-rate", type=float, default=0.0, help="Only show tests with at least this flip rate")
+    flaky.add_argument("--match", default="")
+    trend = commands.add_parser("trend", help="Recent durations and their slope")
+    trend.add_argument("match")
+    trend.add_argument("--limit", type=int, default=30)
+    p95 = commands.add_parser("p95", help="95th percentile duration per test")
+    p95.add_argument("--window", type=int, default=None, help="Only use each test's last N results")
+    p95.add_argument("--match", default="")
+    prune = commands.add_parser("prune", help="Delete old results")
+    prune.add_argument("--keep-days", type=float, required=True)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No history database at {args.db}")
+        return 1
+    history = TestHistory(args.db)
+    try:
+        if args.command == "flaky":
+            for entry in history.flakiness(args.window, args.match):
+                if entry["flip_rate"] >= args.min_rate:
+                    print(f"{entry['flip_rate']:6.1%} flips {entry['failure_rate']:6.1%} failed "
+                          f"{entry['runs']:5d} runs  {entry['nodeid']}")
+        elif args.command == "trend":
+            for entry in history.duration_trend(args.match, args.limit):
+                durations = " ".join(f"{value:.2f}" for value in entry["durations"])
+                print(f"{entry['nodeid']}\n  slope {entry['slope']:+.3f}s/run  {durations}")
+        elif args.command == "p95":
+            for entry in history.percentile(95, args.window, args.match):
+                print(f"{entry['p95']:8.2f}s {entry['runs']:6d} runs  {entry['nodeid']}")
+        else:
+            print(f"Deleted {history.prune(args.keep_days)} results")
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
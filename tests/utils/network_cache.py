@@ -0,0 +1,119 @@
+import json
+import os
+import re
+import shutil
+from typing import Dict, List, Optional, Tuple
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import BrowserContext
+
+NETWORK_MODES = ("live", "record", "replay")
+
+
+class HarCache:
+    """
+    Per-test-module HAR archives used to record and replay page traffic.
+
+    In record mode each context writes its own partial HAR (Playwright flushes it when
+    the context closes); `merge_partials` folds them into one archive per test module
+    once the whole run has finished. In replay mode the module archive serves every
+    request through route interception and unmatched requests are aborted, so no
+    sockets are opened.
+    """
+
+    PARTIAL_DIR = ".partial"
+
+    def __init__(self, mode: str, har_dir: str):
+        if mode not in NETWORK_MODES:
+            raise ValueError(f"Unknown network mode '{mode}', expected one of {NETWORK_MODES}")
+        self.mode = mode
+        self.har_dir = har_dir
+
+    def archive_path(self, module_name: str) -> str:
+        """Get the path of the HAR archive for a test module."""
+        return os.path.join(self.har_dir, f"{module_name.rsplit('.', 1)[-1]}.har")
+
+    def attach(self, context: BrowserContext, module_name: str, test_id: str) -> None:
+        """Record into or replay from the module archive for every page in the context."""
+        route = self._route_from_har_args(module_name, test_id)
+        if route is not None:
+            context.route_from_har(**route)
+
+    async def attach_async(self, context: AsyncBrowserContext, module_name: str, test_id: str) -> None:
+        """Same as attach, for a context of the async API."""
+        route = self._route_from_har_args(module_name, test_id)
+        if route is not None:
+            await context.route_from_har(**route)
+
+    def _route_from_har_args(self, module_name: str, test_id: str) -> Optional[Dict]:
+        if self.mode == "record":
+            return {
+                "har": self._partial_path(module_name, test_id),
+                "update": True,
+                "update_content": "embed",
+                "update_mode": "minimal",
+            }
+        if self.mode == "replay":
+            archive = self.archive_path(module_name)
+            if not os.path.exists(archive):
+                raise FileNotFoundError(
+                    f"No HAR archive at {archive}; run the module with --network=record first"
+                )
+            return {"har": archive, "not_found": "abort"}
+        return None
+
+    def merge_partials(self) -> List[str]:
+        """
+        Merge the partial HARs written during a record run into the module archives.
+
+        Entries are keyed by method, URL and request body; newer recordings replace
+        older ones so an archive can be refreshed one module at a time.
+
+        Returns:
+            list: Paths of the archives that were written
+        """
+        partial_root = os.path.join(self.har_dir, self.PARTIAL_DIR)
+        if not os.path.isdir(partial_root):
+            return []
+
+        written = []
+        for module in sorted(os.listdir(partial_root)):
+            module_dir = os.path.join(partial_root, module)
+            partials = sorted(
+                os.path.join(module_dir, name) for name in os.listdir(module_dir) if name.endswith(".har")
+            )
+            archive = os.path.join(self.har_dir, f"{module}.har")
+            sources = ([archive] if os.path.exists(archive) else []) + partials
+            self._write_archive(archive, self._merge(sources))
+            written.append(archive)
+        shutil.rmtree(partial_root, ignore_errors=True)
+        return written
+
+    def _partial_path(self, module_name: str, test_id: str) -> str:
+        module = module_name.rsplit(".", 1)[-1]
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        name = re.sub(r"[^\w.-]+", "_", test_id)
+        return os.path.join(self.har_dir, self.PARTIAL_DIR, module, f"{worker}-{name}.har")
+
+    @staticmethod
+    def _merge(sources: List[str]) -> Dict:
+        log: Dict = {}
+        entries: Dict[Tuple[str, str, str], Dict] = {}
+        for source in sources:
+            with open(source, "r", encoding="utf-8") as f:
+                har_log = json.load(f)["log"]
+            if not log:
+                log = {key: value for key, value in har_log.items() if key != "entries"}
+            for entry in har_log.get("entries", []):
+                request = entry["request"]
+                key = (request["method"], request["url"], (request.get("postData") or {}).get("text", ""))
+                entries[key] = entry
+        log["entries"] = list(entries.values())
+        return {"log": log}
+
+    @staticmethod
+    def _write_archive(path: str, har: Dict) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(har, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,166 @@
+import json
+import math
+import os
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pytest
+from pages.base_page import BasePage, PageMetrics
+
+PERCENTILES = (50, 95, 99)
+METRIC_NAMES = [metric.name for metric in fields(PageMetrics)]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentile with linear interpolation between the closest ranks."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: List[PageMetrics]) -> Dict[str, Dict[str, float]]:
+    """Compute p50/p95/p99 of every metric the browser reported."""
+    summary = {}
+    for name in METRIC_NAMES:
+        values = [getattr(sample, name) for sample in samples if getattr(sample, name) is not None]
+        if values:
+            summary[name] = {f"p{q}": percentile(values, q) for q in PERCENTILES}
+            summary[name]["samples"] = len(values)
+    return summary
+
+
+class PerformanceBudgets:
+    """
+    Per-page limits on metric percentiles, e.g.
+
+        {"example_home": {"load_ms": {"p95": 3000}, "cumulative_layout_shift": {"p95": 0.1}}}
+    """
+
+    def __init__(self, budgets: Dict[str, Dict[str, Dict[str, float]]]):
+        self.budgets = budgets
+
+    @classmethod
+    def load(cls, path: str) -> "PerformanceBudgets":
+        if not os.path.exists(path):
+            return cls({})
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def check(self, page_name: str, summary: Dict[str, Dict[str, float]]) -> List[str]:
+        """List the budgets a page's summary exceeds; metrics the browser didn't report are skipped."""
+        violations = []
+        for metric, limits in self.budgets.get(page_name, {}).items():
+            for stat, limit in limits.items():
+                actual = summary.get(metric, {}).get(stat)
+                if actual is not None and actual > limit:
+                    violations.append(f"{page_name} {metric} {stat} {actual:.3f} > {limit}")
+        return violations
+
+
+class PerformanceResults:
+    """Percentile summaries of one run, stored per run so later runs can be compared."""
+
+    def __init__(self):
+        self.pages: Dict[str, Dict] = {}
+        self.previous: Optional[Dict] = None
+
+    def add(self, page_name: str, summary: Dict, violations: List[str]) -> None:
+        self.pages[page_name] = {"summary": summary, "violations": violations}
+
+    def merge(self, pages: Dict[str, Dict]) -> None:
+        """Fold in the pages measured by another process."""
+        self.pages.update(pages)
+
+    def save(self, directory: str) -> str:
+        """Write the run's results to <directory>/<timestamp>.json, remembering the latest earlier run."""
+        self.previous = self.latest(directory)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"created": datetime.now().isoformat(), "pages": self.pages}, f, indent=2)
+        return path
+
+    @staticmethod
+    def latest(directory: str) -> Optional[Dict]:
+        """Load the most recent stored run, if any."""
+        if not os.path.isdir(directory):
+            return None
+        runs = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+        if not runs:
+            return None
+        with open(os.path.join(directory, runs[-1]), encoding="utf-8") as f:
+            return json.load(f)
+
+    def compare(self, stat: str = "p95") -> List[Tuple[str, str, float, float]]:
+        """Pair this run's percentile with the previous run's for every metric measured in both."""
+        if not self.previous:
+            return []
+        changes = []
+        for page_name, result in sorted(self.pages.items()):
+            before = self.previous.get("pages", {}).get(page_name, {}).get("summary", {})
+            for metric, values in result["summary"].items():
+                if stat in values and stat in before.get(metric, {}):
+                    changes.append((f"{page_name} {metric}", stat, before[metric][stat], values[stat]))
+        return changes
+
+
+PERF_RESULTS_KEY = pytest.StashKey[PerformanceResults]()
+
+
+class PerformanceRecorder:
+    """Measures repeated page loads for one test and checks them against the budgets."""
+
+    def __init__(self, budgets: PerformanceBudgets, results: PerformanceResults, runs: int):
+        self.budgets = budgets
+        self.results = results
+        self.runs = runs
+
+    def measure(self, page_name: str, page_object: BasePage, load: Callable[[], Any]) -> Tuple[Dict, List[str]]:
+        """
+        Load a page several times and summarize its browser-side metrics.
+
+        Args:
+            page_name: Key of the page in the budgets file and stored results
+            page_object: Page object whose page is loaded
+            load: Callable that performs one load, e.g. page_object.navigate_to_home
+
+        Returns:
+            tuple: The percentile summary and the list of exceeded budgets
+        """
+        samples = []
+        for _ in range(self.runs):
+            load()
+            samples.append(page_object.get_performance_metrics())
+        summary = summarize(samples)
+        violations = self.budgets.check(page_name, summary)
+        self.results.add(page_name, summary, violations)
+        return summary, violations
+
+
+def write_performance_results(terminalreporter, results: PerformanceResults) -> None:
+    """Write each page's load percentiles and the p95 change since the previous stored run."""
+    if not results.pages:
+        return
+    terminalreporter.write_sep("-", "page performance")
+    for page_name, result in sorted(results.pages.items()):
+        load = result["summary"].get("load_ms")
+        if load:
+            terminalreporter.write_line(
+                f"{page_name}: load p50 {load['p50']:.0f}ms p95 {load['p95']:.0f}ms p99 {load['p99']:.0f}ms"
+            )
+        for violation in result["violations"]:
+            terminalreporter.write_line(f"  over budget: {violation}")
+    for name, stat, before, after in results.compare():
+        if before:
+            terminalreporter.write_line(f"{name} {stat}: {before:.3f} -> {after:.3f} ({(after - before) / before:+.0%})")
+
+
+class PerformanceResultsXdistPlugin:
+    """Collects the pages each xdist worker measured when it shuts down."""
+
+    def __init__(self, results: PerformanceResults):
+        self.results = results
+
+    def pytest_testnodedown(self, node, error) -> None:
+        self.results.merge(getattr(node, "workeroutput", {}).get("perf_results", {}))
@@ -0,0 +1,123 @@
+import json
+import os
+from typing import Dict, Optional, Set
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+# Resource types each profile lets through; None allows everything
+RESOURCE_PROFILES: Dict[str, Optional[Set[str]]] = {
+    "minimal": {"document", "xhr", "fetch", "script"},
+    "functional": {"document", "xhr", "fetch", "script", "stylesheet"},
+    "full": None,
+}
+
+
+class ResourceSizes:
+    """
+    Response sizes by URL, kept on disk so blocked requests can be costed in later runs.
+
+    Sizes are learned from the Content-Length of responses that were let through, e.g.
+    by a run with the "full" profile, and can be seeded from recorded HAR archives.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.sizes: Dict[str, int] = {}
+        self._learned: Dict[str, int] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.sizes = json.load(f)
+
+    def get(self, url: str) -> Optional[int]:
+        return self.sizes.get(url)
+
+    def learn(self, url: str, size: int) -> None:
+        if self.sizes.get(url) != size:
+            self.sizes[url] = self._learned[url] = size
+
+    def load_har(self, har_path: str) -> None:
+        """Add the body sizes of every response recorded in a HAR archive."""
+        with open(har_path, encoding="utf-8") as f:
+            entries = json.load(f)["log"].get("entries", [])
+        for entry in entries:
+            response = entry["response"]
+            size = response.get("content", {}).get("size") or response.get("bodySize")
+            if size and size > 0:
+                self.sizes.setdefault(entry["request"]["url"], size)
+
+    def save(self) -> None:
+        """Merge the sizes learned by this process into the file, atomically."""
+        if not self.path or not self._learned:
+            return
+        stored = ResourceSizes(self.path).sizes
+        stored.update(self._learned)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._learned.clear()
+
+
+class ResourceBlocker:
+    """
+    Aborts requests a resource profile does not allow and counts what was skipped.
+
+    Scripts are only allowed from hosts that served a document in the same context,
+    so third-party scripts are blocked along with images, fonts and media. Bytes saved
+    only cover blocked URLs whose size is known from `sizes`; the others are counted
+    in `unknown_size_requests`, so a blocked resource never silently counts as 0 bytes.
+    """
+
+    def __init__(self, profile: str, sizes: Optional[ResourceSizes] = None):
+        if profile not in RESOURCE_PROFILES:
+            raise ValueError(f"Unknown resource profile '{profile}', expected one of {list(RESOURCE_PROFILES)}")
+        self.profile = profile
+        self.allowed_types = RESOURCE_PROFILES[profile]
+        self.sizes = sizes if sizes is not None else ResourceSizes("")
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.unknown_size_requests = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self._first_party_hosts: Set[str] = set()
+
+    def attach(self, context: BrowserContext) -> None:
+        """Start filtering requests in the context and learning response sizes."""
+        context.on("response", self._record_size)
+        if self.allowed_types is not None:
+            context.route("**/*", self._handle)
+
+    def detach(self, context: BrowserContext) -> None:
+        """Stop filtering, leaving the context as it was before attach."""
+        context.remove_listener("response", self._record_size)
+        if self.allowed_types is not None:
+            context.unroute("**/*", self._handle)
+
+    def _allowed(self, request: Request) -> bool:
+        resource_type = request.resource_type
+        host = urlsplit(request.url).hostname
+        if resource_type == "document":
+            self._first_party_hosts.add(host)
+            return True
+        if resource_type == "script" and host not in self._first_party_hosts:
+            return False
+        return resource_type in self.allowed_types
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        if self._allowed(request):
+            route.fallback()
+            return
+        self.blocked_requests += 1
+        size = self.sizes.get(request.url)
+        if size is None:
+            self.unknown_size_requests += 1
+        else:
+            self.bytes_saved += size
+        self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+        route.abort("blockedbyclient")
+
+    def _record_size(self, response: Response) -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.sizes.learn(response.url, int(length))
@@ -0,0 +1,55 @@
+from typing import Dict
+import pytest
+
+
+class RunStats:
+    """Named groups of counters, summed across the controller and every xdist worker."""
+
+    def __init__(self):
+        self.sections: Dict[str, Dict[str, float]] = {}
+
+    def add(self, section: str, counters: Dict[str, float]) -> None:
+        """Add counters to a section, summing values recorded under the same name."""
+        totals = self.sections.setdefault(section, {})
+        for name, value in counters.items():
+            totals[name] = totals.get(name, 0) + value
+
+    def merge(self, sections: Dict[str, Dict[str, float]]) -> None:
+        """Fold in the sections reported by another process."""
+        for section, counters in sections.items():
+            self.add(section, counters)
+
+
+RUN_STATS_KEY = pytest.StashKey[RunStats]()
+
+
+def record_run_stats(config: pytest.Config, section: str, counters: Dict[str, float]) -> None:
+    """
+    Record counters for the terminal summary.
+
+    On an xdist worker the totals are also published through `workeroutput`, which
+    the controller reads once the worker finishes.
+    """
+    stats = config.stash[RUN_STATS_KEY]
+    stats.add(section, counters)
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["run_stats"] = stats.sections
+
+
+def write_run_stats(terminalreporter, stats: RunStats) -> None:
+    """Write every recorded section to the terminal summary."""
+    for section, counters in sorted(stats.sections.items()):
+        terminalreporter.write_sep("-", section)
+        for name, value in counters.items():
+            text = f"{value:.3f}" if isinstance(value, float) else str(value)
+            terminalreporter.write_line(f"{name}: {text}")
+
+
+class RunStatsXdistPlugin:
+    """Collects the counters each xdist worker publishes when it shuts down."""
+
+    def __init__(self, stats: RunStats):
+        self.stats = stats
+
+    def pytest_testnodedown(self, node, error) -> None:
+        self.stats.merge(getattr(node, "workeroutput", {}).get("run_stats", {}))
@@ -0,0 +1,255 @@
+"""
+Split the suite across machines with --shard=i/N and merge the shards' reports.
+
+Every machine collects the whole suite and keeps the tests the plan gives its shard.
+The plan is built from the recorded durations in .test_durations.json. Each test
+is its own unit, so each device of a parametrized test such as responsive_page
+is placed separately. Units go longest first to the least-loaded shard (LPT
+scheduling), with ties broken by nodeid. Machines with the same collection and the
+same durations file therefore agree on the plan without talking to each other.
+
+Each shard writes its measured durations and wall time to reports/shard_timings.json.
+The merge step combines the shards' Allure results, pytest-html reports and timings:
+
+Usage:
+    python -m tests.utils.sharding merge shards/*/reports [--output reports] [--durations .test_durations.json]
+"""
+import argparse
+import heapq
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+import pytest
+from tests.utils.duration_scheduler import DurationStore, strip_group
+
+SHARD_TIMINGS_FILE = "shard_timings.json"
+HTML_OUTCOMES = ("failed", "passed", "skipped", "xfailed", "xpassed", "error", "rerun")
+# Allure files every shard writes with the same name; the first shard's copy is kept
+ALLURE_SHARED_FILES = ("environment.properties", "categories.json", "executor.json")
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse "i/N" into (i, N), with shards numbered from 1."""
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"expected i/N with 1 <= i <= N, got '{value}'")
+    return int(match.group(1)), int(match.group(2))
+
+
+def assign_shards(costs: Dict[str, float], shards: int) -> Dict[str, int]:
+    """
+    Shard (1 to `shards`) of every unit, by LPT on the units' costs.
+
+    Deterministic: the result depends only on the costs, not on their order.
+    """
+    loads = [(0.0, shard) for shard in range(1, shards + 1)]
+    assignment = {}
+    for unit in sorted(costs, key=lambda unit: (-costs[unit], unit)):
+        load, shard = heapq.heappop(loads)
+        assignment[unit] = shard
+        heapq.heappush(loads, (load + costs[unit], shard))
+    return assignment
+
+
+class ShardPlugin:
+    """
+    Keeps the tests planned for one shard and records what the shard actually took.
+
+    Registered on the controller and on xdist workers alike: every process must
+    deselect the same tests, and only the controller writes the timings.
+    """
+
+    def __init__(self, index: int, total: int, store: DurationStore, timings_path: str):
+        self.index = index
+        self.total = total
+        self.store = store
+        self.timings_path = timings_path
+        # Filled in by collection; under xdist the controller gets it from a worker
+        self.plan = {"tests": 0, "collected": 0, "predicted_seconds": 0.0, "predicted_total_seconds": 0.0}
+        self.started: Optional[float] = None
+        self.measured: Dict[str, float] = {}
+
+    def pytest_sessionstart(self, session) -> None:
+        self.started = time.monotonic()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items) -> None:
+        costs = {strip_group(item.nodeid): self.store.estimate(item.nodeid) for item in items}
+        assignment = assign_shards(costs, self.total)
+        selected, deselected = [], []
+        for item in items:
+            (selected if assignment[strip_group(item.nodeid)] == self.index else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.plan = {
+            "tests": len(selected),
+            "collected": len(costs),
+            "predicted_seconds": sum(costs[strip_group(item.nodeid)] for item in selected),
+            "predicted_total_seconds": sum(costs.values()),
+        }
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["shard_plan"] = self.plan
+
+    def pytest_runtest_logreport(self, report) -> None:
+        nodeid = strip_group(report.nodeid)
+        self.measured[nodeid] = self.measured.get(nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session) -> None:
+        if hasattr(session.config, "workerinput") or session.config.option.collectonly or self.started is None:
+            return
+        os.makedirs(os.path.dirname(self.timings_path) or ".", exist_ok=True)
+        with open(self.timings_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "shard": self.index,
+                "total": self.total,
+                **self.plan,
+                "wall_seconds": time.monotonic() - self.started,
+                "durations": self.measured,
+            }, f, indent=2, sort_keys=True)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        plan = self.plan
+        terminalreporter.write_sep("-", f"shard {self.index}/{self.total}")
+        terminalreporter.write_line(
+            f"{plan['tests']} of {plan['collected']} tests, predicted {plan['predicted_seconds']:.1f}s "
+            f"of {plan['predicted_total_seconds']:.1f}s (even split "
+            f"{plan['predicted_total_seconds'] / self.total:.1f}s)"
+        )
+
+
+class ShardXdistPlugin:
+    """Takes the shard plan from the first xdist worker, since the controller doesn't collect."""
+
+    def __init__(self, plugin: ShardPlugin):
+        self.plugin = plugin
+
+    def pytest_testnodedown(self, node, error) -> None:
+        plan = getattr(node, "workeroutput", {}).get("shard_plan")
+        if plan and not self.plugin.plan["collected"]:
+            self.plugin.plan = plan
+
+
+def merge_allure(shard_dirs: List[str], output_dir: str) -> int:
+    """Copy every shard's allure-results into one directory; result files have unique names."""
+    os.makedirs(output_dir, exist_ok=True)
+    copied = 0
+    for shard_dir in shard_dirs:
+        results_dir = os.path.join(shard_dir, "allure-results")
+        if not os.path.isdir(results_dir):
+            continue
+        for name in os.listdir(results_dir):
+            target = os.path.join(output_dir, name)
+            if name in ALLURE_SHARED_FILES and os.path.exists(target):
+                continue
+            shutil.copyfile(os.path.join(results_dir, name), target)
+            copied += 1
+    return copied
+
+
+def _read_html_data(report: str) -> Tuple[str, Dict]:
+    with open(report, encoding="utf-8") as f:
+        text = f.read()
+    match = re.search(r'data-jsonblob="([^"]*)"', text)
+    if match is None:
+        raise ValueError(f"{report} is not a pytest-html report")
+    return text, json.loads(html.unescape(match.group(1)))
+
+
+def merge_html(reports: List[str], output: str, wall_seconds: float) -> int:
+    """
+    Merge pytest-html reports into one, keeping the first report's page.
+
+    The test data embedded in each report is combined, and the outcome counts and
+    run count shown above the table are recomputed from it. Asset directories
+    (CSS and extras) are copied next to the merged report.
+    """
+    text, data = _read_html_data(reports[0])
+    for report in reports[1:]:
+        for nodeid, results in _read_html_data(report)[1]["tests"].items():
+            data["tests"].setdefault(nodeid, []).extend(results)
+
+    counts = dict.fromkeys(HTML_OUTCOMES, 0)
+    for results in data["tests"].values():
+        for result in results:
+            outcome = result["result"].lower()
+            counts[outcome] = counts.get(outcome, 0) + 1
+    for outcome, count in counts.items():
+        text = re.sub(
+            rf'(data-test-result="{outcome}" )(?:disabled)?(/>\s*<span class="{outcome}">)\d+',
+            lambda match: f"{match.group(1)}{'' if count else 'disabled'}{match.group(2)}{count}",
+            text,
+        )
+    ran = sum(counts[outcome] for outcome in ("passed", "failed", "xpassed", "xfailed"))
+    text = re.sub(
+        r'<p class="run-count">.*?</p>',
+        f'<p class="run-count">{ran} tests took {wall_seconds:.0f}s on {len(reports)} shards.</p>',
+        text,
+    )
+    blob = html.escape(json.dumps(data), quote=True)
+    text = re.sub(r'data-jsonblob="[^"]*"', lambda _: f'data-jsonblob="{blob}"', text)
+
+    output_dir = os.path.dirname(output) or "."
+    os.makedirs(output_dir, exist_ok=True)
+    for report in reports:
+        assets = os.path.join(os.path.dirname(report), "assets")
+        if os.path.isdir(assets):
+            shutil.copytree(assets, os.path.join(output_dir, "assets"), dirs_exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(text)
+    return sum(counts.values())
+
+
+def merge_timings(timings: List[Dict], durations_path: str) -> None:
+    """Fold every shard's measured durations into the durations file the next plan is built from."""
+    store = DurationStore(durations_path)
+    for shard in timings:
+        store.update(shard["durations"])
+    store.save()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser("merge", help="Merge the reports directories of every shard")
+    merge.add_argument("shards", nargs="+", help="Each shard's reports directory")
+    merge.add_argument("--output", default="reports")
+    merge.add_argument("--html-name", default="report.html", help="pytest-html report file name in each shard")
+    merge.add_argument("--durations", default=os.getenv("DURATIONS_PATH", ".test_durations.json"))
+    args = parser.parse_args(argv)
+
+    timings = []
+    for shard_dir in args.shards:
+        path = os.path.join(shard_dir, SHARD_TIMINGS_FILE)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                timings.append(json.load(f))
+        else:
+            print(f"{shard_dir}: no {SHARD_TIMINGS_FILE}, its durations are not merged")
+    wall = max((shard["wall_seconds"] for shard in timings), default=0.0)
+
+    copied = merge_allure(args.shards, os.path.join(args.output, "allure-results"))
+    print(f"allure: {copied} files from {len(args.shards)} shards")
+    reports = [os.path.join(shard, args.html_name) for shard in args.shards
+               if os.path.exists(os.path.join(shard, args.html_name))]
+    if reports:
+        results = merge_html(reports, os.path.join(args.output, args.html_name), wall)
+        print(f"html: {results} results from {len(reports)} reports")
+    if timings:
+        merge_timings(timings, args.durations)
+        busy = sum(shard["wall_seconds"] for shard in timings)
+        for shard in sorted(timings, key=lambda shard: shard["shard"]):
+            print(f"shard {shard['shard']}/{shard['total']}: {shard['tests']:4d} tests, "
+                  f"predicted {shard['predicted_seconds']:7.1f}s, took {shard['wall_seconds']:7.1f}s")
+        print(f"wall time {wall:.1f}s, balance {busy / (len(timings) * wall) if wall else 1:.0%}; "
+              f"durations written to {args.durations}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
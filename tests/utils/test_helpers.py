@@ -1,11 +1,16 @@
 import os
 import json
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Tuple
 from datetime import datetime
+from pages.retry import RetryPolicy, is_transient, retryable
+from tests.utils.artifacts import get_artifact_writer
 
 def save_test_artifact(artifact_type: str, data: Any, test_name: str) -> str:
     """
-    Save test artifacts (screenshots, videos, logs) with proper naming and organization.
+    Save test artifacts (screenshots, videos, logs) without blocking on disk I/O.
+    
+    The artifact is queued for a background writer and stored under its content
+    hash, so identical artifacts are written once; see tests/utils/artifacts.py.
     
     Args:
         artifact_type: Type of artifact (screenshot, video, log)
@@ -13,33 +18,20 @@ def save_test_artifact(artifact_type: str, data: Any, test_name: str) -> str:
         test_name: Name of the test that generated the artifact
     
     Returns:
-        str: Path to the saved artifact
+        str: Path the artifact is written to
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    artifacts_dir = os.path.join("reports", "artifacts", artifact_type)
-    os.makedirs(artifacts_dir, exist_ok=True)
-    
-    filename = f"{test_name}_{timestamp}.{artifact_type}"
-    filepath = os.path.join(artifacts_dir, filename)
-    
-    if artifact_type == "json":
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
-    elif artifact_type in ["png", "jpg"]:
-        # Assuming data is a bytes object for images
-        with open(filepath, "wb") as f:
-            f.write(data)
-    else:
-        # For other types, assume string data
-        with open(filepath, "w") as f:
-            f.write(str(data))
-    
-    return filepath
+    return get_artifact_writer().submit(artifact_type, data, test_name)
+
+_test_data_cache: Dict[str, Tuple[int, Dict]] = {}
 
 def get_test_data(test_name: str) -> Dict:
     """
     Load test data from JSON files.
     
+    The parsed file is cached until its mtime changes, so the returned dict is shared
+    between callers and must not be modified. For large row-per-test datasets use
+    @pytest.mark.dataset instead (see tests/utils/datasets.py).
+    
     Args:
         test_name: Name of the test to load data for
     
@@ -50,41 +42,35 @@ def get_test_data(test_name: str) -> Dict:
     if not os.path.exists(data_file):
         return {}
     
-    with open(data_file, "r") as f:
-        return json.load(f)
+    mtime = os.stat(data_file).st_mtime_ns
+    cached = _test_data_cache.get(data_file)
+    if cached is None or cached[0] != mtime:
+        with open(data_file, "r") as f:
+            cached = (mtime, json.load(f))
+        _test_data_cache[data_file] = cached
+    return cached[1]
 
-def retry_on_failure(func, max_attempts: int = 3, delay: float = 1.0):
+def retry_on_failure(func, max_attempts: int = 3, delay: float = 1.0,
+                     retry_on: Callable[[BaseException], bool] = is_transient):
     """
-    Decorator to retry a function on failure.
+    Decorator to retry a function on transient failures.
+    
+    Errors that `retry_on` classifies as deterministic (assertions, by default anything
+    but timeouts, network errors and closed targets) are raised on the first attempt.
+    Retries back off exponentially from `delay` with jitter and are counted in the
+    active RetryStats; see pages/retry.py.
     
     Args:
         func: Function to retry
-        max_attempts: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        max_attempts: Maximum number of attempts
+        delay: Base delay before the first retry in seconds
+        retry_on: Returns True for errors worth retrying
     
     Returns:
         Any: Result of the function call
     """
-    from functools import wraps
-    import time
-    
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        attempts = 0
-        last_exception = None
-        
-        while attempts < max_attempts:
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                attempts += 1
-                last_exception = e
-                if attempts < max_attempts:
-                    time.sleep(delay)
-        
-        raise last_exception
-    
-    return wrapper
+    return retryable(RetryPolicy(max_attempts=max_attempts, base_delay=delay, max_delay=delay * 8,
+                                 classify=retry_on))(func)
 
 def generate_test_report(results: Dict) -> str:
     """
@@ -131,7 +117,7 @@ def setup_test_environment() -> Dict[str, Any]:
     load_dotenv()
     
     # Create necessary directories
-    dirs = ["reports", "reports/artifacts", "reports/videos", "reports/screenshots"]
+    dirs = ["reports", "reports/artifacts", "reports/traces", "reports/screenshots"]
     for dir_path in dirs:
         os.makedirs(dir_path, exist_ok=True)
     
@@ -145,5 +131,5 @@ def setup_test_environment() -> Dict[str, Any]:
         },
         "timeout": int(os.getenv("TIMEOUT", "30000")),
         "screenshot_on_failure": os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true",
-        "video_on_failure": os.getenv("VIDEO_ON_FAILURE", "true").lower() == "true"
+        "capture_mode": os.getenv("CAPTURE_MODE", "trace")
     } 
\ No newline at end of file
@@ -0,0 +1,469 @@
+"""
+Visual regression: compare screenshots with stored baselines.
+
+Baselines live in tests/visual_baselines/<browser>/<name>.png, each with a
+<name>.tiles.npz holding the PNG digest and one hash per tile of the decoded image.
+A comparison first checks the digest. If that differs, it hashes the new screenshot's
+tiles and only diffs pixels inside tiles whose hash changed. Decoded baselines are
+cached as memory-mapped .npy files, so PNG decoding is paid once per baseline and machine.
+
+Usage:
+    pytest --update-baselines                      # rewrite every baseline the run compares
+    python -m tests.utils.visual accept [name ...]  # promote actual screenshots of failed comparisons
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pytest
+from PIL import Image
+from pages.base_page import BasePage
+
+# An ignore region is an (x, y, width, height) box in screenshot pixels, or a selector
+Region = Tuple[float, float, float, float]
+
+DEFAULT_TILE = 64
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """Decode a screenshot into a read-only (height, width, 4) RGBA uint8 array."""
+    with Image.open(io.BytesIO(data)) as image:
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        # Packing RGB as RGBX (opaque padding) avoids a separate conversion pass
+        raw = image.tobytes("raw", "RGBA" if image.mode == "RGBA" else "RGBX")
+        return np.frombuffer(raw, dtype=np.uint8).reshape(image.height, image.width, 4)
+
+
+def ignore_mask(shape: Tuple[int, int], regions: Iterable[Region]) -> Optional[np.ndarray]:
+    """Boolean (height, width) mask that is True inside any ignore region."""
+    regions = list(regions)
+    if not regions:
+        return None
+    mask = np.zeros(shape, dtype=bool)
+    for x, y, width, height in regions:
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        mask[y0:max(int(np.ceil(y + height)), y0), x0:max(int(np.ceil(x + width)), x0)] = True
+    return mask
+
+
+_weights: Dict[int, np.ndarray] = {}
+
+
+def _tile_weights(tile: int) -> np.ndarray:
+    # Fixed random odd multipliers, so every run hashes the same pixels to the same value
+    if tile not in _weights:
+        rng = np.random.default_rng(0x5EED + tile)
+        _weights[tile] = rng.integers(1, 2 ** 32, size=(tile, tile), dtype=np.uint32) | np.uint32(1)
+    return _weights[tile]
+
+
+def tile_hashes(image: np.ndarray, tile: int = DEFAULT_TILE, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Hash every tile x tile block of an RGBA image in one vectorized pass.
+
+    Each pixel is read as one 32-bit RGBA word, multiplied by a per-position random odd
+    32-bit weight (wrapping) and the products of a tile are summed, so a changed pixel
+    changes the hash of its tile except with probability around 2**-32. Masked pixels
+    hash as zero.
+
+    Returns:
+        np.ndarray: (rows, columns) uint64 hashes, with edge tiles zero-padded
+    """
+    height, width = image.shape[:2]
+    rows, columns = -(-height // tile), -(-width // tile)
+    words = np.zeros((rows * tile, columns * tile), dtype=np.uint32)
+    words[:height, :width] = np.ascontiguousarray(image).view(np.uint32)[..., 0]
+    if mask is not None:
+        words[:height, :width][mask] = 0
+    blocks = words.reshape(rows, tile, columns, tile)
+    return (blocks * _tile_weights(tile)[None, :, None, :]).sum(axis=(1, 3), dtype=np.uint64)
+
+
+def diff_pixels(
+    baseline: np.ndarray,
+    actual: np.ndarray,
+    changed_tiles: np.ndarray,
+    tile: int,
+    threshold: int,
+    detect_antialiasing: bool,
+    mask: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find differing pixels inside the changed tiles.
+
+    A pixel differs when any colour channel moved by more than `threshold`. A differing
+    pixel is treated as anti-aliasing when it sits on an edge (its 3x3 neighbourhood has
+    contrast) and each image's value lies within the other image's neighbourhood range,
+    which is what a sub-pixel shift of an edge looks like.
+
+    Returns:
+        tuple: (y, x) coordinates of differing pixels and of anti-aliased pixels
+    """
+    height, width = actual.shape[:2]
+    tile_rows, tile_columns = np.nonzero(changed_tiles)
+    y0, y1 = tile_rows.min() * tile, min((tile_rows.max() + 1) * tile, height)
+    x0, x1 = tile_columns.min() * tile, min((tile_columns.max() + 1) * tile, width)
+    before = baseline[y0:y1, x0:x1, :3].astype(np.int16)
+    after = actual[y0:y1, x0:x1, :3].astype(np.int16)
+    differs = np.abs(before - after).max(axis=2) > threshold
+    if mask is not None:
+        differs &= ~mask[y0:y1, x0:x1]
+    ys, xs = np.nonzero(differs)
+    ys, xs = ys + y0, xs + x0
+    empty = np.zeros(0, dtype=np.intp)
+    if not detect_antialiasing or not len(ys):
+        return np.stack([ys, xs]), np.stack([empty, empty])
+
+    before_low, before_high = _neighbourhood_range(baseline, ys, xs, (y0, y1, x0, x1), differs.size)
+    after_low, after_high = _neighbourhood_range(actual, ys, xs, (y0, y1, x0, x1), differs.size)
+    before_pixel = baseline[ys, xs, :3].astype(np.int16)
+    after_pixel = actual[ys, xs, :3].astype(np.int16)
+
+    def within(pixel: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+        return np.all((pixel >= low - threshold) & (pixel <= high + threshold), axis=1)
+
+    on_edge = (before_high - before_low).max(axis=1) > threshold
+    antialiased = (
+        on_edge & within(after_pixel, before_low, before_high) & within(before_pixel, after_low, after_high)
+    )
+    return np.stack([ys[~antialiased], xs[~antialiased]]), np.stack([ys[antialiased], xs[antialiased]])
+
+
+def _neighbourhood_range(
+    image: np.ndarray, ys: np.ndarray, xs: np.ndarray, region: Tuple[int, int, int, int], region_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-channel minimum and maximum of the 3x3 neighbourhood of each pixel, with edges clamped."""
+    height, width = image.shape[:2]
+    if len(ys) * 8 < region_size:
+        # Few pixels: gather their neighbourhoods as packed RGBA words, one take() per offset grid
+        offsets = np.array([-1, 0, 1])
+        flat = (
+            np.clip(ys[None, :] + np.repeat(offsets, 3)[:, None], 0, height - 1) * width
+            + np.clip(xs[None, :] + np.tile(offsets, 3)[:, None], 0, width - 1)
+        )
+        words = np.ascontiguousarray(image).view(np.uint32).reshape(-1).take(flat)
+        near = words.view(np.uint8).reshape(*flat.shape, 4)[..., :3]
+        return near.min(axis=0).astype(np.int16), near.max(axis=0).astype(np.int16)
+
+    # Many pixels: slide a 3x3 window over the whole region, then pick the pixels
+    y0, y1, x0, x1 = region
+    top, left = max(y0 - 1, 0), max(x0 - 1, 0)
+    padded = np.pad(
+        image[top:min(y1 + 1, height), left:min(x1 + 1, width), :3],
+        ((int(y0 == 0), int(y1 == height)), (int(x0 == 0), int(x1 == width)), (0, 0)),
+        mode="edge",
+    )
+    windows = [padded[dy:dy + y1 - y0, dx:dx + x1 - x0] for dy in range(3) for dx in range(3)]
+    low, high = np.minimum.reduce(windows), np.maximum.reduce(windows)
+    return low[ys - y0, xs - x0].astype(np.int16), high[ys - y0, xs - x0].astype(np.int16)
+
+
+def render_diff(baseline: np.ndarray, differing: np.ndarray, antialiased: np.ndarray) -> np.ndarray:
+    """Faded greyscale baseline with differing pixels in red and anti-aliased ones in yellow."""
+    grey = (baseline[..., :3].mean(axis=2) * 0.3 + 178).astype(np.uint8)
+    image = np.repeat(grey[..., None], 3, axis=2)
+    image[antialiased[0], antialiased[1]] = (255, 200, 0)
+    image[differing[0], differing[1]] = (255, 0, 0)
+    return image
+
+
+@dataclass
+class VisualResult:
+    """Outcome of comparing one screenshot with its baseline."""
+
+    name: str
+    matched: bool
+    status: str  # identical, matched, different, size-mismatch, missing or updated
+    diff_pixels: int = 0
+    diff_ratio: float = 0.0
+    antialiased_pixels: int = 0
+    changed_tiles: int = 0
+    total_tiles: int = 0
+    milliseconds: float = 0.0
+    diff_path: Optional[str] = None
+    actual_path: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        if self.status == "missing":
+            return (f"{self.name}: no baseline; run with --update-baselines (UPDATE_BASELINES=true) or accept "
+                    f"{self.actual_path} with python -m tests.utils.visual accept")
+        if self.status == "size-mismatch":
+            return f"{self.name}: screenshot size differs from the baseline (actual: {self.actual_path})"
+        return (
+            f"{self.name}: {self.diff_pixels} pixels ({self.diff_ratio:.3%}) differ in {self.changed_tiles}/"
+            f"{self.total_tiles} tiles (diff: {self.diff_path})"
+        )
+
+
+class VisualComparator:
+    """
+    Compares screenshots with baselines and writes diff images for mismatches.
+
+    Args:
+        baseline_dir: Directory holding <name>.png baselines and their tile hashes
+        output_dir: Where actual and diff images of failed comparisons are written
+        threshold: Largest per-channel change (0-255) that still counts as the same pixel
+        max_diff_ratio: Share of compared pixels allowed to differ
+        tile: Tile edge length used for hashing
+        detect_antialiasing: Don't count edge pixels that differ only by anti-aliasing
+        update: Write every compared screenshot as the new baseline
+        cache_dir: Where decoded baselines are cached, None to decode on every comparison
+    """
+
+    def __init__(
+        self,
+        baseline_dir: str,
+        output_dir: str,
+        threshold: int = 16,
+        max_diff_ratio: float = 0.001,
+        tile: int = DEFAULT_TILE,
+        detect_antialiasing: bool = True,
+        update: bool = False,
+        cache_dir: Optional[str] = None,
+    ):
+        self.baseline_dir = baseline_dir
+        self.output_dir = output_dir
+        self.threshold = threshold
+        self.max_diff_ratio = max_diff_ratio
+        self.tile = tile
+        self.detect_antialiasing = detect_antialiasing
+        self.update = update
+        self.cache_dir = cache_dir
+
+    def baseline_path(self, name: str) -> str:
+        return os.path.join(self.baseline_dir, f"{name}.png")
+
+    def _tiles_path(self, name: str) -> str:
+        return os.path.join(self.baseline_dir, f"{name}.tiles.npz")
+
+    def save_baseline(self, name: str, png: bytes, ignore: Sequence[Region] = ()) -> None:
+        """Store a screenshot as the baseline for `name`, with its digest and tile hashes."""
+        image = decode_png(png)
+        mask = ignore_mask(image.shape[:2], ignore)
+        digest = hashlib.blake2b(png, digest_size=16).hexdigest()
+        os.makedirs(os.path.dirname(self.baseline_path(name)), exist_ok=True)
+        with open(self.baseline_path(name), "wb") as f:
+            f.write(png)
+        self._cache_decoded(digest, image)
+        np.savez(
+            self._tiles_path(name),
+            digest=np.array(digest),
+            hashes=tile_hashes(image, self.tile, mask),
+            tile=np.array(self.tile),
+            shape=np.array(image.shape[:2]),
+        )
+
+    def compare(self, name: str, png: bytes, ignore: Sequence[Region] = ()) -> VisualResult:
+        """
+        Compare a PNG screenshot with the baseline for `name`.
+
+        A missing baseline is a mismatch unless baselines are being updated; the
+        screenshot is written to the output directory so it can be accepted.
+        """
+        started = time.perf_counter()
+        if self.update:
+            self.save_baseline(name, png, ignore)
+            return VisualResult(name, True, "updated", milliseconds=(time.perf_counter() - started) * 1000)
+        if not os.path.exists(self._tiles_path(name)):
+            result = VisualResult(name, False, "missing")
+            result.actual_path = self._write_output(name, decode_png(png), None, ignore)
+            result.milliseconds = (time.perf_counter() - started) * 1000
+            return result
+
+        with np.load(self._tiles_path(name)) as stored:
+            digest, baseline_hashes = str(stored["digest"]), stored["hashes"]
+            tile, shape = int(stored["tile"]), tuple(stored["shape"])
+        if hashlib.blake2b(png, digest_size=16).hexdigest() == digest:
+            return VisualResult(name, True, "identical", total_tiles=baseline_hashes.size,
+                                milliseconds=(time.perf_counter() - started) * 1000)
+
+        actual = decode_png(png)
+        if actual.shape[:2] != shape:
+            result = VisualResult(name, False, "size-mismatch", total_tiles=baseline_hashes.size)
+            result.actual_path = self._write_output(name, actual, None, ignore)
+            result.milliseconds = (time.perf_counter() - started) * 1000
+            return result
+
+        mask = ignore_mask(shape, ignore)
+        changed = tile_hashes(actual, tile, mask) != baseline_hashes
+        result = VisualResult(name, True, "matched", changed_tiles=int(changed.sum()),
+                              total_tiles=baseline_hashes.size)
+        if result.changed_tiles:
+            baseline = self._load_baseline(name, digest)
+            differing, antialiased = diff_pixels(
+                baseline, actual, changed, tile, self.threshold, self.detect_antialiasing, mask
+            )
+            compared = actual.shape[0] * actual.shape[1] - (int(mask.sum()) if mask is not None else 0)
+            result.diff_pixels = differing.shape[1]
+            result.antialiased_pixels = antialiased.shape[1]
+            result.diff_ratio = result.diff_pixels / max(compared, 1)
+            if result.diff_ratio > self.max_diff_ratio:
+                result.matched, result.status = False, "different"
+                result.actual_path = self._write_output(name, actual, render_diff(baseline, differing, antialiased),
+                                                        ignore)
+                result.diff_path = os.path.join(self.output_dir, name, "diff.png")
+        result.milliseconds = (time.perf_counter() - started) * 1000
+        return result
+
+    def _load_baseline(self, name: str, digest: str) -> np.ndarray:
+        """Decoded baseline, memory-mapped from the cache so only the changed tiles are read."""
+        if self.cache_dir:
+            cached = os.path.join(self.cache_dir, f"{digest}.npy")
+            if os.path.exists(cached):
+                return np.asarray(np.load(cached, mmap_mode="r"))
+        with open(self.baseline_path(name), "rb") as f:
+            image = decode_png(f.read())
+        self._cache_decoded(digest, image)
+        return image
+
+    def _cache_decoded(self, digest: str, image: np.ndarray) -> None:
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, f"{digest}.npy")
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, image)
+        os.replace(tmp_path, path)
+
+    def _write_output(self, name: str, actual: np.ndarray, diff: Optional[np.ndarray],
+                      ignore: Sequence[Region]) -> str:
+        """Write the actual image, the diff and what `accept` needs to promote the actual image."""
+        directory = os.path.join(self.output_dir, name)
+        os.makedirs(directory, exist_ok=True)
+        actual_path = os.path.join(directory, "actual.png")
+        Image.fromarray(actual).save(actual_path, compress_level=1)
+        if diff is not None:
+            Image.fromarray(diff).save(os.path.join(directory, "diff.png"), compress_level=1)
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"name": name, "ignore": [list(region) for region in ignore],
+                       "baseline_dir": self.baseline_dir}, f, indent=2)
+        return actual_path
+
+
+VISUAL_RESULTS_KEY = pytest.StashKey[List[Dict]]()
+
+
+class VisualChecker:
+    """Takes screenshots of page objects and compares them for one test."""
+
+    def __init__(self, comparator: VisualComparator, prefix: str = "", require_baselines: bool = False):
+        self.comparator = comparator
+        self.prefix = prefix
+        self.require_baselines = require_baselines
+        self.results: List[VisualResult] = []
+
+    def compare(
+        self,
+        page_object: BasePage,
+        name: str,
+        ignore: Sequence[Union[Region, str]] = (),
+        full_page: bool = False,
+    ) -> VisualResult:
+        """
+        Screenshot a page object and compare it with the baseline for `name`.
+
+        Without a baseline the test is skipped, or returns the failed result when
+        baselines are required.
+
+        Args:
+            page_object: Page object to screenshot
+            name: Baseline name, unique per page state and viewport
+            ignore: Regions to leave out, as (x, y, width, height) boxes or CSS selectors
+            full_page: Screenshot the whole scrollable page instead of the viewport
+        """
+        regions = self._resolve_regions(page_object, ignore, full_page)
+        result = self.comparator.compare(f"{self.prefix}{name}", page_object.screenshot(full_page=full_page), regions)
+        self.results.append(result)
+        if result.status == "missing" and not self.require_baselines:
+            pytest.skip(result.message)
+        return result
+
+    @staticmethod
+    def _resolve_regions(page_object: BasePage, ignore: Sequence[Union[Region, str]], full_page: bool) -> List[Region]:
+        selectors = {str(index): item for index, item in enumerate(ignore) if isinstance(item, str)}
+        regions = [tuple(item) for item in ignore if not isinstance(item, str)]
+        if not selectors:
+            return regions
+        scroll_x, scroll_y = page_object.page.evaluate("[scrollX, scrollY]") if full_page else (0, 0)
+        for state in page_object.query_elements(selectors, properties=("bounding_box",)).values():
+            box = state.bounding_box
+            if box:
+                regions.append((box["x"] + scroll_x, box["y"] + scroll_y, box["width"], box["height"]))
+        return regions
+
+
+def accept(output_dir: str, names: Sequence[str]) -> List[str]:
+    """Promote the actual images of failed comparisons to baselines; all of them if no names are given."""
+    accepted = []
+    for root, _, files in os.walk(output_dir):
+        if "meta.json" not in files or "actual.png" not in files:
+            continue
+        with open(os.path.join(root, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if names and meta["name"] not in names:
+            continue
+        with open(os.path.join(root, "actual.png"), "rb") as f:
+            png = f.read()
+        VisualComparator(meta["baseline_dir"], output_dir).save_baseline(
+            meta["name"], png, [tuple(region) for region in meta["ignore"]]
+        )
+        shutil.rmtree(root)
+        accepted.append(meta["name"])
+    return accepted
+
+
+def write_visual_results(terminalreporter, results: List[Dict]) -> None:
+    """Summarize comparison outcomes and timings, listing every mismatch."""
+    if not results:
+        return
+    terminalreporter.write_sep("-", "visual regression")
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    timings = sorted(result["milliseconds"] for result in results)
+    terminalreporter.write_line(
+        ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+        + f"; compare median {timings[len(timings) // 2]:.1f}ms, max {timings[-1]:.1f}ms"
+    )
+    for result in results:
+        if not result["matched"]:
+            terminalreporter.write_line(f"  {VisualResult(**result).message}")
+
+
+class VisualResultsXdistPlugin:
+    """Collects the comparisons each xdist worker made when it shuts down."""
+
+    def __init__(self, results: List[Dict]):
+        self.results = results
+
+    def pytest_testnodedown(self, node, error) -> None:
+        self.results.extend(getattr(node, "workeroutput", {}).get("visual_results", []))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output-dir", default=os.getenv("VISUAL_OUTPUT_DIR", os.path.join("reports", "visual")))
+    commands = parser.add_subparsers(dest="command", required=True)
+    accept_command = commands.add_parser("accept", help="Make the actual screenshots of failed comparisons the baselines")
+    accept_command.add_argument("names", nargs="*", help="Baseline names to accept (default: all)")
+    args = parser.parse_args(argv)
+
+    accepted = accept(args.output_dir, args.names)
+    for name in accepted:
+        print(f"Accepted {name}")
+    if not accepted:
+        print(f"No failed comparisons to accept in {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import argparse
+import ast
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Tuple
+from playwright.sync_api import Page
+
+# Lines ending in this comment are left out of the static audit
+IGNORE_PRAGMA = "wait-audit: ignore"
+
+
+@dataclass
+class WaitFinding:
+    """A fixed sleep or networkidle wait found in the source."""
+
+    path: str
+    line: int
+    kind: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.kind}"
+
+
+def _is_networkidle(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and node.value == "networkidle"
+
+
+def _classify(call: ast.Call) -> str:
+    func = call.func
+    name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+    if name == "wait_for_timeout":
+        return "wait_for_timeout"
+    if name == "sleep" and isinstance(func, ast.Attribute) and getattr(func.value, "id", "") in ("time", "asyncio"):
+        return f"{func.value.id}.sleep"
+    if name == "wait_for_load_state" and call.args and _is_networkidle(call.args[0]):
+        return "wait_for_load_state('networkidle')"
+    for keyword in call.keywords:
+        if keyword.arg in ("state", "wait_until") and _is_networkidle(keyword.value):
+            return f"{keyword.arg}='networkidle'"
+    return ""
+
+
+def audit_source(source: str, path: str = "<string>") -> List[WaitFinding]:
+    """Find fixed sleeps and networkidle waits in Python source."""
+    lines = source.splitlines()
+    findings = []
+    for node in ast.walk(ast.parse(source, filename=path)):
+        if not isinstance(node, ast.Call):
+            continue
+        kind = _classify(node)
+        if kind and not lines[node.lineno - 1].rstrip().endswith(IGNORE_PRAGMA):
+            findings.append(WaitFinding(path, node.lineno, kind))
+    return sorted(findings, key=lambda finding: finding.line)
+
+
+def audit_paths(paths: Iterable[str]) -> List[WaitFinding]:
+    """Audit every Python file under the given files and directories."""
+    findings = []
+    for root in map(Path, paths):
+        for path in sorted(root.rglob("*.py")) if root.is_dir() else [root]:
+            findings.extend(audit_source(path.read_text(encoding="utf-8"), str(path)))
+    return findings
+
+
+class WaitAuditor:
+    """
+    Times the fixed waits a page performs while a test runs.
+
+    Wraps `wait_for_timeout` and `wait_for_load_state("networkidle")` on one Page
+    instance, so the cost is attributed to the test that owns the page.
+    """
+
+    def __init__(self):
+        self.calls: List[Tuple[str, float]] = []
+
+    @property
+    def seconds(self) -> float:
+        return sum(duration for _, duration in self.calls)
+
+    def attach(self, page: Page) -> None:
+        """Start timing fixed waits on the page."""
+        wait_for_timeout = page.wait_for_timeout
+        wait_for_load_state = page.wait_for_load_state
+
+        def timed_wait_for_timeout(timeout: float) -> None:
+            start = time.perf_counter()
+            try:
+                return wait_for_timeout(timeout)  # wait-audit: ignore
+            finally:
+                self.calls.append(("wait_for_timeout", time.perf_counter() - start))
+
+        def timed_wait_for_load_state(state=None, **kwargs) -> None:
+            if state != "networkidle":
+                return wait_for_load_state(state, **kwargs)
+            start = time.perf_counter()
+            try:
+                return wait_for_load_state(state, **kwargs)
+            finally:
+                self.calls.append(("wait_for_load_state('networkidle')", time.perf_counter() - start))
+
+        page.wait_for_timeout = timed_wait_for_timeout
+        page.wait_for_load_state = timed_wait_for_load_state
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report fixed sleeps and networkidle waits")
+    parser.add_argument("paths", nargs="*", default=["pages", "tests"])
+    args = parser.parse_args(argv)
+
+    findings = audit_paths(args.paths)
+    for finding in findings:
+        print(finding)
+    print(f"{len(findings)} fixed wait(s) found")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())